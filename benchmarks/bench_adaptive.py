@@ -0,0 +1,44 @@
+"""
+AdaptiveScheduler draw + record cost vs. theme size.
+
+Compared with random.choices over the full weight list, which is what a
+sampler without incremental updates has to do after every answer.
+Run with: python benchmarks/bench_adaptive.py
+"""
+
+import random
+import time
+
+from emojiguessr.bench import synthetic_bank
+from emojiguessr.schedule import AdaptiveScheduler
+
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+ROUNDS = 2000
+
+
+def main():
+    print(f"{'theme size':>10} {'build ms':>9} {'fenwick us/answer':>18} {'choices us/answer':>18}")
+    for size in SIZES:
+        with synthetic_bank(size * 4):
+            started = time.perf_counter()
+            scheduler = AdaptiveScheduler("theme1", rng=random.Random(0))
+            build = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for i in range(ROUNDS):
+                scheduler.record(scheduler.draw(), i % 3 != 0)
+            fenwick = (time.perf_counter() - started) * 1e6 / ROUNDS
+
+            weights = list(scheduler._tree.weights)
+            rounds = max(10, ROUNDS * 1000 // size)
+            started = time.perf_counter()
+            for _ in range(rounds):
+                pos = random.choices(range(size), weights)[0]
+                weights[pos] *= 0.5
+            naive = (time.perf_counter() - started) * 1e6 / rounds
+            print(f"{size:>10} {build:9.1f} {fenwick:18.1f} {naive:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
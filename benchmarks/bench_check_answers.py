@@ -0,0 +1,63 @@
+"""
+Grading 1M (answer, guess) pairs: check_answers() vs. a check_answer() loop.
+
+Uses NumPy string arrays when NumPy is installed, plain lists otherwise.
+Case-insensitive modes stay well short of 10x: each distinct answer is
+normalized once, but normalizing 1M guesses costs more than the comparisons.
+Run with: python benchmarks/bench_check_answers.py
+"""
+
+import random
+import time
+
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.quiz import check_answer, check_answers
+
+
+PAIRS = 1_000_000
+
+
+def make_pairs(n, seed=0):
+    rng = random.Random(seed)
+    answers = [a for items in _EMOJI_BANK.values() for (_, a) in items]
+    corrects = [rng.choice(answers) for _ in range(n)]
+    guesses = [f" {rng.choice(answers)[: rng.randint(1, 8)].upper()} " for _ in range(n)]
+    return corrects, guesses
+
+
+def main():
+    corrects, guesses = make_pairs(PAIRS)
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    print(f"{PAIRS} pairs")
+    for case_sensitive in (False, True):
+        for allow_partial in (True, False):
+            t = time.perf_counter()
+            expected = [
+                check_answer(c, g, case_sensitive=case_sensitive, allow_partial=allow_partial)
+                for c, g in zip(corrects, guesses)
+            ]
+            loop = time.perf_counter() - t
+
+            t = time.perf_counter()
+            actual = check_answers(corrects, guesses, case_sensitive, allow_partial)
+            bulk = time.perf_counter() - t
+            assert list(actual) == expected
+
+            line = f"  case_sensitive={case_sensitive!s:5} allow_partial={allow_partial!s:5}  loop {loop:6.3f}s  lists {bulk:6.3f}s ({loop / bulk:4.1f}x)"
+            if np is not None:
+                c_arr, g_arr = np.array(corrects), np.array(guesses)
+                t = time.perf_counter()
+                actual = check_answers(c_arr, g_arr, case_sensitive, allow_partial)
+                vectorized = time.perf_counter() - t
+                assert actual.tolist() == expected
+                line += f"  numpy {vectorized:6.3f}s ({loop / vectorized:4.1f}x)"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
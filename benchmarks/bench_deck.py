@@ -0,0 +1,67 @@
+"""
+Drawing n distinct questions: Deck vs. rejecting repeats from get_theme_item.
+
+Rejection gets slower as n approaches the theme size (coupon collector);
+the deck stays O(1) per draw and only stores the slots it has swapped.
+Run with: python benchmarks/bench_deck.py
+"""
+
+import random
+import time
+import tracemalloc
+
+from emojiguessr import data
+from emojiguessr.bench import synthetic_bank
+from emojiguessr.schedule import Deck
+
+
+THEME_SIZE = 10**4
+FRACTIONS = [0.1, 0.5, 0.9, 1.0]
+
+
+def rejection(n):
+    seen = set()
+    while len(seen) < n:
+        seen.add(data.get_theme_item("theme1"))
+    return seen
+
+
+def with_deck(n):
+    deck = Deck("theme1")
+    return [deck.draw() for _ in range(n)]
+
+
+def timed(fn, n):
+    started = time.perf_counter()
+    fn(n)
+    return (time.perf_counter() - started) * 1e9 / n
+
+
+def main():
+    random.seed(0)
+    with synthetic_bank(THEME_SIZE * 4):
+        print(f"theme of {THEME_SIZE} items")
+        print(f"{'draws':>8} {'rejection ns/draw':>18} {'deck ns/draw':>13}")
+        for fraction in FRACTIONS:
+            n = int(THEME_SIZE * fraction)
+            print(f"{n:>8} {timed(rejection, n):18.0f} {timed(with_deck, n):13.0f}")
+
+    with synthetic_bank(4 * 10**6):
+        tracemalloc.start()
+        deck = Deck("theme1")
+        for _ in range(100):
+            deck.draw()
+        deck_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        order = list(range(*data._bank_index().theme_range("theme1")))
+        random.shuffle(order)
+        shuffle_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"100 draws from a 10^6 theme: deck {deck_bytes / 1024:.1f} KiB, "
+              f"shuffled copy {shuffle_bytes / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Event log throughput: appends/s with group commit vs. one write (or fsync)
+per record, the cost logging adds to scripted run_quiz sessions, and how
+fast the mmap reader scans and filters the result.
+Run with: python benchmarks/bench_eventlog.py
+"""
+
+import itertools
+import os
+import tempfile
+import time
+
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.eventlog import EventLog, EventLogReader
+
+
+RECORDS = 200_000
+SESSIONS = 5000
+
+
+def appends(path, n, **options):
+    with EventLog(path, **options) as log:
+        started = time.perf_counter()
+        for i in range(n):
+            log.append(i >> 4, "movies", i % 1000, "jurassic park", i % 3 == 0, 1 + i % 2, 1500)
+        log.flush()
+        return n / (time.perf_counter() - started)
+
+
+def sessions(log):
+    guesses = itertools.cycle(["nope", "burger", "pizza", "sushi"])
+    started = time.perf_counter()
+    for seed in range(SESSIONS):
+        run_quiz(5, "food", False, True, 2, input_fn=lambda _: next(guesses), output_fn=lambda _: None, rng=seed, log=log)
+    return SESSIONS / (time.perf_counter() - started)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = lambda name: os.path.join(tmp, name)
+        print(f"group commit (4096/batch): {appends(path('a.egl'), RECORDS):10.0f} records/s")
+        print(f"write per record:          {appends(path('b.egl'), RECORDS // 10, batch_size=1):10.0f} records/s")
+        print(f"group commit + fsync:      {appends(path('c.egl'), RECORDS, sync=True):10.0f} records/s")
+        print(f"fsync per record:          {appends(path('d.egl'), 500, batch_size=1, sync=True):10.0f} records/s")
+
+        plain = sessions(None)
+        with EventLog(path("s.egl")) as log:
+            logged = sessions(log)
+        print(f"run_quiz: {plain:.0f} sessions/s without a log, {logged:.0f} with ({logged / plain - 1:+.0%})")
+
+        with EventLogReader(path("a.egl")) as reader:
+            started = time.perf_counter()
+            total = reader.count()
+            scan = time.perf_counter() - started
+            started = time.perf_counter()
+            hits = sum(1 for _ in reader.filter(index=7))
+            filtered = time.perf_counter() - started
+            started = time.perf_counter()
+            decoded = sum(1 for _ in reader)
+            full = time.perf_counter() - started
+        print(f"reader: scan {total / scan:.0f} rec/s, filter {total / filtered:.0f} rec/s ({hits} hits), "
+              f"decode all {decoded / full:.0f} rec/s")
+
+
+if __name__ == "__main__":
+    main()
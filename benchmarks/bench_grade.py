@@ -0,0 +1,83 @@
+"""
+Throughput and memory of `emojiguessr grade` on a generated NDJSON file.
+
+Compares against replaying each submission through run_quiz with a fake
+input_fn, and reports the grader's peak resident memory at two input sizes
+to show it doesn't grow with the input. Linux-only (reads /proc).
+Run with: python benchmarks/bench_grade.py
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.data import _EMOJI_BANK
+
+
+ANSWERS = [answer for items in _EMOJI_BANK.values() for (_, answer) in items]
+SIZES = [10**5, 10**6]
+
+GRADE = """
+import sys, time
+from emojiguessr.grade import main
+t = time.perf_counter()
+main(["--input", sys.argv[1], "--output", sys.argv[2]])
+elapsed = time.perf_counter() - t
+with open("/proc/self/status") as f:
+    peak = next(int(l.split()[1]) for l in f if l.startswith("VmHWM:"))
+print(elapsed, peak, file=sys.stderr)
+"""
+
+
+def write_input(path, n):
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            answer = rng.choice(ANSWERS)
+            guess = answer[: rng.randint(1, len(answer))] if rng.random() < 0.7 else rng.choice(ANSWERS)
+            f.write(json.dumps({"id": i, "answer": answer, "guess": guess}) + "\n")
+
+
+def replay_with_run_quiz(path, limit):
+    started = time.perf_counter()
+    with open(path, encoding="utf-8") as f:
+        for _, line in zip(range(limit), f):
+            record = json.loads(line)
+            item = {"clue": "?", "answer": record["answer"], "theme": "food"}
+            session_items = iter([item])
+            import emojiguessr.__main__ as cli
+            original = cli.make_quiz_item
+            cli.make_quiz_item = lambda theme, **_: next(session_items)
+            try:
+                run_quiz(1, "food", False, True, 1, input_fn=lambda _: record["guess"], output_fn=lambda _: None)
+            finally:
+                cli.make_quiz_item = original
+    return (time.perf_counter() - started) / limit
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'records':>9} {'MB':>6} {'grade s':>8} {'records/s':>10} {'peak RSS MB':>12}")
+        for n in SIZES:
+            src = os.path.join(tmp, f"in{n}.ndjson")
+            write_input(src, n)
+            out = subprocess.run(
+                [sys.executable, "-c", GRADE, src, os.path.join(tmp, "out.ndjson")],
+                capture_output=True, text=True, check=True,
+            )
+            elapsed, peak = out.stderr.split()[-2:]
+            elapsed = float(elapsed)
+            size_mb = os.path.getsize(src) / 1e6
+            print(f"{n:>9} {size_mb:6.0f} {elapsed:8.2f} {n / elapsed:10.0f} {int(peak) / 1024:12.1f}")
+
+        per_record = replay_with_run_quiz(src, 20000)
+        print(f"run_quiz replay: {1 / per_record:.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
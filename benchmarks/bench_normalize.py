@@ -0,0 +1,64 @@
+"""
+Cost of guess normalization: the old _normalize() (strip().lower()), an
+uncached NFKC + casefold function, and the new normalize() on a stream of
+guesses where popular answers repeat.
+
+Run with: python benchmarks/bench_normalize.py
+"""
+
+import random
+import timeit
+import unicodedata
+
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.quiz import check_answer
+from emojiguessr.text import normalize, normalize_cache_info, clear_normalize_cache
+
+
+GUESSES = 500_000
+
+
+def main():
+    rng = random.Random(0)
+    answers = [a for items in _EMOJI_BANK.values() for (_, a) in items]
+    # skewed stream: a few popular guesses dominate, plus a long tail of noise
+    popular = rng.sample(answers, 10)
+    popular += ["Crème Brûlée", "ＰＩＺＺＡ", "straße"]
+    guesses = [
+        rng.choice(popular) if rng.random() < 0.8 else f"guess {rng.randrange(100000)}"
+        for _ in range(GUESSES)
+    ]
+
+    def old_normalize(text):
+        return text.strip().lower()
+
+    def uncached_normalize(text):
+        return unicodedata.normalize("NFKC", text).strip().casefold()
+
+    def old():
+        for g in guesses:
+            old_normalize(g)
+
+    def uncached():
+        for g in guesses:
+            uncached_normalize(g)
+
+    def cached():
+        for g in guesses:
+            normalize(g)
+
+    def grading():
+        correct = popular[0]
+        for g in guesses:
+            check_answer(correct, g)
+
+    clear_normalize_cache()
+    print(f"{GUESSES} guesses (ns/guess)")
+    for name, fn in [("old _normalize", old), ("NFKC + casefold", uncached), ("normalize", cached), ("check_answer", grading)]:
+        print(f"  {name:18} {timeit.timeit(fn, number=1) / GUESSES * 1e9:8.0f}")
+    info = normalize_cache_info()
+    print(f"  cache: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+
+if __name__ == "__main__":
+    main()
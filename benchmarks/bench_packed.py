@@ -0,0 +1,75 @@
+"""
+Startup time and resident memory of a memory-mapped bank vs. an in-memory dict.
+
+Each measurement runs in a fresh interpreter so the numbers are cold starts.
+Resident memory is read from /proc, so this script is Linux-only.
+Run with: python benchmarks/bench_packed.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from emojiguessr.packed import compile_bank
+
+
+SIZES = [10**3, 10**5, 10**6]
+
+RSS = """
+def rss_kb():
+    # current resident set size; ru_maxrss would include the parent's peak
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+"""
+
+MAPPED = RSS + """
+import time
+t = time.perf_counter()
+from emojiguessr.packed import MappedBank
+bank = MappedBank({path!r})
+for _ in range(1000):
+    bank.get_theme_item("theme1")
+elapsed = time.perf_counter() - t
+print(elapsed, rss_kb())
+"""
+
+IN_MEMORY = RSS + """
+import time, random
+t = time.perf_counter()
+bank = {{f"theme{{t}}": [(f"e{{t}}-{{i}}", f"answer {{t}} {{i}}") for i in range({per_theme})] for t in range(4)}}
+for _ in range(1000):
+    random.choice(bank["theme1"])
+elapsed = time.perf_counter() - t
+print(elapsed, rss_kb())
+"""
+
+
+def run(code):
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    elapsed, rss = out.stdout.split()
+    return float(elapsed) * 1000, int(rss) / 1024
+
+
+def main():
+    print(f"{'bank size':>10} {'mapped ms':>10} {'mapped MB':>10} {'dict ms':>10} {'dict MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            per_theme = size // 4
+            bank = {
+                f"theme{t}": [(f"e{t}-{i}", f"answer {t} {i}") for i in range(per_theme)]
+                for t in range(4)
+            }
+            path = os.path.join(tmp, f"bank{size}.egb")
+            compile_bank(path, bank)
+            del bank
+
+            mapped_ms, mapped_mb = run(MAPPED.format(path=path))
+            dict_ms, dict_mb = run(IN_MEMORY.format(per_theme=per_theme))
+            print(f"{size:>10} {mapped_ms:>10.1f} {mapped_mb:>10.1f} {dict_ms:>10.1f} {dict_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
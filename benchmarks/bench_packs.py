@@ -0,0 +1,50 @@
+"""
+Cold (parse) vs. warm (cached) loading of theme packs.
+
+Run with: python benchmarks/bench_packs.py
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from emojiguessr.packs import load_pack
+
+
+SIZES = [10**3, 10**5, 10**6]
+
+
+def write_packs(directory, size):
+    items = [(f"e{i}", f"Answer {i}") for i in range(size)]
+    csv_path = directory / f"pack{size}.csv"
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write("emoji,answer\n")
+        for emoji, answer in items:
+            f.write(f"{emoji},{answer}\n")
+    json_path = directory / f"pack{size}.json"
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump([list(item) for item in items], f)
+    return csv_path, json_path
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    print(f"{'pack':>16} {'cold ms':>10} {'warm ms':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for size in SIZES:
+            for path in write_packs(tmp, size):
+                cache_dir = tmp / "cache"
+                cold = timed(lambda: load_pack(path, cache_dir))
+                warm = min(timed(lambda: load_pack(path, cache_dir)) for _ in range(3))
+                print(f"{path.name:>16} {cold:10.1f} {warm:10.1f} {cold / warm:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
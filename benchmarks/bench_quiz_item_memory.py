@@ -0,0 +1,38 @@
+"""
+Memory held by 1M pre-generated quiz items as dicts, as QuizItem records,
+and as a bare QuizBatch column of bank positions.
+
+Run with: python benchmarks/bench_quiz_item_memory.py
+"""
+
+import tracemalloc
+
+from emojiguessr.quiz import make_quiz_item, make_quiz_items
+
+
+ITEMS = 1_000_000
+
+
+def measure(build):
+    tracemalloc.start()
+    kept = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main():
+    batch = make_quiz_items(ITEMS, "food", seed=1, unique=False)
+
+    as_dicts = measure(lambda: [make_quiz_item("food") for _ in range(ITEMS)])
+    as_items = measure(lambda: list(batch))
+    as_batch = measure(lambda: make_quiz_items(ITEMS, "food", seed=1, unique=False))
+
+    print(f"{ITEMS} items")
+    for name, size in [("dict", as_dicts), ("QuizItem", as_items), ("QuizBatch", as_batch)]:
+        print(f"  {name:10} {size / 1e6:8.1f} MB  {size / ITEMS:6.1f} bytes/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Generating a nightly cohort of quiz sheets: one make_quiz_items() call vs.
+one make_quiz_item() call per question.
+
+Run with: python benchmarks/bench_quiz_items.py
+"""
+
+import time
+
+from emojiguessr.quiz import make_quiz_item, make_quiz_items
+
+
+TOTAL = 1_000_000
+
+
+def main():
+    t = time.perf_counter()
+    items = [make_quiz_item("food") for _ in range(TOTAL)]
+    per_item = time.perf_counter() - t
+    del items
+
+    t = time.perf_counter()
+    batch = make_quiz_items(TOTAL, "food", seed=1, unique=False)
+    batched = time.perf_counter() - t
+
+    print(f"{TOTAL} items")
+    print(f"  make_quiz_item loop : {per_item:8.3f}s")
+    print(f"  make_quiz_items     : {batched:8.3f}s  ({per_item / batched:.1f}x faster, {len(batch.indices) * batch.indices.itemsize / 1e6:.1f} MB of indices)")
+
+
+if __name__ == "__main__":
+    main()
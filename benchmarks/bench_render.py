@@ -0,0 +1,56 @@
+"""
+run_quiz output: one output_fn call per line vs. one per frame (buffered).
+
+Sinks: a list (pure Python overhead), os.write to /dev/null (one syscall
+per call, like an unbuffered terminal or socket) and print to a
+line-buffered /dev/null stream.
+Run with: python benchmarks/bench_render.py
+"""
+
+import io
+import itertools
+import os
+import time
+
+from emojiguessr.__main__ import run_quiz
+
+
+SESSIONS = 5000
+
+
+def sinks():
+    collected = []
+    yield "list.append", collected.append
+
+    fd = os.open(os.devnull, os.O_WRONLY)
+    yield "os.write", lambda text: os.write(fd, text.encode("utf-8") + b"\n")
+
+    stream = io.TextIOWrapper(open(os.devnull, "wb", buffering=0), encoding="utf-8", line_buffering=True)
+    yield "print (line-buffered)", lambda text: print(text, file=stream)
+
+
+def run(output_fn, buffered):
+    guesses = itertools.cycle(["nope", "burger", "pizza", "sushi"])
+    started = time.perf_counter()
+    for seed in range(SESSIONS):
+        run_quiz(5, "food", False, True, 2, input_fn=lambda _: next(guesses), output_fn=output_fn, rng=seed, buffered=buffered)
+    return SESSIONS / (time.perf_counter() - started)
+
+
+def main():
+    calls = {True: 0, False: 0}
+    for buffered in calls:
+        def count(_, buffered=buffered):
+            calls[buffered] += 1
+        run_quiz(5, "food", False, True, 2, input_fn=lambda _: "nope", output_fn=count, rng=0, buffered=buffered)
+    print(f"output_fn calls per 5-question session: {calls[False]} per line, {calls[True]} buffered")
+
+    print(f"{'sink':>22} {'per line sess/s':>16} {'buffered sess/s':>16} {'speedup':>8}")
+    for name, sink in sinks():
+        lines = run(sink, False)
+        frames = run(sink, True)
+        print(f"{name:>22} {lines:16.0f} {frames:16.0f} {frames / lines:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
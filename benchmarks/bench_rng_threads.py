@@ -0,0 +1,61 @@
+"""
+Concurrent sessions on threads: shared module-level random vs. per-session rng.
+
+Each thread plays whole scripted run_quiz sessions. With the shared
+generator every draw touches one global state; with rng=seed each session
+owns its generator, and its questions no longer depend on what the other
+threads did. Reports sessions/s and whether repeated runs replay the same
+quizzes.
+Run with: python benchmarks/bench_rng_threads.py
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from emojiguessr.__main__ import run_quiz
+
+
+SESSIONS = 4000
+THREADS = [1, 2, 4, 8]
+
+
+def play(seed):
+    clues = []
+    run_quiz(
+        5,
+        "movies",
+        False,
+        True,
+        1,
+        input_fn=lambda _: "nope",
+        output_fn=lambda line: clues.append(line) if line.startswith("Emoji") else None,
+        rng=seed,
+    )
+    return tuple(clues)
+
+
+def run(threads, per_session_rng):
+    random.seed(0)
+    seeds = list(range(SESSIONS)) if per_session_rng else [None] * SESSIONS
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        quizzes = list(pool.map(play, seeds))
+    return time.perf_counter() - started, quizzes
+
+
+def main():
+    print(f"{'threads':>8} {'shared sess/s':>14} {'own rng sess/s':>15} {'shared repeatable':>18} {'own rng repeatable':>19}")
+    for threads in THREADS:
+        shared_s, shared_a = run(threads, False)
+        _, shared_b = run(threads, False)
+        own_s, own_a = run(threads, True)
+        _, own_b = run(threads, True)
+        print(
+            f"{threads:>8} {SESSIONS / shared_s:14.0f} {SESSIONS / own_s:15.0f} "
+            f"{str(shared_a == shared_b):>18} {str(own_a == own_b):>19}"
+        )
+
+
+if __name__ == "__main__":
+    main()
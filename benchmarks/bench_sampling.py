@@ -0,0 +1,65 @@
+"""
+Per-call cost of random_emojis() / get_theme_item() as the bank grows.
+
+Run with: python benchmarks/bench_sampling.py
+"""
+
+import random
+import timeit
+
+from emojiguessr import data
+
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+CALLS = 2000
+
+
+def synthetic_bank(size, themes=4):
+    per_theme = size // themes
+    return {
+        f"theme{t}": [(f"e{t}-{i}", f"answer {t} {i}") for i in range(per_theme)]
+        for t in range(themes)
+    }
+
+
+def legacy_random_emojis(bank, count=3, theme="food"):
+    items = bank.get(theme)
+    if not items:
+        all_emoji = [e for v in bank.values() for (e, _) in v]
+        random.shuffle(all_emoji)
+        return all_emoji[: min(count, len(all_emoji))]
+    emojis = [e for (e, _) in items]
+    random.shuffle(emojis)
+    return emojis[:count]
+
+
+def per_call_us(fn, calls):
+    return timeit.timeit(fn, number=calls) / calls * 1e6
+
+
+def main():
+    original = dict(data._EMOJI_BANK)
+    print(f"{'bank size':>10} {'theme':>10} {'any theme':>10} {'item':>10} {'legacy':>10}  (us/call)")
+    try:
+        for size in SIZES:
+            bank = synthetic_bank(size)
+            data._EMOJI_BANK.clear()
+            data._EMOJI_BANK.update(bank)
+            data._EMOJI_BANK["food"] = bank["theme0"]
+            data.invalidate_index()
+            data._bank_index()
+
+            theme = per_call_us(lambda: data.random_emojis(3, "theme1"), CALLS)
+            anything = per_call_us(lambda: data.random_emojis(3, "missing"), CALLS)
+            item = per_call_us(lambda: data.get_theme_item("theme2"), CALLS)
+            legacy_calls = max(1, CALLS // max(1, size // 1000))
+            legacy = per_call_us(lambda: legacy_random_emojis(bank, 3, "missing"), legacy_calls)
+            print(f"{size:>10} {theme:>10.2f} {anything:>10.2f} {item:>10.2f} {legacy:>10.2f}")
+    finally:
+        data._EMOJI_BANK.clear()
+        data._EMOJI_BANK.update(original)
+        data.invalidate_index()
+
+
+if __name__ == "__main__":
+    main()
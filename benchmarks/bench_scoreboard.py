@@ -0,0 +1,49 @@
+"""
+Scoreboard throughput: updates/sec, rank-query and top-K latency.
+
+Run with: python benchmarks/bench_scoreboard.py [players]   (default 10M;
+that needs a few GB of RAM, pass a smaller number on small machines)
+"""
+
+import random
+import sys
+import time
+
+from emojiguessr.score import Scoreboard
+
+
+def main():
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(0)
+    board = Scoreboard()
+
+    t = time.perf_counter()
+    for p in range(players):
+        board.record(p, points=rng.randrange(1, 50))
+    fill = time.perf_counter() - t
+    print(f"{players} players loaded in {fill:.1f}s ({players / fill:,.0f} updates/sec)")
+
+    updates = 200_000
+    targets = [rng.randrange(players) for _ in range(updates)]
+    t = time.perf_counter()
+    for p in targets:
+        board.record(p, correct=rng.random() < 0.7)
+    elapsed = time.perf_counter() - t
+    print(f"  steady-state updates: {updates / elapsed:,.0f}/sec")
+
+    queries = 100_000
+    t = time.perf_counter()
+    for p in targets[:queries]:
+        board.rank(p)
+    elapsed = time.perf_counter() - t
+    print(f"  rank query: {elapsed / queries * 1e6:.2f} us")
+
+    t = time.perf_counter()
+    for _ in range(1000):
+        board.top(100)
+    elapsed = time.perf_counter() - t
+    print(f"  top-100 query: {elapsed / 1000 * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
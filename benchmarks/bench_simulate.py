@@ -0,0 +1,46 @@
+"""
+How `emojiguessr simulate` scales with worker processes.
+
+Runs the same simulation with 1, 2, 4, ... workers up to the CPU count and
+reports throughput and parallel efficiency (speedup / workers). The shard
+count is fixed so every run does identical work.
+Run with: python benchmarks/bench_simulate.py [sessions]
+"""
+
+import os
+import sys
+
+from emojiguessr.simulate import simulate
+
+
+def worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main():
+    sessions = int(float(sys.argv[1])) if len(sys.argv) > 1 else 200_000
+    counts = worker_counts()
+    shards = max(counts) * 4
+    print(f"{sessions} sessions, {shards} shards, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'sessions/s':>11} {'speedup':>8} {'efficiency':>11}")
+    base = None
+    for workers in counts:
+        # workers=1 runs in-process, so speedups are against plain serial code
+        report = simulate(sessions, workers=workers, shards=shards)
+        seconds = report["seconds"]
+        base = base or seconds
+        speedup = base / seconds
+        print(
+            f"{workers:>8} {seconds:9.2f} {sessions / seconds:11.0f} "
+            f"{speedup:7.2f}x {speedup / workers:10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
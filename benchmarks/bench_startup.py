@@ -0,0 +1,68 @@
+"""
+Cold-start import cost of the CLI, measured with `python -X importtime`.
+
+Exits with status 1 if the median import time of emojiguessr.__main__ goes
+over the budget, or if the --list-themes fast path pulls in modules it
+shouldn't need.
+
+Run with: python benchmarks/bench_startup.py [budget_ms]   (default 25)
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 15
+DEFAULT_BUDGET_MS = 25.0
+# modules the `--list-themes` health check must never import
+FORBIDDEN = {"argparse", "asyncio", "json", "emojiguessr.quiz", "emojiguessr.session", "emojiguessr.score"}
+
+FAST_PATH = "import sys; sys.argv = ['emojiguessr', '--list-themes']; from emojiguessr.__main__ import main; main()"
+
+
+def import_times(code):
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    samples = []
+    for _ in range(RUNS):
+        times = import_times(FAST_PATH)
+        samples.append(times["emojiguessr.__main__"] / 1000)
+    median = statistics.median(samples)
+
+    imported = set(import_times(FAST_PATH))
+    leaked = sorted(FORBIDDEN & imported)
+
+    print(f"emojiguessr.__main__ import: median {median:.1f} ms, min {min(samples):.1f} ms over {RUNS} runs (budget {budget:.1f} ms)")
+    failed = False
+    if median > budget:
+        print("FAIL: cold start is over budget")
+        failed = True
+    if leaked:
+        print(f"FAIL: --list-themes imported {', '.join(leaked)}")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
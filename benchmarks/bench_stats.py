@@ -0,0 +1,76 @@
+"""
+Stats report throughput: time to load a column cache and build the
+per-item/per-theme report, with NumPy and with the array fallback, plus
+how fast the first parse of a raw answer log fills the cache.
+Run with: python benchmarks/bench_stats.py [rows]   (default 20M; NumPy needed to build the cache)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from emojiguessr import stats
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.eventlog import EventLog, _HEADER, MAGIC, VERSION, theme_id
+
+
+ROWS = 20_000_000
+FALLBACK_ROWS = 1_000_000
+PARSED = 500_000
+
+
+def synth_cache(tmp, rows):
+    # an empty log plus a cache that already covers it, so load_columns only reads rows
+    log_path = os.path.join(tmp, f"{rows}.egl")
+    with open(log_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, _HEADER.size))
+    rng = np.random.default_rng(0)
+    data = np.empty(rows, dtype=np.dtype(stats._ROW_DTYPE))
+    names = list(_EMOJI_BANK)
+    picks = rng.integers(0, len(names), rows)
+    data["theme"] = np.array([theme_id(name) for name in names], dtype=np.uint32)[picks]
+    data["index"] = rng.integers(0, 1 << 30, rows) % np.array([len(_EMOJI_BANK[name]) for name in names])[picks]
+    data["attempt"] = rng.integers(1, 4, rows)
+    data["flags"] = rng.integers(0, 4, rows)
+    data["latency"] = rng.integers(100_000, 9_000_000, rows)
+    with open(f"{log_path}.cols", "wb") as f:
+        f.write(stats._CACHE_HEADER.pack(stats.CACHE_MAGIC, stats.CACHE_VERSION, 0, _HEADER.size, rows))
+        data.tofile(f)
+    return log_path
+
+
+def timed_report(log_path, use_numpy):
+    started = time.perf_counter()
+    columns = stats.load_columns(log_path, use_numpy=use_numpy)
+    loaded = time.perf_counter() - started
+    stats.report(columns)
+    total = time.perf_counter() - started
+    return len(columns), loaded, total
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        for use_numpy, n in ((True, rows), (False, FALLBACK_ROWS)):
+            count, loaded, total = timed_report(synth_cache(tmp, n), use_numpy)
+            label = "numpy" if use_numpy else "array"
+            print(f"{label}: {count:>11,} rows  load {loaded:6.2f}s  report {total:6.2f}s  ({count / total / 1e6:.1f}M rows/s)")
+
+        log_path = os.path.join(tmp, "raw.egl")
+        with EventLog(log_path) as log:
+            for i in range(PARSED):
+                log.append(i >> 4, "movies", i % 10, "jurassic park", i % 3 == 0, 1 + i % 2, 1500)
+        started = time.perf_counter()
+        stats.update_cache(log_path)
+        first = time.perf_counter() - started
+        started = time.perf_counter()
+        stats.update_cache(log_path)
+        again = time.perf_counter() - started
+        print(f"cache: first parse {PARSED / first / 1e6:.1f}M records/s, up-to-date check {again * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
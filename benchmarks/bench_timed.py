@@ -0,0 +1,52 @@
+"""
+Many timed sessions on one event loop.
+
+Every player stays silent, so every question ends on its deadline. Reports
+how long the loop takes to run them all, the thread count (one, however
+many players) and how late deadlines fire.
+Run with: python benchmarks/bench_timed.py
+"""
+
+import asyncio
+import threading
+import time
+
+from emojiguessr.timed import run_quiz_async
+
+
+PLAYERS = [100, 1000, 10000]
+TIME_LIMIT = 0.5
+QUESTIONS = 2
+
+
+async def run(players):
+    lateness = []
+    threads = set()
+
+    async def silent(prompt):
+        await asyncio.sleep(3600)
+
+    def output(line):
+        threads.add(threading.get_ident())
+
+    async def one():
+        started = time.perf_counter()
+        await run_quiz_async(QUESTIONS, "food", False, True, 1, input_fn=silent, output_fn=output, time_limit=TIME_LIMIT)
+        lateness.append(time.perf_counter() - started - QUESTIONS * TIME_LIMIT)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(players)))
+    elapsed = time.perf_counter() - started
+    lateness.sort()
+    return elapsed, len(threads), lateness[len(lateness) // 2], lateness[-1]
+
+
+def main():
+    print(f"{'players':>8} {'wall s':>7} {'threads':>8} {'p50 late ms':>12} {'max late ms':>12}")
+    for players in PLAYERS:
+        elapsed, threads, p50, worst = asyncio.run(run(players))
+        print(f"{players:>8} {elapsed:7.2f} {threads:>8} {p50 * 1000:12.1f} {worst * 1000:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
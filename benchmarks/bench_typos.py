@@ -0,0 +1,67 @@
+"""
+Cost of typo-tolerant grading compared with the plain check_answer().
+
+Run with: python benchmarks/bench_typos.py
+"""
+
+import random
+import time
+
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.quiz import check_answer, check_answers
+
+
+PAIRS = 200_000
+
+
+def typo(word, rng):
+    if len(word) < 2:
+        return word
+    i = rng.randrange(len(word) - 1)
+    kind = rng.randrange(3)
+    if kind == 0:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    if kind == 1:
+        return word[:i] + word[i + 1 :]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1 :]
+
+
+def make_pairs(n, seed=0):
+    rng = random.Random(seed)
+    answers = [a for items in _EMOJI_BANK.values() for (_, a) in items]
+    corrects = [rng.choice(answers) for _ in range(n)]
+    guesses = []
+    for c in corrects:
+        roll = rng.random()
+        if roll < 0.4:
+            guesses.append(c)
+        elif roll < 0.8:
+            guesses.append(typo(c, rng))
+        else:
+            guesses.append(rng.choice(answers))
+    return corrects, guesses
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t, result
+
+
+def main():
+    corrects, guesses = make_pairs(PAIRS)
+    print(f"{PAIRS} pairs, 40% exact, 40% one typo, 20% other answers")
+    for allow_partial in (False, True):
+        base, plain = timed(lambda: [check_answer(c, g, allow_partial=allow_partial) for c, g in zip(corrects, guesses)])
+        for k in (1, 2):
+            loop, fuzzy = timed(lambda: [check_answer(c, g, allow_partial=allow_partial, allow_typos=k) for c, g in zip(corrects, guesses)])
+            bulk, bulk_fuzzy = timed(lambda: check_answers(corrects, guesses, allow_partial=allow_partial, allow_typos=k))
+            assert bulk_fuzzy == fuzzy
+            print(
+                f"  allow_partial={allow_partial!s:5} k={k}  plain {base:6.3f}s ({sum(plain) / PAIRS:4.0%} right)"
+                f"  typos {loop:6.3f}s  bulk typos {bulk:6.3f}s ({sum(fuzzy) / PAIRS:4.0%} right)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,27 @@
-from .data import random_emojis
-from .quiz import make_quiz_item, check_answer
-from .score import score
-
-__all__ = [
-    "random_emojis",
-    "make_quiz_item",
-    "check_answer",
-    "score",
-]
+import importlib
+
+# Public names are resolved on first use, so `import emojiguessr` (and the CLI
+# fast paths) don't pay for modules they never touch.
+_EXPORTS = {
+    "random_emojis": "data",
+    "make_quiz_item": "quiz",
+    "make_quiz_items": "quiz",
+    "check_answer": "quiz",
+    "check_answers": "quiz",
+    "score": "score",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,48 +1,72 @@
-import argparse
-from emojiguessr import make_quiz_item, check_answer, score
-from emojiguessr.data import _EMOJI_BANK
-
-
-def run_quiz(num_questions, theme, case_sensitive, allow_partial, max_attempts, input_fn = input, output_fn = print):
-    s = 0
-    for i in range(1, num_questions + 1):
-        item = make_quiz_item(theme=theme)
-        clue = item["clue"]
-        answer = item["answer"]
-
-        output_fn(f"\nQuestion {i}/{num_questions}")
-        output_fn(f"Theme: {item['theme']}")
-        output_fn(f"Emoji: {clue}")
-
-        attempts_left = max_attempts
-        while attempts_left > 0:
-            guess = input_fn("Your guess: ")
-
-            is_right = check_answer(
-                correct=answer,
-                guess=guess,
-                case_sensitive=case_sensitive,
-                allow_partial=allow_partial,
-            )
+import importlib
+import os
+import sys
+from time import perf_counter
+from emojiguessr.data import themes
+
+# Gameplay modules are imported on first use rather than at startup, so quick
+# calls like --list-themes don't pay for them. make_quiz_item is still read as
+# a module attribute, so it can be patched.
+
+
+def __getattr__(name):
+    if name == "make_quiz_item":
+        from emojiguessr.quiz import make_quiz_item
+        return make_quiz_item
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run_quiz(num_questions, theme, case_sensitive, allow_partial, max_attempts, input_fn = input, output_fn = print, metrics = None, strategy = None, rng = None, buffered = False, log = None):
+    from emojiguessr.render import write_frame
+    from emojiguessr.session import QuizSession
+
+    session = QuizSession(
+        num_questions,
+        theme,
+        case_sensitive,
+        allow_partial,
+        max_attempts,
+        make_item=sys.modules[__name__].make_quiz_item,
+        metrics=metrics,
+        strategy=strategy,
+        rng=rng,
+        log=log,
+    )
 
-            s = score(s, correct=is_right)
+    if buffered:
+        # one output_fn call per step instead of one per line
+        def render(lines):
+            write_frame(lines, output_fn)
+    else:
+        def render(lines):
+            for line in lines:
+                output_fn(line)
+
+    if metrics is None:
+        render(session.start())
+        while not session.done:
+            guess = input_fn(session.prompt)
+            render(session.answer(guess))
+        return
 
-            if is_right:
-                output_fn("✅ Correct!")
-                break
-            else:
-                attempts_left -= 1
-                if attempts_left > 0:
-                    output_fn(f"❌ Wrong! {attempts_left} attempts left.")
-                else:
-                    output_fn(f"❌ Nope — it was: {answer}")
+    # same loop, with render and player think time measured
+    lines = session.start()
+    while True:
+        started = perf_counter()
+        render(lines)
+        metrics.observe("render", perf_counter() - started)
+        if session.done:
+            return
 
-    output_fn(f"\nFinal score: {s}/{num_questions}")
+        started = perf_counter()
+        guess = input_fn(session.prompt)
+        metrics.observe("think", perf_counter() - started)
+        lines = session.answer(guess)
 
 
 def list_themes(output_fn = print):
     output_fn("Available themes:")
-    for theme in sorted(_EMOJI_BANK.keys()):
+    for theme in themes():
         output_fn(f"  - {theme}")
 
 
@@ -57,13 +81,34 @@ def list_commands(output_fn = print):
     )
     output_fn("  --list-themes, -lt     : List available themes and exit")
     output_fn("  --list-commands, -lc   : List available commands and exit")
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        prog="emojiguessr",
-        description="Play a quick emoji guessing game in your terminal.",
-    )
+    output_fn("  --seed                 : Seed for picking questions, to replay the same quiz")
+    output_fn("  --time-limit           : Seconds to answer each question (default: no limit)")
+    output_fn("  --log                  : Append every answer to a binary event log file")
+    output_fn("  serve                  : Host quizzes for many players over TCP")
+    output_fn("  simulate               : Play many games with bots to calibrate difficulty")
+    output_fn("  grade                  : Grade recorded submissions from NDJSON")
+    output_fn("  stats                  : Per-item and per-theme accuracy from an answer log")
+    output_fn("  api                    : Serve quiz items and answer checking over HTTP/JSON")
+
+
+_SUBCOMMANDS = {
+    "serve": "emojiguessr.server",
+    "simulate": "emojiguessr.simulate",
+    "grade": "emojiguessr.grade",
+    "stats": "emojiguessr.stats",
+    "api": "emojiguessr.api",
+}
+
+
+_FAST_PATHS = {
+    ("--list-themes",): list_themes,
+    ("-lt",): list_themes,
+    ("--list-commands",): list_commands,
+    ("-lc",): list_commands,
+}
+
+
+def add_quiz_arguments(parser):
     parser.add_argument(
         "--num-questions",
         "-n",
@@ -94,6 +139,61 @@ def main():
         default=1,
         help="Maximum number of attempts per question (default: 1)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for picking questions, to replay the same quiz (default: random)",
+    )
+
+
+def quiz_options(args):
+    return dict(
+        num_questions=args.num_questions,
+        theme=args.theme,
+        case_sensitive=args.case_sensitive,
+        allow_partial=not args.no_partial,
+        max_attempts=args.max_attempts,
+        rng=args.seed,
+    )
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    pack_dir = os.environ.get("EMOJIGUESSR_PACKS")
+    if pack_dir:
+        from emojiguessr.packs import register_pack_dir
+        register_pack_dir(pack_dir)
+
+    # health checks call these a lot, so skip building the argument parser
+    fast_path = _FAST_PATHS.get(tuple(argv))
+    if fast_path is not None:
+        fast_path()
+        return
+
+    if argv and argv[0] in _SUBCOMMANDS:
+        module = importlib.import_module(_SUBCOMMANDS[argv[0]])
+        return module.main(argv[1:])
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr",
+        description="Play a quick emoji guessing game in your terminal.",
+    )
+    add_quiz_arguments(parser)
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="Seconds to answer each question; running out counts as a miss (default: no limit)",
+    )
+    parser.add_argument(
+        "--log",
+        help="Append every answer to this binary event log",
+    )
     parser.add_argument(
         "--list-themes",
         "-lt",
@@ -107,7 +207,7 @@ def main():
         help="List available commands and exit.",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.list_themes:
         list_themes()
@@ -117,13 +217,22 @@ def main():
         list_commands()
         return
 
-    run_quiz(
-        num_questions=args.num_questions,
-        theme=args.theme,
-        case_sensitive=args.case_sensitive,
-        allow_partial=not args.no_partial,
-        max_attempts=args.max_attempts,
-    )
+    options = quiz_options(args)
+    if args.log:
+        from emojiguessr.eventlog import EventLog
+        options["log"] = EventLog(args.log)
+
+    try:
+        if args.time_limit is not None:
+            import asyncio
+            from emojiguessr.timed import play_in_terminal
+
+            asyncio.run(play_in_terminal(args.time_limit, **options))
+        else:
+            run_quiz(**options, buffered=True)
+    finally:
+        if args.log:
+            options["log"].close()
 
 
 if __name__ == "__main__":
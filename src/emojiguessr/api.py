@@ -0,0 +1,291 @@
+"""
+JSON API over HTTP/1.1, for services that want quiz items and grading
+without importing Python.
+
+    GET  /themes                 ["animals", "cities", ...]
+    GET  /item?theme=food&seed=7 {"clue": "🍕", "answer": "pizza", "theme": "food"}
+    POST /check                  {"answer": "Pizza", "guess": "piz"} -> {"correct": true}
+    POST /batch                  {"items": [{"theme": "food"}, ...],
+                                  "checks": [{"answer": ..., "guess": ...}, ...]}
+                                 -> {"items": [...], "checks": [true, ...]}
+
+/check takes the same optional case_sensitive, allow_partial and
+allow_typos fields as `emojiguessr grade`, and /batch grades its checks
+the same way, in bulk with check_answers. A batch costs one request
+instead of one per item or guess, which is most of the cost of a small
+request.
+
+Connections are kept alive (HTTP/1.1 default, or HTTP/1.0 with
+"Connection: keep-alive") and requests on one connection are answered in
+order, so clients may pipeline. Bodies must come with a Content-Length;
+chunked request bodies are not supported. Bodies are limited to MAX_BODY
+bytes and a batch to MAX_BATCH items and checks together.
+
+Run with: emojiguessr api --port 8080
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import traceback
+from urllib.parse import parse_qsl, urlsplit
+
+from .data import themes
+from .grade import grade_chunk, valid_record
+from .quiz import check_answer, make_quiz_item
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_HEADER = 16 * 1024
+MAX_BODY = 1 << 20
+MAX_BATCH = 10_000
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _check_record(record, where):
+    if not valid_record(record):
+        raise HTTPError(
+            400,
+            f"{where} needs string answer and guess; case_sensitive and allow_partial "
+            "must be true or false, allow_typos a non-negative integer",
+        )
+
+
+def _flags(record):
+    return {
+        key: record[key]
+        for key in ("case_sensitive", "allow_partial", "allow_typos")
+        if key in record
+    }
+
+
+def _item(params, where="item"):
+    if not isinstance(params, dict):
+        raise HTTPError(400, f"{where} is not an object")
+    theme = params.get("theme", "food")
+    if not isinstance(theme, str) or theme not in themes():
+        raise HTTPError(400, f"{where}: unknown theme {theme!r}")
+    seed = params.get("seed")
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+        raise HTTPError(400, f"{where}: seed must be an integer")
+    return dict(make_quiz_item(theme) if seed is None else make_quiz_item(theme, rng=seed))
+
+
+def get_themes(query, body):
+    return themes()
+
+
+def get_item(query, body):
+    params = dict(parse_qsl(query))
+    if "seed" in params:
+        try:
+            params["seed"] = int(params["seed"])
+        except ValueError:
+            raise HTTPError(400, "seed must be an integer") from None
+    return _item(params)
+
+
+def post_check(query, body):
+    _check_record(body, "check")
+    return {"correct": check_answer(body["answer"], body["guess"], **_flags(body))}
+
+
+def post_batch(query, body):
+    if not isinstance(body, dict):
+        raise HTTPError(400, "expected an object with items and/or checks")
+    items = body.get("items", [])
+    checks = body.get("checks", [])
+    if not isinstance(items, list) or not isinstance(checks, list):
+        raise HTTPError(400, "items and checks must be arrays")
+    if len(items) + len(checks) > MAX_BATCH:
+        raise HTTPError(413, f"at most {MAX_BATCH} items and checks per batch")
+    for i, record in enumerate(checks):
+        _check_record(record, f"checks[{i}]")
+    return {
+        "items": [_item(params, f"items[{i}]") for i, params in enumerate(items)],
+        "checks": grade_chunk([(None, record) for record in checks]),
+    }
+
+
+ROUTES = {
+    "/themes": {"GET": get_themes},
+    "/item": {"GET": get_item},
+    "/check": {"POST": post_check},
+    "/batch": {"POST": post_batch},
+}
+
+
+def _response(status, payload, connection=None):
+    # connection: None for an HTTP/1.1 default keep-alive, otherwise the
+    # Connection header to send ("close", or "keep-alive" for HTTP/1.0)
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        + ("" if connection is None else f"Connection: {connection}\r\n")
+        + "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def _parse_head(head):
+    # returns (method, target, version, headers) with lower-cased names
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    if not version.startswith("HTTP/1."):
+        raise HTTPError(400, "unsupported HTTP version")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise HTTPError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+def _connection(version, headers):
+    # the Connection header for the response; "close" ends the connection
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return "keep-alive" if connection == "keep-alive" else "close"
+    return "close" if connection == "close" else None
+
+
+def handle_request(method, target, body):
+    # returns (status, payload) for one request
+    url = urlsplit(target)
+    methods = ROUTES.get(url.path)
+    if methods is None:
+        return 404, {"error": f"no such endpoint: {url.path}"}
+    handler = methods.get(method)
+    if handler is None:
+        return 405, {"error": f"{url.path} only accepts {', '.join(methods)}"}
+    try:
+        # GET requests ignore any body, and an empty body is no body
+        if body and method != "GET":
+            try:
+                body = json.loads(body)
+            except ValueError:
+                raise HTTPError(400, "body is not valid JSON") from None
+            except RecursionError:
+                raise HTTPError(400, "body is nested too deeply") from None
+        return 200, handler(url.query, body)
+    except HTTPError as e:
+        return e.status, {"error": str(e)}
+    except Exception as e:
+        # e.g. a theme pack that fails to load: report it and keep serving
+        traceback.print_exc()
+        return 500, {"error": f"internal error: {type(e).__name__}"}
+
+
+async def _read_request(reader):
+    # returns (method, target, version, headers, body), or None at the end
+    # of the connection
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise HTTPError(400, "incomplete request") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "request headers too large") from None
+
+    method, target, version, headers = _parse_head(head[:-4])
+    if "transfer-encoding" in headers:
+        raise HTTPError(501, "chunked request bodies are not supported")
+    length = headers.get("content-length")
+    if length is None:
+        if method == "POST":
+            raise HTTPError(411, "POST needs a Content-Length")
+        return method, target, version, headers, None
+    if not length.isdigit():
+        raise HTTPError(400, "bad Content-Length")
+    if int(length) > MAX_BODY:
+        raise HTTPError(413, f"bodies are limited to {MAX_BODY} bytes")
+    return method, target, version, headers, await reader.readexactly(int(length))
+
+
+async def handle_connection(reader, writer, idle_timeout):
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(_read_request(reader), idle_timeout)
+            except HTTPError as e:
+                # the rest of the stream can't be trusted: answer and hang up
+                writer.write(_response(e.status, {"error": str(e)}, "close"))
+                await writer.drain()
+                return
+            if request is None:
+                return
+            method, target, version, headers, body = request
+            connection = _connection(version, headers)
+            status, payload = handle_request(method, target, body)
+            writer.write(_response(status, payload, connection))
+            await writer.drain()
+            if connection == "close":
+                return
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=30.0):
+    async def on_connect(reader, writer):
+        await handle_connection(reader, writer, idle_timeout)
+
+    return await asyncio.start_server(on_connect, host, port, limit=MAX_HEADER)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=30.0):
+    server = await start_server(host, port, idle_timeout)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving the emojiguessr API on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr api",
+        description="Serve quiz items and answer checking as a JSON API over HTTP/1.1.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to keep an idle connection open (default: 30)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,127 @@
+"""
+Load generator for the JSON API.
+
+Keeps --concurrency keep-alive connections busy grading random guesses
+against `emojiguessr api`, first one guess per POST /check and then
+--batch-size guesses per POST /batch, and reports requests and guesses per
+second with request latency percentiles for each. With --local it starts
+its own server on a free localhost port.
+
+Run with: python -m emojiguessr.apiload --local --requests 20000 --batch-size 100
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .api import DEFAULT_HOST, DEFAULT_PORT, start_server
+from .data import _EMOJI_BANK
+from .loadgen import percentile
+
+
+def _request(path, payload):
+    body = json.dumps(payload).encode("utf-8")
+    head = f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    return head.encode("latin-1") + body
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_load(host, port, requests=5000, concurrency=50, batch_size=1, seed=None):
+    rng = random.Random(seed)
+    answers = [answer for items in _EMOJI_BANK.values() for (_, answer) in items]
+
+    def payload():
+        # guesses are right, a prefix, or another item's answer
+        checks = []
+        for _ in range(batch_size):
+            answer = rng.choice(answers)
+            guess = rng.choice((answer, answer[: max(1, len(answer) // 2)], rng.choice(answers)))
+            checks.append({"answer": answer, "guess": guess})
+        if batch_size == 1:
+            return _request("/check", checks[0])
+        return _request("/batch", {"checks": checks})
+
+    # bodies are built up front so the client's JSON work isn't timed
+    bodies = [payload() for _ in range(requests)]
+    latencies = []
+    errors = 0
+
+    async def connection(share):
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for body in share:
+                sent = time.perf_counter()
+                writer.write(body)
+                status, _ = await _read_response(reader)
+                latencies.append(time.perf_counter() - sent)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connection(bodies[i::concurrency]) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "batch_size": batch_size,
+        "seconds": elapsed,
+        "requests_per_sec": requests / elapsed if elapsed else 0.0,
+        "checks_per_sec": requests * batch_size / elapsed if elapsed else 0.0,
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run_local(requests=5000, concurrency=50, batch_size=1, seed=None):
+    server = await start_server(DEFAULT_HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        return await run_load(DEFAULT_HOST, port, requests, concurrency, batch_size, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m emojiguessr.apiload",
+        description="Grade guesses over many keep-alive connections to an emojiguessr API server.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--local", action="store_true", help="Start a server on localhost for the run")
+    parser.add_argument("--requests", "-r", type=int, default=5000, help="Requests per run (default: 5000)")
+    parser.add_argument("--concurrency", "-c", type=int, default=50, help="Connections in use at once (default: 50)")
+    parser.add_argument("--batch-size", "-b", type=int, default=100, help="Guesses per /batch request (default: 100)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    for batch_size in (1, args.batch_size):
+        if args.local:
+            result = asyncio.run(run_local(args.requests, args.concurrency, batch_size, args.seed))
+        else:
+            result = asyncio.run(run_load(args.host, args.port, args.requests, args.concurrency, batch_size, args.seed))
+        label = "/check" if batch_size == 1 else f"/batch of {batch_size}"
+        print(
+            f"{label:<14} {result['requests_per_sec']:8.0f} requests/sec {result['checks_per_sec']:10.0f} guesses/sec, "
+            f"p50 {result['p50_ms']:.2f} ms, p90 {result['p90_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms"
+            + (f", {result['errors']} errors" if result["errors"] else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark suite for the public hot paths.
+
+Times random_emojis, get_theme_item, make_quiz_item, check_answer (every
+flag combination) and whole scripted run_quiz sessions against synthetic
+banks of 10^2 to 10^6 clues, and writes the results as JSON. Passing
+--compare with an earlier results file reports anything that got slower
+than the threshold and exits with status 1.
+
+Run with: python -m emojiguessr.bench --output bench.json
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import sys
+import time
+import timeit
+
+from . import data
+from .__main__ import run_quiz
+from .quiz import make_quiz_item, check_answer
+
+DEFAULT_SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+THEMES = 4
+
+
+@contextlib.contextmanager
+def synthetic_bank(size):
+    original = dict(data._EMOJI_BANK)
+    per_theme = max(1, size // THEMES)
+    bank = {
+        f"theme{t}": [(f"e{t}-{i}", f"Answer {t} {i}") for i in range(per_theme)]
+        for t in range(THEMES)
+    }
+    bank["food"] = bank.pop("theme0")
+    try:
+        data._EMOJI_BANK.clear()
+        data._EMOJI_BANK.update(bank)
+        data.invalidate_index()
+        data._bank_index()
+        yield bank
+    finally:
+        data._EMOJI_BANK.clear()
+        data._EMOJI_BANK.update(original)
+        data.invalidate_index()
+
+
+def time_call(fn, repeat=3):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def quiz_session(num_questions=5, max_attempts=2):
+    guesses = itertools.cycle(["answer 1", "nope", "ANSWER", "answer 2 3"])
+
+    def session():
+        run_quiz(
+            num_questions,
+            "theme1",
+            False,
+            True,
+            max_attempts,
+            input_fn=lambda _: next(guesses),
+            output_fn=lambda _: None,
+        )
+
+    return session
+
+
+def cases():
+    yield "random_emojis", lambda: data.random_emojis(3, "theme1")
+    yield "random_emojis[any theme]", lambda: data.random_emojis(3, "missing")
+    yield "get_theme_item", lambda: data.get_theme_item("theme1")
+    yield "make_quiz_item", lambda: make_quiz_item("theme1")
+    for case_sensitive, allow_partial in itertools.product((False, True), repeat=2):
+        name = f"check_answer[case_sensitive={case_sensitive},allow_partial={allow_partial}]"
+        yield name, lambda c=case_sensitive, p=allow_partial: check_answer(
+            "Answer 1 234", " answer 1 ", case_sensitive=c, allow_partial=p
+        )
+    yield "run_quiz[5 questions]", quiz_session()
+
+
+def run(sizes, log=print):
+    results = []
+    for size in sizes:
+        with synthetic_bank(size):
+            for name, fn in cases():
+                ns = time_call(fn)
+                results.append({"name": name, "bank_size": size, "ns_per_call": ns})
+                log(f"{size:>9} {name:56} {ns:12.0f} ns")
+    return results
+
+
+def compare(results, baseline, threshold):
+    before = {(r["name"], r["bank_size"]): r["ns_per_call"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = before.get((r["name"], r["bank_size"]))
+        if old and r["ns_per_call"] > old * (1 + threshold):
+            regressions.append((r["name"], r["bank_size"], old, r["ns_per_call"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m emojiguessr.bench",
+        description="Benchmark emojiguessr's hot paths and write the results as JSON.",
+    )
+    parser.add_argument("--output", "-o", help="File to write JSON results to (default: stdout only)")
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(float(x)) for x in s.split(",")],
+        default=DEFAULT_SIZES,
+        help="Comma-separated synthetic bank sizes (default: 1e2,1e3,1e4,1e5,1e6)",
+    )
+    parser.add_argument("--compare", help="Earlier JSON results to check for regressions")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Slowdown counted as a regression, as a fraction (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, size, old, new in regressions:
+            print(f"REGRESSION {name} @ {size}: {old:.0f} ns -> {new:.0f} ns ({new / old - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
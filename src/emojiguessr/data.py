@@ -1,5 +1,7 @@
 import random
 
+from .text import normalize
+
 _EMOJI_BANK = {
     "food": [
         ("🍕", "pizza"),
@@ -76,19 +78,126 @@ _EMOJI_BANK = {
 }
 
 
-def random_emojis(count=3, theme="food"):
-    items = _EMOJI_BANK.get(theme)
-    if not items:
-        all_emoji = [e for v in _EMOJI_BANK.values() for (e, _) in v]
-        random.shuffle(all_emoji)
-        return all_emoji[: min(count, len(all_emoji))]
-    emojis = [e for (e, _) in items]
-    random.shuffle(emojis)
-    return emojis[:count]
+class _BankIndex:
+    # Flattened view of the bank: every item lives in one list and each theme
+    # is a (start, stop) range into it, so sampling never copies a theme.
+    # Answers are normalized once here instead of on every check.
+    __slots__ = ("items", "emojis", "answers_n", "normalized", "ranges")
+
+    def __init__(self, bank):
+        self.items = []
+        self.emojis = []
+        self.answers_n = []
+        self.normalized = {}
+        self.ranges = {}
+        for theme, items in bank.items():
+            self.add(theme, items)
+
+    def add(self, theme, items):
+        start = len(self.items)
+        self.items.extend(items)
+        self.emojis.extend(e for (e, _) in items)
+        for _, answer in items:
+            answer_n = self.normalized.get(answer)
+            if answer_n is None:
+                answer_n = self.normalized[answer] = normalize(answer)
+            self.answers_n.append(answer_n)
+        self.ranges[theme] = (start, len(self.items))
+
+    def locate(self, i, theme=None):
+        # (theme, position within the theme) of bank position i; theme is
+        # tried first
+        start, stop = self.ranges.get(theme, (0, 0))
+        if not start <= i < stop:
+            for theme, (start, stop) in self.ranges.items():
+                if start <= i < stop:
+                    break
+            else:
+                raise IndexError(i)
+        return theme, i - start
+
+    def theme_range(self, theme, fallback=None):
+        start, stop = self.ranges.get(theme, (0, 0))
+        if start == stop:
+            if fallback is None:
+                return 0, len(self.items)
+            return self.ranges[fallback]
+        return start, stop
+
+
+_index = None
+
+# themes registered by name whose items are only produced (e.g. parsed from a
+# theme pack) the first time someone asks for that theme
+_LAZY_THEMES = {}
+
+
+def _bank_index():
+    global _index
+    if _index is None:
+        _index = _BankIndex(_EMOJI_BANK)
+    return _index
+
+
+def _theme_index(theme):
+    loader = _LAZY_THEMES.get(theme)
+    if loader is not None:
+        # register_theme drops the loader only once the items are in, so a
+        # pack that fails to load fails again on the next access
+        register_theme(theme, loader())
+    return _bank_index()
+
+
+def invalidate_index():
+    global _index
+    _index = None
+
+
+def register_theme(theme, items):
+    items = list(items)
+    _LAZY_THEMES.pop(theme, None)
+    replacing = theme in _EMOJI_BANK
+    _EMOJI_BANK[theme] = items
+    if _index is None:
+        return
+    if replacing:
+        invalidate_index()
+    else:
+        _index.add(theme, items)
+
+
+def register_lazy_theme(theme, loader):
+    _LAZY_THEMES[theme] = loader
+
+
+def themes():
+    return sorted(set(_EMOJI_BANK) | set(_LAZY_THEMES))
+
+
+def normalized_answer(answer):
+    answer_n = _bank_index().normalized.get(answer)
+    return normalize(answer) if answer_n is None else answer_n
+
+
+def _as_rng(rng):
+    # rng may be None (the shared module-level generator), a random.Random
+    # or anything random.Random accepts as a seed
+    if rng is None:
+        return random
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def random_emojis(count=3, theme="food", rng=None):
+    index = _theme_index(theme)
+    start, stop = index.theme_range(theme)
+    k = max(0, min(count, stop - start))
+    # sampling from a range object only touches the k picked positions
+    return [index.emojis[i] for i in _as_rng(rng).sample(range(start, stop), k)]
 
 
-def get_theme_item(theme="food"):
-    items = _EMOJI_BANK.get(theme)
-    if not items:
-        items = _EMOJI_BANK["food"]
-    return random.choice(items)
+def get_theme_item(theme="food", rng=None):
+    index = _theme_index(theme)
+    start, stop = index.theme_range(theme, fallback="food")
+    return index.items[start + _as_rng(rng).randrange(stop - start)]
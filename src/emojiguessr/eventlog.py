@@ -0,0 +1,268 @@
+"""
+Append-only binary log of every answer given in a quiz.
+
+File layout (little-endian):
+
+    header   magic "EGL2", version (uint16), reserved (uint16),
+             committed end (uint64): an offset up to which the file is
+             known to hold whole records
+    records  back to back, each a fixed 24-byte part followed by the guess:
+             session id   uint64
+             theme        uint32  theme_id() of the theme name
+             item index   uint32  position within the theme, 0xFFFFFFFF
+                                  if unknown
+             attempt      uint8   1 for the first guess at a question
+             flags        uint8   CORRECT | PARTIAL | TIMEOUT
+             latency      uint32  microseconds since the question (or the
+                                  previous guess) was shown
+             guess size   uint16  followed by that many bytes of UTF-8
+
+EventLog batches records in memory and writes each batch with a single
+write (and, with sync=True, a single fsync), so logging costs the game loop
+a struct.pack per answer. A background thread flushes whatever is buffered
+every flush_interval seconds, so records don't sit in memory while the game
+is idle. EventLogReader maps the file and reads the fixed fields in place;
+guesses are only decoded for records that are returned.
+
+Items are logged by theme and position within the theme rather than by
+bank position, since pack themes land in the bank in whatever order a
+process first uses them.
+
+A record cut short by a crash mid-write is ignored by the reader, and cut
+off when the log is next opened for writing, so new records start on a
+record boundary. Each batch moves the header's committed end past it, so
+finding that boundary only means scanning what came after the last batch.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+MAGIC = b"EGL2"
+VERSION = 2
+
+CORRECT = 1
+PARTIAL = 2
+TIMEOUT = 4
+NO_INDEX = 0xFFFFFFFF
+MAX_GUESS = 0xFFFF
+
+_HEADER = struct.Struct("<4sHHQ")
+_COMMITTED = struct.Struct("<Q")
+_COMMITTED_AT = 8
+_RECORD = struct.Struct("<QIIBBIH")
+
+Event = namedtuple("Event", "session theme index attempt correct partial timeout latency_us guess")
+
+
+def theme_id(theme):
+    # the 32-bit id a theme name is logged as
+    return NO_INDEX if theme is None else zlib.crc32(theme.encode("utf-8"))
+
+
+class EventLog:
+    def __init__(self, path, batch_size=4096, flush_interval=1.0, sync=False):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._parts = []
+        self._theme_ids = {}
+        self._last_flush = time.monotonic()
+
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # O_APPEND ignores offsets, so the header is updated through its own fd
+        self._header_fd = os.open(path, os.O_WRONLY)
+        try:
+            self._repair()
+        except BaseException:
+            os.close(self._fd)
+            os.close(self._header_fd)
+            raise
+
+        self._closed = threading.Event()
+        self._flusher = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def _repair(self):
+        # start a new log, or drop the torn tail a crash may have left so
+        # that new records don't land in the middle of one
+        header = _HEADER.pack(MAGIC, VERSION, 0, _HEADER.size)
+        size = os.fstat(self._fd).st_size
+        if size < len(header):
+            with open(self.path, "rb") as f:
+                if not header.startswith(f.read()):
+                    raise ValueError(f"{self.path} is not an EGL{VERSION} event log")
+            os.ftruncate(self._fd, 0)
+            os.write(self._fd, header)
+            return
+        with EventLogReader(self.path) as reader:
+            committed = reader._committed
+            if not _HEADER.size <= committed <= size:
+                committed = _HEADER.size
+            end = reader._end(committed)
+        if end < size:
+            os.ftruncate(self._fd, end)
+        if end != committed:
+            self._mark_committed(end)
+
+    def _mark_committed(self, end):
+        os.pwrite(self._header_fd, _COMMITTED.pack(end), _COMMITTED_AT)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, session, theme, index, guess, correct, attempt, latency_us, partial=False, timeout=False):
+        # theme is a theme name and index the item's position within it
+        tid = self._theme_ids.get(theme)
+        if tid is None:
+            tid = self._theme_ids[theme] = theme_id(theme)
+        data = guess.encode("utf-8")
+        if len(data) > MAX_GUESS:
+            data = data[:MAX_GUESS]
+        latency_us = int(latency_us)
+        if latency_us > 0xFFFFFFFF:
+            latency_us = 0xFFFFFFFF
+        record = _RECORD.pack(
+            session,
+            tid,
+            NO_INDEX if index is None else index,
+            attempt if attempt < 0xFF else 0xFF,
+            (CORRECT if correct else 0) | (PARTIAL if partial else 0) | (TIMEOUT if timeout else 0),
+            latency_us,
+            len(data),
+        ) + data
+        with self._lock:
+            self._parts.append(record)
+            if len(self._parts) >= self.batch_size or (
+                self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._commit()
+
+    def flush(self):
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        # group commit: everything buffered goes out in one write (O_APPEND
+        # keeps concurrent writers' batches whole) and at most one fsync
+        if self._parts:
+            view = memoryview(b"".join(self._parts))
+            self._parts.clear()
+            while view:
+                view = view[os.write(self._fd, view):]
+            # after an O_APPEND write the offset is the end of our batch;
+            # with several writers the mark may lag, which only means a
+            # longer scan after a crash
+            self._mark_committed(os.lseek(self._fd, 0, os.SEEK_CUR))
+            if self.sync:
+                os.fsync(self._fd)
+        self._last_flush = time.monotonic()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._parts and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._commit()
+
+    def close(self):
+        if self._fd is None:
+            return
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        os.close(self._fd)
+        os.close(self._header_fd)
+        self._fd = None
+
+
+class EventLogReader:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not an EGL{VERSION} event log")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self._committed = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not an EGL{VERSION} event log")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mm.close()
+
+    def _records(self, pos=_HEADER.size):
+        # yields (offset of the guess, fixed fields) for every whole record
+        # from pos on; the record ends at offset + fields[6]
+        mm = self._mm
+        end = len(mm)
+        unpack = _RECORD.unpack_from
+        size = _RECORD.size
+        while pos + size <= end:
+            fields = unpack(mm, pos)
+            start = pos + size
+            pos = start + fields[6]
+            if pos > end:
+                return
+            yield start, fields
+
+    def _end(self, pos=_HEADER.size):
+        # offset just past the last whole record, scanning from the record
+        # boundary pos
+        end = pos
+        for start, fields in self._records(pos):
+            end = start + fields[6]
+        return end
+
+    def _event(self, start, fields):
+        session, theme, index, attempt, flags, latency, n = fields
+        return Event(
+            session,
+            None if theme == NO_INDEX else theme,
+            None if index == NO_INDEX else index,
+            attempt,
+            bool(flags & CORRECT),
+            bool(flags & PARTIAL),
+            bool(flags & TIMEOUT),
+            latency,
+            self._mm[start : start + n].decode("utf-8", "replace"),
+        )
+
+    def __iter__(self):
+        for start, fields in self._records():
+            yield self._event(start, fields)
+
+    def filter(self, session=None, theme=None, index=None, correct=None):
+        # theme is a name; index a position within the theme
+        tid = None if theme is None else theme_id(theme)
+        for start, fields in self._records():
+            if session is not None and fields[0] != session:
+                continue
+            if tid is not None and fields[1] != tid:
+                continue
+            if index is not None and fields[2] != index:
+                continue
+            if correct is not None and bool(fields[4] & CORRECT) != correct:
+                continue
+            yield self._event(start, fields)
+
+    def count(self):
+        return sum(1 for _ in self._records())
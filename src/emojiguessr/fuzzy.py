@@ -0,0 +1,82 @@
+"""
+Bounded edit distance for typo-tolerant answer checking.
+
+Only the diagonal band of width 2k+1 of the edit-distance table can hold
+values <= k, so each row computes just that band and the check gives up as
+soon as a whole row exceeds k. Adjacent transpositions ("pengiun") count as
+one edit, like a single substitution.
+"""
+
+
+def within_distance(guess, target, k, prefix=False):
+    m, n = len(guess), len(target)
+    if k <= 0:
+        return target.startswith(guess) if prefix else guess == target
+    if m - n > k or (not prefix and n - m > k):
+        return False
+    if k == 1:
+        if prefix:
+            # a prefix within one edit is one char shorter, equal or longer
+            return any(_within_one(guess, target[:j]) for j in (m, m - 1, m + 1) if 0 <= j <= n)
+        return _within_one(guess, target)
+
+    limit = k + 1
+    # three rolling rows: two rows back (for transpositions), previous, current
+    back = [limit] * (n + 1)
+    prev = [j if j <= k else limit for j in range(n + 1)]
+    cur = [limit] * (n + 1)
+    lo, hi = 1, min(n, k)
+
+    for i in range(1, m + 1):
+        lo = max(1, i - k)
+        hi = min(n, i + k)
+        cur[0] = i if i <= k else limit
+        if lo > 1:
+            cur[lo - 1] = limit
+
+        g = guess[i - 1]
+        row_min = cur[0]
+        for j in range(lo, hi + 1):
+            t = target[j - 1]
+            v = prev[j - 1] if g == t else prev[j - 1] + 1
+            if prev[j] + 1 < v:
+                v = prev[j] + 1
+            if cur[j - 1] + 1 < v:
+                v = cur[j - 1] + 1
+            if i > 1 and j > 1 and g == target[j - 2] and guess[i - 2] == t:
+                if back[j - 2] + 1 < v:
+                    v = back[j - 2] + 1
+            if v > limit:
+                v = limit
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+
+        if row_min > k:
+            return False
+        back, prev, cur = prev, cur, back
+
+    if prefix:
+        return min(prev[lo - 1 : hi + 1]) <= k
+    return prev[n] <= k
+
+
+def _within_one(a, b):
+    # k=1 is the common phone-typo case: skip the shared prefix, then the
+    # rest must line up after one substitution, insertion, deletion or swap
+    if a == b:
+        return True
+    m, n = len(a), len(b)
+    if abs(m - n) > 1:
+        return False
+    i = 0
+    end = min(m, n)
+    while i < end and a[i] == b[i]:
+        i += 1
+    if m < n:
+        return a[i:] == b[i + 1 :]
+    if m > n:
+        return a[i + 1 :] == b[i:]
+    if a[i + 1 :] == b[i + 1 :]:
+        return True
+    return a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2 :] == b[i + 2 :]
@@ -0,0 +1,176 @@
+"""
+Batch grading of recorded submissions.
+
+Reads NDJSON records such as
+
+    {"answer": "Pizza", "guess": "piz", "allow_partial": false}
+
+from a file or stdin and writes each record back with a "correct" field
+added. case_sensitive, allow_partial and allow_typos are optional per
+record and default to the command-line flags. Records stream through in
+fixed-size chunks that are decoded and graded (with check_answers) in
+bulk, and each chunk is written with a single write, so memory stays flat
+however large the input is.
+
+Run with: emojiguessr grade --input submissions.ndjson --output graded.ndjson
+"""
+
+import argparse
+import json
+import sys
+from itertools import islice
+
+from .quiz import check_answers
+
+CHUNK_SIZE = 4096
+BUFFER_SIZE = 1 << 20
+
+_TRUE = b', "correct": true}\n'
+_FALSE = b', "correct": false}\n'
+MAX_REPORTED_ERRORS = 10
+
+
+def valid_record(record):
+    # flags are optional, but when present they must have the right type:
+    # "false" is not false, and a bad allow_typos would fail the whole chunk
+    if not (
+        isinstance(record, dict)
+        and isinstance(record.get("answer"), str)
+        and isinstance(record.get("guess"), str)
+    ):
+        return False
+    for key in ("case_sensitive", "allow_partial"):
+        if key in record and not isinstance(record[key], bool):
+            return False
+    if "allow_typos" in record:
+        typos = record["allow_typos"]
+        if not isinstance(typos, int) or isinstance(typos, bool) or typos < 0:
+            return False
+    return True
+
+
+def _error(errors, line_number):
+    errors["count"] += 1
+    if len(errors["lines"]) < MAX_REPORTED_ERRORS:
+        errors["lines"].append(line_number)
+
+
+def parse_chunk(lines, errors, first_line=1):
+    # returns [(raw line, record)] for the chunk's valid records. The whole
+    # chunk is decoded as one JSON array, which is several times faster than
+    # one json.loads per line; only a chunk with a bad line is redone line
+    # by line to find it.
+    numbered = [(n, line.strip()) for n, line in enumerate(lines, first_line)]
+    numbered = [(n, line) for n, line in numbered if line]
+    try:
+        if not all(line[:1] == b"{" and line[-1:] == b"}" for _, line in numbered):
+            raise ValueError("not one object per line")
+        records = json.loads(b"[" + b",".join(line for _, line in numbered) + b"]")
+        if len(records) != len(numbered):
+            raise ValueError("a line held more than one value")
+    except ValueError:
+        records = []
+        for n, line in numbered:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                records.append(None)
+
+    parsed = []
+    for (n, line), record in zip(numbered, records):
+        if valid_record(record):
+            parsed.append((line, record))
+        else:
+            _error(errors, n)
+    return parsed
+
+
+def read_chunks(lines, errors, size=CHUNK_SIZE):
+    iterator = iter(lines)
+    first_line = 1
+    while True:
+        raw = list(islice(iterator, size))
+        if not raw:
+            return
+        yield parse_chunk(raw, errors, first_line)
+        first_line += len(raw)
+
+
+def grade_chunk(chunk, case_sensitive=False, allow_partial=True, allow_typos=0):
+    # records with the same flags are graded together in one check_answers call
+    groups = {}
+    for i, (_, record) in enumerate(chunk):
+        flags = (
+            record.get("case_sensitive", case_sensitive),
+            record.get("allow_partial", allow_partial),
+            record.get("allow_typos", allow_typos),
+        )
+        groups.setdefault(flags, []).append(i)
+
+    results = [False] * len(chunk)
+    for (cs, partial, typos), positions in groups.items():
+        graded = check_answers(
+            [chunk[i][1]["answer"] for i in positions],
+            [chunk[i][1]["guess"] for i in positions],
+            case_sensitive=cs,
+            allow_partial=partial,
+            allow_typos=typos,
+        )
+        for i, is_right in zip(positions, graded):
+            results[i] = is_right
+    return results
+
+
+def grade_stream(lines, out, chunk_size=CHUNK_SIZE, **flags):
+    # the output line is the input line with the field spliced in before its
+    # closing brace, so records are never re-serialized
+    errors = {"count": 0, "lines": []}
+    graded = correct = 0
+    for chunk in read_chunks(lines, errors, chunk_size):
+        results = grade_chunk(chunk, **flags)
+        out.write(b"".join(
+            line[:-1] + (_TRUE if is_right else _FALSE)
+            for (line, _), is_right in zip(chunk, results)
+        ))
+        graded += len(chunk)
+        correct += sum(results)
+    return {"graded": graded, "correct": correct, "errors": errors}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr grade",
+        description="Grade recorded submissions from an NDJSON stream.",
+    )
+    parser.add_argument("--input", "-i", default="-", help="NDJSON file to grade (default: stdin)")
+    parser.add_argument("--output", "-o", default="-", help="File to write graded records to (default: stdout)")
+    parser.add_argument("--case-sensitive", action="store_true", help="Default for records without case_sensitive")
+    parser.add_argument("--no-partial", action="store_true", help="Default for records without allow_partial")
+    parser.add_argument("--allow-typos", type=int, default=0, help="Default for records without allow_typos (default: 0)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"Records graded per batch (default: {CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb", buffering=BUFFER_SIZE)
+    dst = sys.stdout.buffer if args.output == "-" else open(args.output, "wb", buffering=BUFFER_SIZE)
+    try:
+        summary = grade_stream(
+            src,
+            dst,
+            args.chunk_size,
+            case_sensitive=args.case_sensitive,
+            allow_partial=not args.no_partial,
+            allow_typos=args.allow_typos,
+        )
+        dst.flush()
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+
+    errors = summary["errors"]
+    print(f"Graded {summary['graded']} records, {summary['correct']} correct.", file=sys.stderr)
+    if errors["count"]:
+        shown = ", ".join(map(str, errors["lines"]))
+        print(f"Skipped {errors['count']} invalid lines (first: {shown}).", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,108 @@
+"""
+Load generator for the quiz server.
+
+Plays many scripted sessions against `emojiguessr serve` and reports how
+many sessions finish per second and how long the server takes to answer a
+guess. With --local it starts its own server on a free localhost port.
+
+Run with: python -m emojiguessr.loadgen --local --sessions 2000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from .data import _EMOJI_BANK
+from .server import DEFAULT_HOST, DEFAULT_PORT, start_server
+from .session import PROMPT
+
+_PROMPT_LINE = f"{PROMPT}\n".encode("utf-8")
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def play_session(host, port, guesses, latencies, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line != _PROMPT_LINE:
+                continue
+
+            sent = time.perf_counter()
+            writer.write(f"{rng.choice(guesses)}\n".encode("utf-8"))
+            await writer.drain()
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - sent)
+            if not line:
+                return
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, sessions=1000, concurrency=100, seed=None):
+    rng = random.Random(seed)
+    guesses = [answer for items in _EMOJI_BANK.values() for (_, answer) in items]
+    latencies = []
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with limit:
+            await play_session(host, port, guesses, latencies, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "sessions": sessions,
+        "seconds": elapsed,
+        "sessions_per_sec": sessions / elapsed if elapsed else 0.0,
+        "answers": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run_local(sessions=1000, concurrency=100, seed=None, **options):
+    server = await start_server(DEFAULT_HOST, 0, **options)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        return await run_load(DEFAULT_HOST, port, sessions, concurrency, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m emojiguessr.loadgen",
+        description="Drive many concurrent quiz sessions against an emojiguessr server.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--local", action="store_true", help="Start a server on localhost for the run")
+    parser.add_argument("--sessions", "-s", type=int, default=1000, help="Sessions to play (default: 1000)")
+    parser.add_argument("--concurrency", "-c", type=int, default=100, help="Sessions in flight at once (default: 100)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.local:
+        result = asyncio.run(run_local(args.sessions, args.concurrency, args.seed))
+    else:
+        result = asyncio.run(run_load(args.host, args.port, args.sessions, args.concurrency, args.seed))
+
+    print(
+        f"{result['sessions']} sessions in {result['seconds']:.2f}s "
+        f"({result['sessions_per_sec']:.0f} sessions/sec), {result['answers']} answers, "
+        f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
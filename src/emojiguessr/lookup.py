@@ -0,0 +1,68 @@
+"""
+Reverse lookup from a free-text guess to every bank entry it prefix-matches.
+"""
+
+from bisect import bisect_left
+
+from .data import _bank_index
+from .text import normalize
+
+# sorts after any character a real guess can continue with
+_UPPER = "\U0010ffff"
+
+
+class AnswerIndex:
+    # Normalized answers sorted once, with their bank positions alongside, so
+    # all answers sharing a prefix sit in one contiguous run found by bisect.
+    __slots__ = ("keys", "positions", "_bank", "_size")
+
+    def __init__(self, bank):
+        pairs = sorted((answer_n, i) for i, answer_n in enumerate(bank.answers_n))
+        self.keys = [key for key, _ in pairs]
+        self.positions = [i for _, i in pairs]
+        self._bank = bank
+        self._size = len(bank.items)
+
+    def _span(self, guess):
+        prefix = normalize(guess)
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + _UPPER, lo)
+        return lo, hi
+
+    def search(self, guess):
+        lo, hi = self._span(guess)
+        return self.positions[lo:hi]
+
+    def count(self, guess):
+        lo, hi = self._span(guess)
+        return hi - lo
+
+    def answers(self, guess):
+        lo, hi = self._span(guess)
+        return sorted(set(self.keys[lo:hi]))
+
+    def items(self, guess):
+        return [self._bank.items[i] for i in self.search(guess)]
+
+
+_answer_index = None
+
+
+def answer_index():
+    global _answer_index
+    bank = _bank_index()
+    if (
+        _answer_index is None
+        or _answer_index._bank is not bank
+        or _answer_index._size != len(bank.items)
+    ):
+        _answer_index = AnswerIndex(bank)
+    return _answer_index
+
+
+def find_answers(guess):
+    return answer_index().items(guess)
+
+
+def is_ambiguous(guess):
+    return len(answer_index().answers(guess)) > 1
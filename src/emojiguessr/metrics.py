@@ -0,0 +1,128 @@
+"""
+Per-question instrumentation for quiz sessions.
+
+Pass a QuizMetrics to run_quiz (or QuizSession) to record how long each
+phase of a question takes: making the item, checking answers, rendering
+output and waiting for the player. Timings go into fixed-size log-linear
+histograms (HDR style), so memory stays constant however many sessions
+report into one QuizMetrics. Without a metrics object nothing is timed.
+"""
+
+from array import array
+
+# values below 2**SUB_BITS are stored exactly; above that every power-of-two
+# range is split into 2**(SUB_BITS - 1) buckets, i.e. ~1.6% relative error
+SUB_BITS = 7
+SUB_COUNT = 1 << SUB_BITS
+HALF_COUNT = SUB_COUNT >> 1
+MAX_SHIFT = 40
+
+PHASES = ("item", "check", "render", "think")
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * (SUB_COUNT + MAX_SHIFT * HALF_COUNT)))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def _bucket(value):
+        if value < SUB_COUNT:
+            return value
+        shift = min(value.bit_length() - SUB_BITS, MAX_SHIFT)
+        top = min(value >> shift, SUB_COUNT - 1)
+        return SUB_COUNT + (shift - 1) * HALF_COUNT + (top - HALF_COUNT)
+
+    @staticmethod
+    def _value(bucket):
+        if bucket < SUB_COUNT:
+            return bucket
+        shift, offset = divmod(bucket - SUB_COUNT, HALF_COUNT)
+        shift += 1
+        # middle of the range the bucket covers
+        return ((offset + HALF_COUNT) << shift) + (1 << (shift - 1))
+
+    def record(self, value):
+        value = max(0, int(value))
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self._value(bucket), self.max)
+        return self.max
+
+
+class QuizMetrics:
+    # Phase timings are recorded in microseconds.
+
+    def __init__(self):
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.attempts = Histogram()
+        self.questions = 0
+        self.correct = 0
+
+    def observe(self, phase, seconds):
+        self.phases[phase].record(seconds * 1_000_000)
+
+    def question_done(self, attempts, correct):
+        self.questions += 1
+        self.attempts.record(attempts)
+        if correct:
+            self.correct += 1
+
+    def merge(self, other):
+        for phase, histogram in other.phases.items():
+            self.phases[phase].merge(histogram)
+        self.attempts.merge(other.attempts)
+        self.questions += other.questions
+        self.correct += other.correct
+
+    def summary(self):
+        phases = {}
+        for phase, h in self.phases.items():
+            phases[phase] = {
+                "count": h.count,
+                "mean_us": h.mean(),
+                "p50_us": h.percentile(50),
+                "p90_us": h.percentile(90),
+                "p99_us": h.percentile(99),
+                "max_us": h.max or 0,
+            }
+        return {
+            "questions": self.questions,
+            "correct": self.correct,
+            "accuracy": self.correct / self.questions if self.questions else 0.0,
+            "mean_attempts": self.attempts.mean(),
+            "phases": phases,
+        }
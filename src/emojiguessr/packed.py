@@ -0,0 +1,146 @@
+"""
+Compact binary emoji banks that can be memory-mapped instead of loaded.
+
+File layout (all integers little-endian uint32):
+
+    header   magic "EGB1", version, theme count, item count
+    themes   (start, stop) item range per theme
+    offsets  boundaries of every string in the heap: theme names first,
+             then emoji/answer pairs for each item
+    heap     UTF-8 bytes of all strings back to back
+"""
+
+import mmap
+import os
+import struct
+from array import array
+
+from .data import _EMOJI_BANK, _as_rng
+
+MAGIC = b"EGB1"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_RANGE = struct.Struct("<II")
+_SPAN = struct.Struct("<II")
+
+
+def compile_bank(path, bank=None):
+    if bank is None:
+        bank = _EMOJI_BANK
+
+    heap = bytearray()
+    offsets = array("I", [0])
+    ranges = array("I")
+
+    def push(text):
+        heap.extend(text.encode("utf-8"))
+        if len(heap) > 0xFFFFFFFF:
+            raise ValueError("bank is too large for the EGB1 format")
+        offsets.append(len(heap))
+
+    for theme in bank:
+        push(theme)
+
+    count = 0
+    for items in bank.values():
+        ranges.extend((count, count + len(items)))
+        for emoji, answer in items:
+            push(emoji)
+            push(answer)
+        count += len(items)
+
+    if offsets.itemsize != 4 or ranges.itemsize != 4:
+        raise RuntimeError("array('I') must be 32 bits wide")
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        offsets.byteswap()
+        ranges.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(bank), count))
+        f.write(ranges.tobytes())
+        f.write(offsets.tobytes())
+        f.write(heap)
+    return count
+
+
+class MappedBank:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"{path} is not an EGB{VERSION} emoji bank")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load(path)
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def _load(self, path):
+        magic, version, _, n_themes, n_items = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an EGB{VERSION} emoji bank")
+
+        self._n_themes = n_themes
+        self._n_items = n_items
+        self._offsets = _HEADER.size + n_themes * _RANGE.size
+        self._heap = self._offsets + (n_themes + 2 * n_items + 1) * 4
+        if len(self._mm) < self._heap:
+            raise ValueError(f"{path} is truncated")
+
+        # theme names are the only strings decoded up front
+        self.ranges = {}
+        for t in range(n_themes):
+            start, stop = _RANGE.unpack_from(self._mm, _HEADER.size + t * _RANGE.size)
+            try:
+                name = self._string(t)
+            except UnicodeDecodeError:
+                raise ValueError(f"{path} is damaged") from None
+            self.ranges[name] = (start, stop)
+
+    def __len__(self):
+        return self._n_items
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mm.close()
+
+    def themes(self):
+        return list(self.ranges)
+
+    def _string(self, j):
+        lo, hi = _SPAN.unpack_from(self._mm, self._offsets + 4 * j)
+        return self._mm[self._heap + lo : self._heap + hi].decode("utf-8")
+
+    def emoji(self, i):
+        return self._string(self._n_themes + 2 * i)
+
+    def answer(self, i):
+        return self._string(self._n_themes + 2 * i + 1)
+
+    def item(self, i):
+        if not 0 <= i < self._n_items:
+            raise IndexError(i)
+        return self.emoji(i), self.answer(i)
+
+    def theme_range(self, theme, fallback=None):
+        start, stop = self.ranges.get(theme, (0, 0))
+        if start == stop:
+            if fallback is None:
+                return 0, self._n_items
+            return self.ranges[fallback]
+        return start, stop
+
+    def random_emojis(self, count=3, theme="food", rng=None):
+        start, stop = self.theme_range(theme)
+        k = max(0, min(count, stop - start))
+        return [self.emoji(i) for i in _as_rng(rng).sample(range(start, stop), k)]
+
+    def get_theme_item(self, theme="food", rng=None):
+        start, stop = self.theme_range(theme, fallback="food")
+        return self.item(start + _as_rng(rng).randrange(stop - start))
@@ -0,0 +1,164 @@
+"""
+Theme packs loaded from CSV / JSON files.
+
+register_pack() only records where a theme lives; the file is parsed the
+first time get_theme_item / random_emojis (or make_quiz_items) asks for that
+theme. Files are streamed row by row rather than read whole:
+
+    .csv            emoji,answer rows (an "emoji,answer" header is skipped)
+    .jsonl/.ndjson  one [emoji, answer] or {"emoji": ..., "answer": ...} per line
+    .json           a top-level array of the same records
+
+Parsed packs are cached on disk with marshal, keyed by the source path and
+checked against its size and mtime, so warm starts skip parsing entirely.
+"""
+
+import csv
+import hashlib
+import json
+import marshal
+import os
+from pathlib import Path
+
+from . import data
+
+CACHE_VERSION = 2
+SUFFIXES = (".csv", ".jsonl", ".ndjson", ".json")
+_CHUNK = 1 << 16
+
+
+def default_cache_dir():
+    env = os.environ.get("EMOJIGUESSR_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "emojiguessr"
+
+
+def _record(row, path):
+    # rows are [emoji, answer] lists (CSV rows too) or {"emoji", "answer"}
+    # objects; anything else, even a two-character string, is rejected
+    if isinstance(row, dict):
+        row = [row.get("emoji"), row.get("answer")]
+    if not isinstance(row, list) or len(row) != 2 or not all(isinstance(v, str) for v in row):
+        raise ValueError(f"{path}: expected an emoji and an answer, got {row!r}")
+    return row[0], row[1]
+
+
+def _iter_csv(f, path):
+    for n, row in enumerate(csv.reader(f)):
+        if not row:
+            continue
+        if n == 0 and [v.strip().lower() for v in row] == ["emoji", "answer"]:
+            continue
+        yield _record(row, path)
+
+
+def _iter_jsonl(f, path):
+    for line in f:
+        if line.strip():
+            yield _record(json.loads(line), path)
+
+
+def _iter_json_array(f, path):
+    # decode one array element at a time from a sliding window of the file
+    decoder = json.JSONDecoder()
+    buf = f.read(_CHUNK).lstrip()
+    if not buf.startswith("["):
+        raise ValueError(f"{path}: expected a JSON array of records")
+    pos = 1
+    eof = False
+    last = "["  # the last token: "[", "," or a record (None)
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n":
+            pos += 1
+        end = None
+        if pos < len(buf):
+            if buf[pos] == "]" and last != ",":
+                return
+            if last is None:
+                if buf[pos] != ",":
+                    raise ValueError(f"{path}: expected ',' or ']' between records")
+                pos += 1
+                last = ","
+                continue
+            try:
+                row, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError(f"{path}: truncated or invalid JSON array")
+        elif eof:
+            raise ValueError(f"{path}: truncated or invalid JSON array")
+        if end is None or (end == len(buf) and not eof):
+            # refill, dropping what has been consumed so the window stays small
+            chunk = f.read(_CHUNK)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+        yield _record(row, path)
+        pos = end
+        last = None
+
+
+def iter_pack(path):
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in SUFFIXES:
+        raise ValueError(f"{path}: unsupported theme pack type {suffix!r}")
+    with open(path, encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            yield from _iter_csv(f, path)
+        elif suffix == ".json":
+            yield from _iter_json_array(f, path)
+        else:
+            yield from _iter_jsonl(f, path)
+
+
+def _cache_file(path, cache_dir):
+    key = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:32]
+    return Path(cache_dir) / f"{key}.pack"
+
+
+def load_pack(path, cache_dir=None):
+    path = Path(path).resolve()
+    stat = path.stat()
+    stamp = (CACHE_VERSION, str(path), stat.st_size, stat.st_mtime_ns)
+    cache = _cache_file(path, default_cache_dir() if cache_dir is None else cache_dir)
+
+    try:
+        # marshal.load() on a file object reads object by object; one read()
+        # and loads() is several times faster
+        with open(cache, "rb") as f:
+            cached_stamp, items = marshal.loads(f.read())
+        if cached_stamp == stamp:
+            return items
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    items = list(iter_pack(path))
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps((stamp, items)))
+        os.replace(tmp, cache)
+    except OSError:
+        # a read-only or full cache dir only costs us the warm start
+        pass
+    return items
+
+
+def register_pack(path, theme=None, cache_dir=None):
+    path = Path(path)
+    theme = path.stem if theme is None else theme
+    data.register_lazy_theme(theme, lambda: load_pack(path, cache_dir))
+    return theme
+
+
+def register_pack_dir(directory, cache_dir=None):
+    registered = []
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix.lower() in SUFFIXES:
+            registered.append(register_pack(path, cache_dir=cache_dir))
+    return registered
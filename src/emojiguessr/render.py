@@ -0,0 +1,52 @@
+"""
+Text of the quiz output.
+
+QuizSession builds its lines from a per-session Templates object, which
+formats the parts that never change during a session (the "/n" of
+"Question i/n", the theme line) once instead of on every question.
+write_frame hands all the lines of one step to output_fn in a single call;
+with print (or any writer that ends each call with a newline) the text that
+comes out is exactly the same as writing the lines one by one.
+"""
+
+CORRECT = "✅ Correct!"
+
+
+class Templates:
+    __slots__ = ("num_questions", "theme", "_total", "_theme_line")
+
+    def __init__(self, num_questions, theme):
+        self.num_questions = num_questions
+        self.theme = theme
+        self._total = f"/{num_questions}"
+        self._theme_line = f"Theme: {theme}"
+
+    def question(self, number):
+        return f"\nQuestion {number}{self._total}"
+
+    def theme_line(self, theme):
+        return self._theme_line if theme == self.theme else f"Theme: {theme}"
+
+    @staticmethod
+    def clue(clue):
+        return f"Emoji: {clue}"
+
+    @staticmethod
+    def wrong(attempts_left):
+        return f"❌ Wrong! {attempts_left} attempts left."
+
+    @staticmethod
+    def nope(answer):
+        return f"❌ Nope — it was: {answer}"
+
+    @staticmethod
+    def time_up(answer):
+        return f"⏰ Time's up — it was: {answer}"
+
+    def final(self, score):
+        return f"\nFinal score: {score}{self._total}"
+
+
+def write_frame(lines, output_fn):
+    if lines:
+        output_fn("\n".join(lines))
@@ -0,0 +1,182 @@
+"""
+Question schedulers: which bank item a session asks next.
+
+A scheduler (strategy) has draw(), returning a bank position, and
+record(index, correct), called with how each question went.
+make_quiz_item(theme, strategy=...) turns a drawn position into a quiz item.
+QuizSession gives every session its own Deck unless told otherwise; pass an
+AdaptiveScheduler to run_quiz / QuizSession to favour items players miss.
+"""
+
+import threading
+
+from .data import _as_rng, _bank_index, _theme_index
+
+
+class Deck:
+    # Draws a theme's items without replacement, reshuffling once every item
+    # has been drawn. The shuffle is a lazy Fisher-Yates over positions in
+    # the theme: only the slots a draw has swapped are stored, so a deck
+    # costs O(draws) memory and O(1) per draw whatever the bank size.
+
+    def __init__(self, theme="food", rng=None):
+        self.theme = theme
+        self.rng = _as_rng(rng)
+        self._bank = None
+        self._reset()
+
+    def _reset(self):
+        bank = _theme_index(self.theme)
+        start, stop = bank.theme_range(self.theme, fallback="food")
+        if stop <= start:
+            raise ValueError(f"theme {self.theme!r} has no items")
+        self._bank = bank
+        self.start = start
+        self.size = stop - start
+        self.drawn = 0
+        self._swaps = {}
+
+    def __len__(self):
+        # items left before the next reshuffle
+        return self.size - self.drawn
+
+    def draw(self):
+        if self._bank is not _bank_index():
+            # the bank was rebuilt, so our positions may be stale
+            self._reset()
+        if self.drawn == self.size:
+            self.drawn = 0
+            self._swaps.clear()
+
+        swaps = self._swaps
+        i = self.drawn
+        j = self.rng.randrange(i, self.size)
+        picked = swaps.get(j, j)
+        # slot j now holds whatever was in slot i; slot i is never read again
+        moved = swaps.pop(i, i)
+        if j != i:
+            swaps[j] = moved
+        self.drawn = i + 1
+        return self.start + picked
+
+    def record(self, index, correct):
+        pass
+
+
+class ItemStats:
+    # Accuracy per answer, shared by every scheduler that should learn from
+    # the same pool of players.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seen = {}
+        self.correct = {}
+
+    def record(self, answer, correct):
+        with self._lock:
+            self.seen[answer] = self.seen.get(answer, 0) + 1
+            if correct:
+                self.correct[answer] = self.correct.get(answer, 0) + 1
+
+    def miss_rate(self, answer):
+        # smoothed, so unseen items start at 1/2 rather than 0 or 1
+        seen = self.seen.get(answer, 0)
+        return (seen - self.correct.get(answer, 0) + 1) / (seen + 2)
+
+
+class _WeightTree:
+    # Fenwick tree over float weights: O(log n) updates and weighted picks.
+
+    def __init__(self, weights):
+        n = len(weights)
+        self.weights = list(weights)
+        tree = [0.0] + self.weights
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def total(self):
+        i = len(self.weights)
+        total = 0.0
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def set(self, pos, weight):
+        delta = weight - self.weights[pos]
+        self.weights[pos] = weight
+        i = pos + 1
+        n = len(self.weights)
+        while i <= n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        # first position whose running total exceeds target
+        pos = 0
+        step = self._top
+        n = len(self.weights)
+        while step:
+            nxt = pos + step
+            if nxt <= n and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(pos, n - 1)
+
+
+class AdaptiveScheduler:
+    # Picks items with probability proportional to
+    #     miss rate across all players (ItemStats) * 2 ** -streak
+    # where streak counts this player's consecutive correct answers to the
+    # item (Leitner-box style: a miss puts it back in box 0). The item just
+    # asked is held out of the next draw so misses aren't repeated at once.
+
+    MIN_WEIGHT = 1e-3
+
+    def __init__(self, theme="food", rng=None, stats=None):
+        self.theme = theme
+        self.rng = _as_rng(rng)
+        self.stats = ItemStats() if stats is None else stats
+        self.streaks = {}
+
+        bank = _theme_index(theme)
+        start, stop = bank.theme_range(theme, fallback="food")
+        if stop <= start:
+            raise ValueError(f"theme {theme!r} has no items")
+        self.start = start
+        self._answers = [answer for (_, answer) in bank.items[start:stop]]
+        self._tree = _WeightTree([self._weight(answer) for answer in self._answers])
+        self._held = None
+
+    def _weight(self, answer):
+        weight = self.stats.miss_rate(answer) * 0.5 ** self.streaks.get(answer, 0)
+        return max(weight, self.MIN_WEIGHT)
+
+    def weight(self, index):
+        return self._tree.weights[index - self.start]
+
+    def draw(self):
+        tree = self._tree
+        pos = tree.find(self.rng.random() * tree.total())
+        if tree.weights[pos] == 0.0:
+            # rounding pushed us onto the held-out item; take a neighbour
+            pos = pos - 1 if pos else pos + 1
+        if self._held is not None:
+            tree.set(self._held, self._weight(self._answers[self._held]))
+        if len(self._answers) > 1:
+            tree.set(pos, 0.0)
+            self._held = pos
+        return self.start + pos
+
+    def record(self, index, correct):
+        pos = index - self.start
+        answer = self._answers[pos]
+        self.stats.record(answer, correct)
+        self.streaks[answer] = self.streaks.get(answer, 0) + 1 if correct else 0
+        if pos != self._held:
+            self._tree.set(pos, self._weight(answer))
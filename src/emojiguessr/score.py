@@ -1,4 +1,210 @@
+import operator
+import os
+import tempfile
+import threading
+
+
 def score(current_score, correct=True, points=1):
     if correct:
         return current_score + points
     return current_score
+
+
+class Scoreboard:
+    # Running totals for many players. Players are grouped by score, and a
+    # Fenwick tree over score values counts the players at each score, so
+    # updates and rank queries cost O(log max_score) and top-K walks only the
+    # highest scores. Ties rank equal; within a tie, whoever reached the score
+    # first is listed first. The tree is dense, so scores are capped at
+    # MAX_SCORE (a tree of 2**20 counters).
+    #
+    # With a snapshot_path and snapshot_interval, a background thread saves
+    # the board at most once per interval while it is changing, so updates
+    # never wait on the file; close() stops it and saves a last snapshot.
+
+    MAX_SCORE = (1 << 20) - 1
+
+    def __init__(self, snapshot_path=None, snapshot_interval=None):
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._scores = {}
+        self._buckets = {}
+        self._size = 1024
+        self._tree = [0] * (self._size + 1)
+
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self._changed = threading.Event()
+        self._closed = threading.Event()
+        self._snapshotter = None
+        if snapshot_path is not None and snapshot_interval is not None:
+            self._snapshotter = threading.Thread(target=self._snapshot_periodically, daemon=True)
+            self._snapshotter.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, player):
+        return player in self._scores
+
+    def get(self, player, default=0):
+        return self._scores.get(player, default)
+
+    def record(self, player, correct=True, points=1):
+        with self._lock:
+            old = self._scores.get(player)
+            new = score(0 if old is None else old, correct=correct, points=points)
+            if new != old:
+                self._move(player, old, new)
+        if self._snapshotter is not None:
+            self._changed.set()
+        return new
+
+    def set_score(self, player, value):
+        with self._lock:
+            old = self._scores.get(player)
+            if value != old:
+                self._move(player, old, value)
+        if self._snapshotter is not None:
+            self._changed.set()
+
+    def rank(self, player):
+        with self._lock:
+            value = self._scores[player]
+            return len(self._scores) - self._prefix(value + 1) + 1
+
+    def top(self, k=10):
+        result = []
+        with self._lock:
+            remaining = len(self._scores)
+            while remaining and len(result) < k:
+                value = self._find(remaining) - 1
+                bucket = self._buckets[value]
+                for player in bucket:
+                    result.append((player, value))
+                    if len(result) == k:
+                        break
+                remaining -= len(bucket)
+        return result
+
+    def _move(self, player, old, new):
+        # validate before touching anything, so a bad update can't leave the
+        # buckets and the tree out of step
+        try:
+            new = operator.index(new)
+        except TypeError:
+            raise TypeError(f"scores on a Scoreboard must be integers, not {type(new).__name__}") from None
+        if new < 0:
+            raise ValueError("scores on a Scoreboard can't go below zero")
+        if new > self.MAX_SCORE:
+            raise ValueError(f"scores on a Scoreboard can't go above {self.MAX_SCORE}")
+        if old is not None:
+            bucket = self._buckets[old]
+            del bucket[player]
+            if not bucket:
+                del self._buckets[old]
+            self._add(old + 1, -1)
+
+        if new + 1 > self._size:
+            self._grow(new + 1)
+        self._buckets.setdefault(new, {})[player] = None
+        self._add(new + 1, 1)
+        self._scores[player] = new
+
+    def _add(self, i, delta):
+        tree, size = self._tree, self._size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, i):
+        tree = self._tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _find(self, count):
+        # smallest position whose prefix count reaches `count`
+        tree, size = self._tree, self._size
+        pos = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] < count:
+                pos = nxt
+                count -= tree[nxt]
+            step >>= 1
+        return pos + 1
+
+    def _grow(self, needed):
+        size = self._size
+        while size < needed:
+            size *= 2
+        tree = [0] * (size + 1)
+        for value, bucket in self._buckets.items():
+            tree[value + 1] = len(bucket)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._size = size
+        self._tree = tree
+
+    def _snapshot_periodically(self):
+        # sleep until the board changes, then let an interval's worth of
+        # changes pile up before saving them
+        while True:
+            self._changed.wait()
+            if self._closed.wait(self.snapshot_interval):
+                return
+            self._changed.clear()
+            self.snapshot()
+
+    def close(self):
+        if self._snapshotter is None:
+            return
+        self._closed.set()
+        self._changed.set()
+        self._snapshotter.join()
+        self._snapshotter = None
+        self.snapshot()
+
+    def snapshot(self, path=None):
+        import json
+
+        path = os.fspath(self.snapshot_path if path is None else path)
+        # one snapshot at a time, so an older one can't be published last
+        with self._snapshot_lock:
+            with self._lock:
+                rows = [[value, list(bucket)] for value, bucket in self._buckets.items()]
+
+            # write to a private file next to the target and rename, so
+            # readers never see half a file
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".board-", suffix=".tmp")
+            try:
+                with open(fd, "w", encoding="utf-8") as f:
+                    json.dump(rows, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        import json
+
+        board = cls(**kwargs)
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+        for value, players in rows:
+            for player in players:
+                board._move(player, None, value)
+        return board
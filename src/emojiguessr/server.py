@@ -0,0 +1,104 @@
+"""
+Multiplayer quiz server over a line-based TCP protocol.
+
+Every connection gets its own QuizSession. The server sends the session's
+output one line at a time; a line that is exactly the guess prompt
+("Your guess: ") means the server is waiting for one line with the guess.
+The connection is closed after the final score, or when the client stays
+silent for longer than the idle timeout.
+"""
+
+import argparse
+import asyncio
+import contextlib
+
+from .quiz import QUIZ_DEFAULTS
+from .session import QuizSession
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5555
+MAX_LINE = 1024
+
+
+async def _send(writer, lines):
+    writer.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+    # wait for the socket buffer to drain so a slow reader can't make us
+    # queue unbounded output
+    await writer.drain()
+
+
+async def handle_player(reader, writer, options, idle_timeout):
+    try:
+        # inside the try: a theme pack that fails to load must still close
+        # the connection
+        session = QuizSession(**options)
+        pending = session.start()
+        while not session.done:
+            # one write per turn: the result of the last guess plus the prompt
+            await _send(writer, pending + [session.prompt])
+            line = await asyncio.wait_for(reader.readline(), idle_timeout)
+            if not line:
+                return
+            guess = line.decode("utf-8", "replace").rstrip("\r\n")
+            pending = session.answer(guess)
+        await _send(writer, pending)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ConnectionError):
+            await _send(writer, ["Idle for too long, bye!"])
+    except (ConnectionError, ValueError):
+        # ValueError: the client sent a line longer than MAX_LINE
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=60.0, **options):
+    options = {**QUIZ_DEFAULTS, **options}
+
+    async def on_connect(reader, writer):
+        await handle_player(reader, writer, options, idle_timeout)
+
+    return await asyncio.start_server(on_connect, host, port, limit=MAX_LINE)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=60.0, **options):
+    server = await start_server(host, port, idle_timeout, **options)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving emojiguessr on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    from .__main__ import add_quiz_arguments, quiz_options
+
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr serve",
+        description="Host emoji quizzes for many players over a line-based TCP protocol.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", "-p", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds to wait for a guess before dropping the player (default: 60)",
+    )
+    parser.add_argument("--log", help="Append every answer from every player to this binary event log")
+    add_quiz_arguments(parser)
+    args = parser.parse_args(argv)
+
+    options = quiz_options(args)
+    if args.log:
+        from .eventlog import EventLog
+        options["log"] = EventLog(args.log)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout, **options))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.log:
+            options["log"].close()
@@ -0,0 +1,178 @@
+"""
+Transport-independent quiz engine.
+
+A QuizSession holds the whole state of one game and never blocks: start()
+and answer() return the lines to show and leave the session waiting for the
+next guess, so any driver (a terminal loop, a socket, an event loop) can run
+as many sessions side by side as it likes.
+"""
+
+import os
+from time import perf_counter
+
+from .data import _as_rng
+from .quiz import make_quiz_item, check_answer
+from .render import CORRECT, Templates
+from .schedule import Deck
+from .score import score
+
+PROMPT = "Your guess: "
+
+
+class QuizSession:
+    def __init__(self, num_questions, theme, case_sensitive, allow_partial, max_attempts, make_item=make_quiz_item, metrics=None, strategy=None, rng=None, log=None, session_id=None):
+        self.num_questions = num_questions
+        self.theme = theme
+        self.case_sensitive = case_sensitive
+        self.allow_partial = allow_partial
+        self.max_attempts = max_attempts
+        self.make_item = make_item
+        self.metrics = metrics
+        # a seed becomes this session's own generator, so it yields a
+        # sequence of items rather than the same one every question
+        self.rng = None if rng is None else _as_rng(rng)
+        if strategy is None and make_item is make_quiz_item:
+            # no repeats within a session until the theme runs out
+            strategy = Deck(theme, rng=self.rng)
+        self.strategy = strategy
+        # an EventLog gets one record per guess
+        self.log = log
+        if log is not None and session_id is None:
+            session_id = int.from_bytes(os.urandom(8), "little")
+        self.session_id = session_id
+        self._asked = None
+
+        self.prompt = PROMPT
+        self.templates = Templates(num_questions, theme)
+        self.score = 0
+        self.question = 0
+        self.item = None
+        self.attempts_left = 0
+        self.started = False
+        self.done = False
+
+    @property
+    def waiting(self):
+        return self.started and not self.done
+
+    def start(self):
+        if self.started:
+            raise RuntimeError("session already started")
+        self.started = True
+        out = []
+        self._next_question(out)
+        return out
+
+    def answer(self, guess):
+        if not self.waiting:
+            raise RuntimeError("session is not waiting for a guess")
+
+        out = []
+        metrics = self.metrics
+        if metrics is not None:
+            started = perf_counter()
+        is_right = check_answer(
+            correct=self.item["answer"],
+            guess=guess,
+            case_sensitive=self.case_sensitive,
+            allow_partial=self.allow_partial,
+        )
+        if metrics is not None:
+            metrics.observe("check", perf_counter() - started)
+        if self.log is not None:
+            self._log_guess(guess, is_right)
+        self.score = score(self.score, correct=is_right)
+
+        if is_right:
+            if self.strategy is not None:
+                self.strategy.record(self.item.index, True)
+            out.append(CORRECT)
+            if metrics is not None:
+                metrics.question_done(self.max_attempts - self.attempts_left + 1, True)
+            self._next_question(out)
+        else:
+            self.attempts_left -= 1
+            if self.attempts_left > 0:
+                out.append(self.templates.wrong(self.attempts_left))
+            else:
+                if self.strategy is not None:
+                    self.strategy.record(self.item.index, False)
+                out.append(self.templates.nope(self.item["answer"]))
+                if metrics is not None:
+                    metrics.question_done(self.max_attempts, False)
+                self._next_question(out)
+        return out
+
+    def timeout(self):
+        # the player ran out of time: the question counts as a miss
+        if not self.waiting:
+            raise RuntimeError("session is not waiting for a guess")
+
+        out = []
+        if self.log is not None:
+            self._log_guess("", False, timeout=True)
+        self.score = score(self.score, correct=False)
+        if self.strategy is not None:
+            self.strategy.record(self.item.index, False)
+        out.append(self.templates.time_up(self.item["answer"]))
+        if self.metrics is not None:
+            self.metrics.question_done(self.max_attempts - self.attempts_left, False)
+        self._next_question(out)
+        return out
+
+    def _log_guess(self, guess, is_right, timeout=False):
+        now = perf_counter()
+        partial = is_right and self.allow_partial and not check_answer(
+            self.item["answer"], guess, self.case_sensitive, allow_partial=False
+        )
+        index = getattr(self.item, "index", None)
+        if index is None:
+            theme = self.item.get("theme", self.theme)
+        else:
+            # logged by theme and position within it, which don't depend on
+            # the order packs were loaded in
+            theme, index = self.item.locate()
+        self.log.append(
+            self.session_id,
+            theme,
+            index,
+            guess,
+            is_right,
+            self.max_attempts - self.attempts_left + 1,
+            (now - self._asked) * 1_000_000,
+            partial=partial,
+            timeout=timeout,
+        )
+        self._asked = now
+
+    def _make_item(self):
+        if self.strategy is not None:
+            return self.make_item(theme=self.theme, strategy=self.strategy)
+        if self.rng is not None:
+            return self.make_item(theme=self.theme, rng=self.rng)
+        return self.make_item(theme=self.theme)
+
+    def _next_question(self, out):
+        while self.question < self.num_questions:
+            self.question += 1
+            if self.metrics is None:
+                self.item = self._make_item()
+            else:
+                started = perf_counter()
+                self.item = self._make_item()
+                self.metrics.observe("item", perf_counter() - started)
+            item = self.item
+            templates = self.templates
+            out.append(templates.question(self.question))
+            out.append(templates.theme_line(item["theme"]))
+            out.append(templates.clue(item["clue"]))
+
+            self.attempts_left = self.max_attempts
+            if self.attempts_left > 0:
+                if self.log is not None:
+                    self._asked = perf_counter()
+                return
+
+        self.item = None
+        self.done = True
+        out.append(self.templates.final(self.score))
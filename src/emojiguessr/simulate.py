@@ -0,0 +1,205 @@
+"""
+Headless bot players for difficulty calibration.
+
+Simulated players play full games through the same QuizSession engine that
+run_quiz drives, so every guess is graded by the real check_answer. Each bot
+knows the answer with probability `accuracy`; when it does it may type only
+a prefix of it (`partial_rate`) and may make one typo (`typo_rate`),
+otherwise it guesses another answer from the theme.
+
+Sessions are split into shards that run on a ProcessPoolExecutor. Every
+shard seeds its own random streams from (seed, shard number), so a run is
+reproducible for a given seed and shard count whatever the worker count,
+and the per-item tallies the shards return are summed at the end.
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .session import QuizSession
+
+BOT_DEFAULTS = dict(accuracy=0.7, typo_rate=0.1, partial_rate=0.1)
+SHARDS_PER_WORKER = 4
+
+
+def _typo(answer, rng):
+    # one deletion, substitution, insertion or adjacent swap; always changes
+    # the answer
+    if not answer:
+        return rng.choice(string.ascii_lowercase)
+    i = rng.randrange(len(answer))
+    kind = rng.randrange(4)
+    if kind == 1:
+        letters = string.ascii_lowercase.replace(answer[i].lower(), "")
+        return answer[:i] + rng.choice(letters) + answer[i + 1:]
+    if kind == 2:
+        return answer[:i] + rng.choice(string.ascii_lowercase) + answer[i:]
+    if kind == 3 and i + 1 < len(answer) and answer[i] != answer[i + 1]:
+        return answer[:i] + answer[i + 1] + answer[i] + answer[i + 2:]
+    return answer[:i] + answer[i + 1:]
+
+
+class Bot:
+    def __init__(self, rng, accuracy, typo_rate, partial_rate):
+        self.rng = rng
+        self.accuracy = accuracy
+        self.typo_rate = typo_rate
+        self.partial_rate = partial_rate
+
+    def guess(self, answer, decoys):
+        rng = self.rng
+        if rng.random() >= self.accuracy:
+            return rng.choice(decoys)
+        if self.partial_rate and rng.random() < self.partial_rate:
+            answer = answer[: max(1, len(answer) // 2)]
+        if self.typo_rate and rng.random() < self.typo_rate:
+            answer = _typo(answer, rng)
+        return answer
+
+
+def _shard_seed(seed, shard):
+    # string seeds are hashed with SHA-512, so neighbouring shards get
+    # unrelated streams
+    return f"{seed}:{shard}"
+
+
+def run_shard(shard, sessions, seed, quiz, bot):
+    from .data import _theme_index
+
+    items_rng = random.Random(_shard_seed(seed, shard) + ":items")
+    bot = Bot(random.Random(_shard_seed(seed, shard) + ":bot"), **bot)
+
+    # _theme_index loads a lazy pack theme first, so decoys come from the
+    # same theme as the items the Deck draws
+    index = _theme_index(quiz["theme"])
+    start, stop = index.theme_range(quiz["theme"], fallback="food")
+    decoys = [answer for (_, answer) in index.items[start:stop]]
+
+    stats = {}
+    total_score = 0
+    for _ in range(sessions):
+        session = QuizSession(**quiz, rng=items_rng)
+        session.start()
+        while not session.done:
+            item = session.item
+            answer = item["answer"]
+            entry = stats.get(answer)
+            if entry is None:
+                entry = stats[answer] = [item["clue"], 0, 0, 0]
+            if session.attempts_left == session.max_attempts:
+                entry[1] += 1
+            entry[3] += 1
+            before = session.score
+            session.answer(bot.guess(answer, decoys))
+            if session.score > before:
+                entry[2] += 1
+        total_score += session.score
+    return stats, sessions, total_score
+
+
+def merge_stats(results):
+    merged = {}
+    sessions = 0
+    correct = 0
+    for stats, shard_sessions, shard_correct in results:
+        sessions += shard_sessions
+        correct += shard_correct
+        for answer, (clue, shown, right, attempts) in stats.items():
+            entry = merged.get(answer)
+            if entry is None:
+                merged[answer] = [clue, shown, right, attempts]
+            else:
+                entry[1] += shown
+                entry[2] += right
+                entry[3] += attempts
+    return merged, sessions, correct
+
+
+def _split(total, parts):
+    size, extra = divmod(total, parts)
+    return [size + (i < extra) for i in range(parts)]
+
+
+def simulate(sessions, workers=None, seed=0, shards=None, quiz=None, bot=None):
+    from .quiz import QUIZ_DEFAULTS
+
+    quiz = {**QUIZ_DEFAULTS, **(quiz or {})}
+    quiz.pop("rng", None)
+    bot = {**BOT_DEFAULTS, **(bot or {})}
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers * SHARDS_PER_WORKER
+    sizes = [n for n in _split(sessions, shards) if n]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [run_shard(i, n, seed, quiz, bot) for i, n in enumerate(sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_shard, i, n, seed, quiz, bot) for i, n in enumerate(sizes)]
+            results = [f.result() for f in futures]
+    elapsed = time.perf_counter() - started
+
+    merged, played, correct = merge_stats(results)
+    questions = played * quiz["num_questions"]
+    items = [
+        {
+            "answer": answer,
+            "clue": clue,
+            "shown": shown,
+            "correct": right,
+            "correct_rate": right / shown if shown else 0.0,
+            "attempts_per_question": attempts / shown if shown else 0.0,
+        }
+        for answer, (clue, shown, right, attempts) in merged.items()
+    ]
+    items.sort(key=lambda item: (item["correct_rate"], item["answer"]))
+    return {
+        "sessions": played,
+        "questions": questions,
+        "correct": correct,
+        "accuracy": correct / questions if questions else 0.0,
+        "workers": workers,
+        "seconds": elapsed,
+        "items": items,
+    }
+
+
+def main(argv=None):
+    from .__main__ import add_quiz_arguments, quiz_options
+
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr simulate",
+        description="Play many games with simulated players and report how hard each item is.",
+    )
+    parser.add_argument("--sessions", "-s", type=int, default=10000, help="Games to simulate (default: 10000)")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--accuracy", type=float, default=BOT_DEFAULTS["accuracy"], help="Chance a bot knows the answer (default: 0.7)")
+    parser.add_argument("--typo-rate", type=float, default=BOT_DEFAULTS["typo_rate"], help="Chance a known answer is typed with one typo (default: 0.1)")
+    parser.add_argument("--partial-rate", type=float, default=BOT_DEFAULTS["partial_rate"], help="Chance a known answer is cut to its first half (default: 0.1)")
+    parser.add_argument("--top", type=int, default=10, help="Hardest items to print (default: 10)")
+    parser.add_argument("--output", "-o", help="File to write the full JSON report to")
+    add_quiz_arguments(parser)
+    args = parser.parse_args(argv)
+
+    bot = dict(accuracy=args.accuracy, typo_rate=args.typo_rate, partial_rate=args.partial_rate)
+    seed = 0 if args.seed is None else args.seed
+    report = simulate(args.sessions, args.workers, seed, quiz=quiz_options(args), bot=bot)
+
+    print(
+        f"{report['sessions']} sessions, {report['questions']} questions on {report['workers']} workers "
+        f"in {report['seconds']:.2f}s ({report['sessions'] / report['seconds']:.0f} sessions/sec)"
+    )
+    print(f"Overall accuracy: {report['accuracy']:.1%}")
+    print("Hardest items:")
+    for item in report["items"][: args.top]:
+        print(f"  {item['clue']:<12} {item['answer']:<24} {item['correct_rate']:6.1%} of {item['shown']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Wrote report to {args.output}")
@@ -0,0 +1,324 @@
+"""
+Accuracy reports from answer logs (see eventlog).
+
+The fixed fields of every logged answer are loaded into columns: NumPy
+arrays when NumPy is installed, array.array otherwise. Per-item and
+per-theme figures are then group-bys over the item column (np.bincount, or
+a single pass over the arrays without NumPy):
+
+    questions       answers given on a first attempt, i.e. times asked
+    accuracy        correct answers / questions
+    mean attempts   answers / questions
+    partial rate    correct answers that were partial matches / correct
+    timeout rate    timed-out answers / questions
+
+Parsing the log is the slow part, so the columns are kept next to it in a
+"<log>.cols" cache of fixed 14-byte rows. The log is append-only, so later
+runs only parse the records added since the cache was written.
+
+Answers are logged by theme and position within the theme. Pack themes
+that appear in the log are loaded (register them, e.g. with
+EMOJIGUESSR_PACKS, as for the game); answers for themes or items this
+process doesn't know are counted as unknown.
+
+Run with: emojiguessr stats answers.egl
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+from array import array
+
+from .data import _bank_index, _theme_index, themes
+from .eventlog import CORRECT, PARTIAL, TIMEOUT, EventLogReader, theme_id
+
+CACHE_MAGIC = b"EGC2"
+CACHE_VERSION = 2
+
+_CACHE_HEADER = struct.Struct("<4sHHQQ")
+_ROW = struct.Struct("<IIBBI")
+# the same row layout for NumPy: theme, item, attempt, flags, latency
+_ROW_DTYPE = [("theme", "<u4"), ("index", "<u4"), ("attempt", "u1"), ("flags", "u1"), ("latency", "<u4")]
+# rows mapped onto bank positions per step, which bounds the temporaries
+_CHUNK = 1 << 22
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _read_cache(path):
+    try:
+        with open(path, "rb") as f:
+            magic, version, _, scanned, count = _CACHE_HEADER.unpack(f.read(_CACHE_HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    if os.path.getsize(path) < _CACHE_HEADER.size + count * _ROW.size:
+        return None
+    return scanned, count
+
+
+def update_cache(log_path, cache_path=None):
+    # parse whatever the log gained since the cache was written and append
+    # it as fixed-width rows; returns (cache path, row count)
+    cache_path = f"{log_path}.cols" if cache_path is None else cache_path
+    state = _read_cache(cache_path)
+    log_size = os.path.getsize(log_path)
+    if state is None or state[0] > log_size:
+        # missing, damaged, or the log was replaced: start over
+        with open(cache_path, "wb") as f:
+            f.write(_CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, 0, 0, 0))
+        state = (0, 0)
+    scanned, count = state
+
+    with EventLogReader(log_path) as reader:
+        rows = bytearray()
+        pack = _ROW.pack
+        end = None
+        records = reader._records(scanned) if scanned else reader._records()
+        for start, (_, theme, index, attempt, flags, latency, n) in records:
+            rows += pack(theme, index, attempt, flags, latency)
+            end = start + n
+        added = len(rows) // _ROW.size
+
+    if added:
+        with open(cache_path, "r+b") as f:
+            # rows first, then the header that makes them visible
+            f.seek(_CACHE_HEADER.size + count * _ROW.size)
+            f.write(rows)
+            f.truncate()
+            f.seek(0)
+            f.write(_CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, 0, end, count + added))
+    return cache_path, count + added
+
+
+class Columns:
+    __slots__ = ("theme", "index", "attempt", "flags", "latency")
+
+    def __init__(self, theme, index, attempt, flags, latency):
+        self.theme = theme
+        self.index = index
+        self.attempt = attempt
+        self.flags = flags
+        self.latency = latency
+
+    def __len__(self):
+        return len(self.index)
+
+
+def load_columns(log_path, cache_path=None, use_numpy=None):
+    cache_path, count = update_cache(log_path, cache_path)
+    np = _numpy() if use_numpy in (None, True) else None
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy is not installed")
+
+    if np is not None:
+        rows = np.fromfile(cache_path, dtype=np.dtype(_ROW_DTYPE), count=count, offset=_CACHE_HEADER.size)
+        return Columns(*(np.ascontiguousarray(rows[name]) for name, _ in _ROW_DTYPE))
+
+    columns = Columns(array("I"), array("I"), array("B"), array("B"), array("I"))
+    with open(cache_path, "rb") as f:
+        f.seek(_CACHE_HEADER.size)
+        data = f.read(count * _ROW.size)
+    for theme, index, attempt, flags, latency in _ROW.iter_unpack(data):
+        columns.theme.append(theme)
+        columns.index.append(index)
+        columns.attempt.append(attempt)
+        columns.flags.append(flags)
+        columns.latency.append(latency)
+    return columns
+
+
+def _theme_table(present):
+    # {theme id: (bank start, theme size)} for the logged theme ids this
+    # process knows, loading the pack themes among them
+    names = {theme_id(name): name for name in themes()}
+    table = {}
+    for tid in present:
+        name = names.get(tid)
+        if name is not None:
+            _theme_index(name)
+            table[tid] = name
+    bank = _bank_index()
+    return {tid: (bank.ranges[name][0], bank.ranges[name][1] - bank.ranges[name][0]) for tid, name in table.items()}
+
+
+def _slots(ids):
+    # smallest modulus that gives every known theme id its own slot, so a
+    # theme id is looked up with one % and a gather
+    m = max(1, len(ids))
+    while len({tid % m for tid in ids}) < len(ids):
+        m += 1
+    return m
+
+
+def _positions_numpy(np, columns):
+    # bank positions of the logged items; unknown ones get position `size`
+    names = {theme_id(name): name for name in themes()}
+    m = _slots(list(names))
+    ids = np.full(m, 0xFFFFFFFF, dtype=np.uint32)
+    for tid in names:
+        ids[tid % m] = tid
+    used = np.zeros(m, dtype=np.int64)
+    for lo in range(0, len(columns), _CHUNK):
+        used += np.bincount(columns.theme[lo : lo + _CHUNK] % np.uint32(m), minlength=m)
+    table = _theme_table(ids[used > 0].tolist())
+    size = len(_bank_index().items)
+
+    starts = np.zeros(m, dtype=np.uint32)
+    sizes = np.zeros(m, dtype=np.uint32)
+    for tid, (start, n) in table.items():
+        starts[tid % m], sizes[tid % m] = start, n
+    positions = np.empty(len(columns), dtype=np.uint32)
+    for lo in range(0, len(columns), _CHUNK):
+        t = columns.theme[lo : lo + _CHUNK]
+        index = columns.index[lo : lo + _CHUNK]
+        slot = (t % np.uint32(m)).astype(np.intp)
+        unknown = ids[slot] != t
+        unknown |= index >= sizes[slot]
+        out = positions[lo : lo + _CHUNK]
+        np.take(starts, slot, out=out)
+        out += index
+        out[unknown] = size
+    return positions, size
+
+
+def _tallies_numpy(np, columns, index, size):
+    # one bincount over a combined (item, flags, first attempt) key gives
+    # every count at once; rows for unknown items go to an extra item
+    key = index * 16 + (columns.flags & 7).astype(np.uint32) * 2 + (columns.attempt == 1)
+    counts = np.bincount(key, minlength=(size + 1) * 16)[: size * 16].reshape(size, 8, 2)
+
+    flags = np.arange(8)
+    correct = counts[:, (flags & CORRECT) != 0]
+    return {
+        "answers": counts.sum(axis=(1, 2)),
+        "questions": counts[:, :, 1].sum(axis=1),
+        "correct": correct.sum(axis=(1, 2)),
+        "partial": counts[:, (flags & (CORRECT | PARTIAL)) == (CORRECT | PARTIAL)].sum(axis=(1, 2)),
+        "timeouts": counts[:, (flags & TIMEOUT) != 0].sum(axis=(1, 2)),
+        "latency": np.bincount(index, weights=columns.latency, minlength=size + 1)[:size],
+    }
+
+
+def _tallies_python(columns):
+    table = _theme_table(set(columns.theme))
+    size = len(_bank_index().items)
+    keys = ("answers", "questions", "correct", "partial", "timeouts", "latency")
+    t = {key: [0] * size for key in keys}
+    answers, questions, right, partial, timeouts, latency = (t[key] for key in keys)
+    for tid, index, attempt, flags, us in zip(columns.theme, columns.index, columns.attempt, columns.flags, columns.latency):
+        start, n = table.get(tid, (0, 0))
+        if index >= n:
+            continue
+        index += start
+        answers[index] += 1
+        latency[index] += us
+        if attempt == 1:
+            questions[index] += 1
+        if flags & CORRECT:
+            right[index] += 1
+            if flags & PARTIAL:
+                partial[index] += 1
+        if flags & TIMEOUT:
+            timeouts[index] += 1
+    return t
+
+
+def tally(columns):
+    # sums per bank position (after loading the logged pack themes); answers
+    # without a known item are dropped
+    np = _numpy() if not isinstance(columns.index, array) else None
+    if np is not None:
+        positions, size = _positions_numpy(np, columns)
+        return {key: values.tolist() for key, values in _tallies_numpy(np, columns, positions, size).items()}
+    return _tallies_python(columns)
+
+
+def _figures(answers, questions, correct, partial, timeouts, latency):
+    return {
+        "questions": questions,
+        "answers": answers,
+        "correct": correct,
+        "accuracy": correct / questions if questions else 0.0,
+        "mean_attempts": answers / questions if questions else 0.0,
+        "partial_rate": partial / correct if correct else 0.0,
+        "timeout_rate": timeouts / questions if questions else 0.0,
+        "mean_latency_ms": latency / answers / 1000 if answers else 0.0,
+    }
+
+
+def report(columns):
+    t = tally(columns)
+    bank = _bank_index()
+    keys = ("answers", "questions", "correct", "partial", "timeouts", "latency")
+
+    items = []
+    by_theme = []
+    for theme, (start, stop) in bank.ranges.items():
+        sums = [sum(t[key][start:stop]) for key in keys]
+        if sums[0]:
+            by_theme.append({"theme": theme, **_figures(*sums)})
+        for i in range(start, stop):
+            if t["answers"][i]:
+                emoji, answer = bank.items[i]
+                items.append({
+                    "index": i - start,
+                    "theme": theme,
+                    "clue": emoji,
+                    "answer": answer,
+                    **_figures(*(t[key][i] for key in keys)),
+                })
+
+    items.sort(key=lambda item: (item["accuracy"], -item["questions"]))
+    by_theme.sort(key=lambda theme: theme["accuracy"])
+    known = sum(t["answers"])
+    return {"answers": len(columns), "unknown": len(columns) - known, "items": items, "themes": by_theme}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="emojiguessr stats",
+        description="Per-item and per-theme accuracy from an answer log (see --log).",
+    )
+    parser.add_argument("log", help="Answer log written with --log")
+    parser.add_argument("--top", type=int, default=10, help="Hardest items to list (default: 10)")
+    parser.add_argument("--theme", "-t", help="Only list items from this theme")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    parser.add_argument("--no-numpy", action="store_true", help="Use the array-based fallback even if NumPy is installed")
+    args = parser.parse_args(argv)
+
+    columns = load_columns(args.log, use_numpy=False if args.no_numpy else None)
+    result = report(columns)
+    items = result["items"]
+    if args.theme:
+        items = [item for item in items if item["theme"] == args.theme]
+
+    if args.json:
+        json.dump({**result, "items": items}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+
+    print(f"{result['answers']} answers")
+    if result["unknown"]:
+        print(f"{result['unknown']} of them for themes or items not registered here")
+    print("\nThemes (hardest first):")
+    for t in result["themes"]:
+        print(
+            f"  {t['theme']:<12} {t['accuracy']:6.1%} correct over {t['questions']} questions, "
+            f"{t['mean_attempts']:.2f} attempts, {t['partial_rate']:.1%} partial"
+        )
+    print("\nHardest items:")
+    for item in items[: args.top]:
+        print(
+            f"  {item['clue']:<10} {item['answer']:<24} {item['accuracy']:6.1%} of {item['questions']}, "
+            f"{item['mean_attempts']:.2f} attempts, {item['partial_rate']:.1%} partial"
+        )
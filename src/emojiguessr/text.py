@@ -0,0 +1,34 @@
+"""
+Answer/guess normalization shared by grading and lookups.
+
+Text is NFKC-normalized, stripped and case-folded, so full-width letters,
+ligatures and characters like "ß" compare the way players expect. For ASCII
+text all of that reduces to strip().lower(), which is cheaper than a cache
+lookup; everything else goes through a bounded LRU cache, since the same
+guesses repeat a lot under load.
+"""
+
+from functools import lru_cache
+
+CACHE_SIZE = 65536
+
+
+def normalize(text):
+    if text.isascii():
+        return text.strip().lower()
+    return _normalize_unicode(text)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_unicode(text):
+    import unicodedata
+
+    return unicodedata.normalize("NFKC", text).strip().casefold()
+
+
+def normalize_cache_info():
+    return _normalize_unicode.cache_info()
+
+
+def clear_normalize_cache():
+    _normalize_unicode.cache_clear()
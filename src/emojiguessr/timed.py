@@ -0,0 +1,125 @@
+"""
+Timed rounds on asyncio.
+
+run_quiz_async plays the same QuizSession as run_quiz, but guesses come
+from an async input_fn and every question has a deadline: whatever guesses
+the player makes have to arrive within time_limit seconds of the question
+being shown, or the question is scored as a miss. Deadlines are plain
+event-loop timeouts, so one loop can run any number of timed sessions
+without a thread per player.
+
+Time is read through a clock object with now() and
+wait_for(awaitable, timeout); the default uses the running loop, and tests
+pass a fake one to control time.
+"""
+
+import asyncio
+import fcntl
+import os
+import stat
+import sys
+
+from .session import QuizSession
+
+
+class LoopClock:
+    def now(self):
+        return asyncio.get_running_loop().time()
+
+    async def wait_for(self, awaitable, timeout):
+        return await asyncio.wait_for(awaitable, timeout)
+
+
+async def run_quiz_async(num_questions, theme, case_sensitive, allow_partial, max_attempts, input_fn, output_fn=print, time_limit=None, clock=None, **session_options):
+    clock = LoopClock() if clock is None else clock
+    session = QuizSession(num_questions, theme, case_sensitive, allow_partial, max_attempts, **session_options)
+
+    lines = session.start()
+    question = None
+    while True:
+        for line in lines:
+            output_fn(line)
+        if session.done:
+            return session.score
+
+        if session.question != question:
+            question = session.question
+            deadline = None if time_limit is None else clock.now() + time_limit
+
+        if deadline is None:
+            lines = session.answer(await input_fn(session.prompt))
+            continue
+        try:
+            guess = await clock.wait_for(input_fn(session.prompt), max(0.0, deadline - clock.now()))
+        except asyncio.TimeoutError:
+            lines = session.timeout()
+        else:
+            lines = session.answer(guess)
+
+
+def _is_stream(file):
+    # pipes, sockets and terminals can be read through the event loop;
+    # regular files (quiz < answers.txt) can't
+    try:
+        mode = os.fstat(file.fileno()).st_mode
+    except (AttributeError, OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)
+
+
+async def stdin_input():
+    # returns (input_fn, close): an input_fn reading lines from stdin through
+    # the event loop, so a timed-out read is simply cancelled (POSIX only),
+    # and a close() that undoes the set-up. Anything else is read on a worker
+    # thread, which never blocks for long on a file.
+    loop = asyncio.get_running_loop()
+    if not _is_stream(sys.stdin):
+        async def input_fn(prompt):
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                raise EOFError
+            return line.rstrip("\r\n")
+
+        return input_fn, lambda: None
+
+    # the transport makes stdin non-blocking, which would outlive us in the
+    # shell, and closes the file it is given, so it gets a duplicate
+    fd = sys.stdin.fileno()
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    reader = asyncio.StreamReader()
+    pipe = os.fdopen(os.dup(fd), "rb", buffering=0)
+    try:
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    except BaseException:
+        pipe.close()
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+        raise
+
+    def close():
+        transport.close()
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+
+    async def input_fn(prompt):
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        try:
+            line = await reader.readline()
+        except asyncio.CancelledError:
+            # leave the unanswered prompt's line before the time's-up message
+            sys.stdout.write("\n")
+            raise
+        if not line:
+            raise EOFError
+        return line.decode("utf-8", "replace").rstrip("\r\n")
+
+    return input_fn, close
+
+
+async def play_in_terminal(time_limit, **options):
+    input_fn, close = await stdin_input()
+    try:
+        return await run_quiz_async(input_fn=input_fn, time_limit=time_limit, **options)
+    finally:
+        close()
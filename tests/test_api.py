@@ -0,0 +1,150 @@
+import asyncio
+import json
+import pytest
+from emojiguessr import api, data
+from emojiguessr.api import start_server
+from emojiguessr.apiload import run_local
+from emojiguessr.data import _EMOJI_BANK, themes
+
+
+def request(method, path, payload=None, headers=""):
+  body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+  length = f"Content-Length: {len(body)}\r\n" if payload is not None else ""
+  return f"{method} {path} HTTP/1.1\r\nHost: test\r\n{length}{headers}\r\n".encode("latin-1") + body
+
+
+async def read_response(reader):
+  head = await reader.readuntil(b"\r\n\r\n")
+  lines = head.decode("latin-1").split("\r\n")
+  headers = dict(line.lower().split(": ", 1) for line in lines[1:] if line)
+  body = await reader.readexactly(int(headers["content-length"]))
+  return int(lines[0].split(" ")[1]), headers, json.loads(body)
+
+
+def exchange(*requests):
+  # sends every request on one connection and returns the responses
+  async def scenario():
+    server = await start_server("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+      reader, writer = await asyncio.open_connection("127.0.0.1", port)
+      responses = []
+      for raw in requests:
+        writer.write(raw)
+        responses.append(await read_response(reader))
+      closed = await reader.read() == b"" if responses[-1][1].get("connection") == "close" else None
+      writer.close()
+      return responses, closed
+  return asyncio.run(scenario())
+
+
+def test_item_and_check_on_one_connection():
+  (item, check, wrong), _ = exchange(
+    request("GET", "/item?theme=movies&seed=3"),
+    request("POST", "/check", {"answer": "pizza", "guess": "piz"}),
+    request("POST", "/check", {"answer": "pizza", "guess": "piz", "allow_partial": False}),
+  )
+  status, headers, body = item
+  assert status == 200
+  assert headers["content-type"] == "application/json"
+  assert "connection" not in headers, "HTTP/1.1 connections should stay open"
+  assert body["theme"] == "movies"
+  assert (body["clue"], body["answer"]) in [tuple(pair) for pair in _EMOJI_BANK["movies"]]
+  assert check[2] == {"correct": True}
+  assert wrong[2] == {"correct": False}
+
+
+def test_item_seed_is_reproducible():
+  (first, second), _ = exchange(request("GET", "/item?theme=dev&seed=11"), request("GET", "/item?theme=dev&seed=11"))
+  assert first[2] == second[2]
+
+
+def test_batch_items_and_checks():
+  (response,), _ = exchange(request("POST", "/batch", {
+    "items": [{"theme": "food"}, {"theme": "dev", "seed": 1}],
+    "checks": [
+      {"answer": "pizza", "guess": "Pizza"},
+      {"answer": "pizza", "guess": "Pizza", "case_sensitive": True},
+      {"answer": "burger", "guess": "bruger", "allow_partial": False, "allow_typos": 1},
+    ],
+  }))
+  status, _, body = response
+  assert status == 200
+  assert [item["theme"] for item in body["items"]] == ["food", "dev"]
+  assert body["checks"] == [True, False, True]
+
+
+def test_themes():
+  (response,), _ = exchange(request("GET", "/themes"))
+  assert "food" in response[2]
+
+
+def test_errors_keep_the_connection_usable():
+  responses, _ = exchange(
+    request("GET", "/nope"),
+    request("GET", "/check"),
+    request("GET", "/item?theme=unknown"),
+    request("POST", "/check", {"answer": "pizza"}),
+    request("POST", "/batch", {"checks": [{"answer": "pizza", "guess": "p", "allow_typos": "1"}]}),
+    request("POST", "/check", {"answer": "pizza", "guess": "pizza"}),
+  )
+  assert [status for status, _, _ in responses] == [404, 405, 400, 400, 400, 200]
+  assert "error" in responses[0][2]
+
+
+def test_connection_close_is_honoured():
+  (response,), closed = exchange(request("GET", "/themes", headers="Connection: close\r\n"))
+  assert response[0] == 200
+  assert response[1]["connection"] == "close"
+  assert closed
+
+
+def test_http10_keep_alive_is_echoed():
+  responses, closed = exchange(
+    request("GET", "/themes", headers="Connection: keep-alive\r\n").replace(b"HTTP/1.1", b"HTTP/1.0"),
+    request("GET", "/themes").replace(b"HTTP/1.1", b"HTTP/1.0"),
+  )
+  assert responses[0][1]["connection"] == "keep-alive"
+  assert responses[1][1]["connection"] == "close"
+  assert closed
+
+
+def test_unexpected_errors_are_a_500_and_keep_the_connection(monkeypatch, capsys):
+  def broken():
+    raise RuntimeError("pack exploded")
+  monkeypatch.setitem(data._LAZY_THEMES, "broken", broken)
+  responses, _ = exchange(
+    request("GET", "/item?theme=broken"),
+    request("POST", "/check", None).replace(b"\r\n\r\n", b"\r\nContent-Length: 20000\r\n\r\n") + b"[" * 20000,
+    request("GET", "/item?theme=food"),
+  )
+  assert [status for status, _, _ in responses] == [500, 400, 200]
+  assert responses[0][2] == {"error": "internal error: RuntimeError"}
+  assert "pack exploded" in capsys.readouterr().err
+
+
+def test_empty_and_get_bodies_are_ignored():
+  responses, _ = exchange(
+    request("GET", "/themes", headers="Content-Length: 0\r\n"),
+    request("GET", "/themes", headers="Content-Length: 4\r\n") + b"nope",
+    request("POST", "/check", headers="Content-Length: 0\r\n"),
+  )
+  assert [status for status, _, _ in responses] == [200, 200, 400]
+  assert responses[0][2] == themes()
+
+
+def test_bad_requests_close_the_connection():
+  (missing_length,), closed = exchange(b"POST /check HTTP/1.1\r\nHost: test\r\n\r\n")
+  assert missing_length[0] == 411
+  assert closed
+  (chunked,), closed = exchange(b"POST /check HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n")
+  assert chunked[0] == 501
+  assert closed
+
+
+def test_apiload_with_and_without_batching():
+  single = asyncio.run(run_local(requests=40, concurrency=4, batch_size=1, seed=1))
+  batched = asyncio.run(run_local(requests=40, concurrency=4, batch_size=10, seed=1))
+  assert single["errors"] == batched["errors"] == 0
+  assert batched["checks_per_sec"] == pytest.approx(batched["requests_per_sec"] * 10)
+  assert single["p99_ms"] >= single["p50_ms"] > 0
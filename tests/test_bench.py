@@ -0,0 +1,41 @@
+import json
+import pytest
+from unittest.mock import patch
+from emojiguessr import bench, data
+
+
+def test_synthetic_bank_is_restored():
+  before = dict(data._EMOJI_BANK)
+  with bench.synthetic_bank(1000):
+    assert sum(len(items) for items in data._EMOJI_BANK.values()) == 1000
+    assert "food" in data._EMOJI_BANK, "Default-theme fallbacks need a food theme"
+  assert data._EMOJI_BANK == before
+  assert data.get_theme_item("food") in before["food"]
+
+
+def test_run_covers_every_hot_path():
+  with patch("emojiguessr.bench.time_call", side_effect=lambda fn: (fn(), 1.0)[1]):
+    results = bench.run([100], log=lambda _: None)
+  names = {r["name"] for r in results}
+  assert {"random_emojis", "get_theme_item", "make_quiz_item", "run_quiz[5 questions]"} <= names
+  assert sum(name.startswith("check_answer[") for name in names) == 4, "Expected all four flag combinations"
+  assert all(r["bank_size"] == 100 for r in results)
+
+
+def test_compare_flags_regressions():
+  baseline = {"results": [{"name": "a", "bank_size": 100, "ns_per_call": 100.0}, {"name": "b", "bank_size": 100, "ns_per_call": 100.0}]}
+  results = [{"name": "a", "bank_size": 100, "ns_per_call": 110.0}, {"name": "b", "bank_size": 100, "ns_per_call": 200.0}, {"name": "c", "bank_size": 100, "ns_per_call": 1.0}]
+  assert bench.compare(results, baseline, 0.25) == [("b", 100, 100.0, 200.0)]
+
+
+def test_main_writes_json_and_fails_on_regression(tmp_path):
+  out = tmp_path / "now.json"
+  base = tmp_path / "base.json"
+  base.write_text(json.dumps({"results": [{"name": "get_theme_item", "bank_size": 100, "ns_per_call": 1.0}]}))
+  with patch("emojiguessr.bench.time_call", return_value=50.0):
+    with pytest.raises(SystemExit) as exit_info:
+      bench.main(["--sizes", "100", "--output", str(out), "--compare", str(base)])
+  assert exit_info.value.code == 1
+  report = json.loads(out.read_text())
+  assert report["meta"]["python"]
+  assert len(report["results"]) == 9
@@ -125,4 +125,46 @@ class Tests:
             actual = data.get_theme_item(theme)
             assert (
                 actual in theme_actual
-            ) , f"Expected get_theme_item('{theme}') to return an item from the {theme} theme. Instead, it returned {actual}."
\ No newline at end of file
+            ) , f"Expected get_theme_item('{theme}') to return an item from the {theme} theme. Instead, it returned {actual}."
+
+    def test_random_emojis_unique_within_theme(self):
+        """
+        Verify random_emojis() never repeats an emoji within one call, since it samples without replacement.
+        """
+        food_emojis = [e for (e, _) in data._EMOJI_BANK["food"]]
+        actual = data.random_emojis(len(food_emojis), theme="food")
+        assert sorted(actual) == sorted(food_emojis), f"Expected every food emoji exactly once. Instead, got {actual}."
+
+    def test_random_emojis_count_larger_than_theme(self):
+        """
+        Verify random_emojis() caps the result at the size of the theme.
+        """
+        actual = data.random_emojis(1000, theme="dev")
+        assert len(actual) == len(data._EMOJI_BANK["dev"]), f"Expected {len(data._EMOJI_BANK['dev'])} emojis. Instead, got {len(actual)}."
+
+    def test_register_theme_updates_index(self):
+        """
+        Verify register_theme() makes a new theme available without rebuilding the existing index.
+        """
+        data._bank_index()
+        try:
+            data.register_theme("test_colors", [("🟥", "red"), ("🟦", "blue")])
+            assert data.get_theme_item("test_colors") in data._EMOJI_BANK["test_colors"]
+            assert sorted(data.random_emojis(5, theme="test_colors")) == sorted(["🟥", "🟦"])
+
+            data.register_theme("test_colors", [("🟩", "green")])
+            assert data.get_theme_item("test_colors") == ("🟩", "green"), "Expected replacing a theme to invalidate the index."
+        finally:
+            del data._EMOJI_BANK["test_colors"]
+            data.invalidate_index()
+
+    def test_rng_seed_and_instance(self):
+        """
+        Verify random_emojis() and get_theme_item() accept a seed or a random.Random and are reproducible with it.
+        """
+        import random
+        assert data.random_emojis(5, theme="movies", rng=3) == data.random_emojis(5, theme="movies", rng=3), "Expected the same seed to give the same emojis."
+        first = random.Random(9)
+        second = random.Random(9)
+        picks = [data.get_theme_item("cities", rng=first) for _ in range(10)]
+        assert picks == [data.get_theme_item("cities", rng=second) for _ in range(10)], "Expected equal generators to give equal items."
@@ -0,0 +1,177 @@
+import time
+import pytest
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.eventlog import EventLog, EventLogReader, Event, theme_id
+from emojiguessr.session import QuizSession
+
+
+def test_round_trip(tmp_path):
+  path = tmp_path / "answers.egl"
+  with EventLog(path) as log:
+    log.append(1, "food", 5, "pizza", True, 1, 1200)
+    log.append(1, "food", 6, "sush", True, 2, 800, partial=True)
+    log.append(2, None, None, "", False, 1, 30_000_000, timeout=True)
+  with EventLogReader(path) as reader:
+    assert list(reader) == [
+      Event(1, theme_id("food"), 5, 1, True, False, False, 1200, "pizza"),
+      Event(1, theme_id("food"), 6, 2, True, True, False, 800, "sush"),
+      Event(2, None, None, 1, False, False, True, 30_000_000, ""),
+    ]
+    assert [e.guess for e in reader.filter(session=1, correct=True)] == ["pizza", "sush"]
+    assert [e.session for e in reader.filter(index=6)] == [1]
+    assert [e.guess for e in reader.filter(theme="food")] == ["pizza", "sush"]
+    assert list(reader.filter(theme="movies")) == []
+    assert reader.count() == 3
+
+
+def test_batches_until_flushed(tmp_path):
+  path = tmp_path / "answers.egl"
+  log = EventLog(path, batch_size=3, flush_interval=3600)
+  log.append(1, "food", 0, "a", False, 1, 1)
+  log.append(1, "food", 0, "b", False, 1, 1)
+  with EventLogReader(path) as reader:
+    assert reader.count() == 0
+  log.append(1, "food", 0, "c", True, 1, 1)
+  with EventLogReader(path) as reader:
+    assert [e.guess for e in reader] == ["a", "b", "c"]
+  log.close()
+
+
+def test_no_flush_interval_batches_by_size_only(tmp_path):
+  path = tmp_path / "answers.egl"
+  log = EventLog(path, batch_size=2, flush_interval=None)
+  log.append(1, "food", 0, "a", False, 1, 1)
+  with EventLogReader(path) as reader:
+    assert reader.count() == 0
+  log.append(1, "food", 0, "b", False, 1, 1)
+  with EventLogReader(path) as reader:
+    assert reader.count() == 2
+  log.close()
+
+
+def test_appends_across_opens_and_skips_torn_record(tmp_path):
+  path = tmp_path / "answers.egl"
+  for guess in ("first", "second"):
+    with EventLog(path) as log:
+      log.append(7, "food", 1, guess, True, 1, 10)
+  with open(path, "ab") as f:
+    f.write(b"\x07\x00\x00")
+  with EventLogReader(path) as reader:
+    assert [e.guess for e in reader] == ["first", "second"]
+
+
+def test_reopening_after_a_crash_drops_the_torn_record(tmp_path):
+  path = tmp_path / "answers.egl"
+  with EventLog(path) as log:
+    log.append(7, "food", 1, "first", True, 1, 10)
+    log.append(7, "food", 2, "second", True, 1, 10)
+  whole = path.read_bytes()
+  # the crash: only part of a third record made it to disk
+  path.write_bytes(whole + whole[16:30])
+
+  with EventLog(path) as log:
+    log.append(8, "food", 3, "after", False, 2, 20)
+  with EventLogReader(path) as reader:
+    assert [(e.session, e.index, e.guess) for e in reader] == [(7, 1, "first"), (7, 2, "second"), (8, 3, "after")]
+
+
+def test_reopening_scans_from_the_committed_end(tmp_path, monkeypatch):
+  path = tmp_path / "answers.egl"
+  with EventLog(path) as log:
+    for i in range(100):
+      log.append(7, "food", i, "first", True, 1, 10)
+  size = path.stat().st_size
+  assert int.from_bytes(path.read_bytes()[8:16], "little") == size
+
+  scans = []
+  records = EventLogReader._records
+  def spy(reader, pos=16):
+    scans.append(pos)
+    return records(reader, pos)
+  monkeypatch.setattr(EventLogReader, "_records", spy)
+  EventLog(path).close()
+  assert scans == [size]
+
+
+def test_reopening_when_the_committed_end_lags(tmp_path):
+  path = tmp_path / "answers.egl"
+  with EventLog(path) as log:
+    log.append(7, "food", 1, "first", True, 1, 10)
+  mark = path.read_bytes()[8:16]
+  with EventLog(path) as log:
+    log.append(7, "food", 2, "second", True, 1, 10)
+  # the crash: the records reached the disk but the header didn't, and
+  # part of a third record followed
+  whole = bytearray(path.read_bytes())
+  whole[8:16] = mark
+  path.write_bytes(bytes(whole) + whole[16:30])
+
+  with EventLog(path) as log:
+    log.append(8, "food", 3, "after", False, 2, 20)
+  with EventLogReader(path) as reader:
+    assert [e.guess for e in reader] == ["first", "second", "after"]
+
+
+def test_reopening_after_a_crash_while_creating(tmp_path):
+  path = tmp_path / "answers.egl"
+  path.write_bytes(b"EGL")
+  with EventLog(path) as log:
+    log.append(1, "food", 0, "pizza", True, 1, 1)
+  with EventLogReader(path) as reader:
+    assert [e.guess for e in reader] == ["pizza"]
+
+
+def test_rejects_other_files(tmp_path):
+  path = tmp_path / "nope.egl"
+  path.write_bytes(b"definitely not an event log")
+  with pytest.raises(ValueError):
+    EventLogReader(path)
+  with pytest.raises(ValueError):
+    EventLog(path)
+  (tmp_path / "short").write_bytes(b"nope")
+  with pytest.raises(ValueError):
+    EventLog(tmp_path / "short")
+  assert path.read_bytes() == b"definitely not an event log"
+
+
+def test_idle_log_is_flushed_on_a_timer(tmp_path):
+  path = tmp_path / "answers.egl"
+  log = EventLog(path, flush_interval=0.02)
+  log.append(1, "food", 0, "pizza", True, 1, 1)
+  deadline = time.monotonic() + 5
+  while time.monotonic() < deadline:
+    with EventLogReader(path) as reader:
+      if reader.count():
+        break
+    time.sleep(0.01)
+  with EventLogReader(path) as reader:
+    assert reader.count() == 1, "Expected the buffered record to be written without another append"
+  log.close()
+
+
+def test_run_quiz_logs_every_guess(tmp_path):
+  path = tmp_path / "answers.egl"
+  answers = iter(["zzz", "zzz", "zzz", "zzz"])
+  with EventLog(path) as log:
+    run_quiz(2, "food", False, True, 2, input_fn=lambda _: next(answers), output_fn=lambda _: None, rng=1, log=log)
+  with EventLogReader(path) as reader:
+    events = list(reader)
+  assert [e.attempt for e in events] == [1, 2, 1, 2]
+  assert len({e.session for e in events}) == 1
+  assert all(e.index is not None and not e.correct for e in events)
+  assert all(e.theme == theme_id("food") and e.index < len(_EMOJI_BANK["food"]) for e in events)
+
+
+def test_session_logs_partial_and_timeout(tmp_path):
+  path = tmp_path / "answers.egl"
+  items = iter([{"clue": "🍔", "answer": "burger", "theme": "food"}, {"clue": "🍣", "answer": "sushi", "theme": "food"}])
+  with EventLog(path) as log:
+    session = QuizSession(2, "food", False, True, 1, make_item=lambda theme: next(items), log=log, session_id=42)
+    session.start()
+    session.answer("bur")
+    session.timeout()
+  with EventLogReader(path) as reader:
+    first, second = reader
+  assert (first.session, first.index, first.correct, first.partial, first.guess) == (42, None, True, True, "bur")
+  assert (second.timeout, second.correct) == (True, False)
@@ -0,0 +1,34 @@
+import pytest
+from emojiguessr.fuzzy import within_distance
+
+
+def osa_distance(a, b):
+  # plain full-table optimal string alignment distance, as a reference
+  d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+  for i in range(len(a) + 1):
+    d[i][0] = i
+  for j in range(len(b) + 1):
+    d[0][j] = j
+  for i in range(1, len(a) + 1):
+    for j in range(1, len(b) + 1):
+      cost = 0 if a[i - 1] == b[j - 1] else 1
+      d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+      if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+        d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+  return d
+
+
+@pytest.mark.parametrize("k", [0, 1, 2, 3])
+def test_within_distance_matches_full_table(k):
+  words = ["", "a", "ab", "ba", "abc", "acb", "cab", "pizza", "piza", "pizzza", "penguin", "pengiun", "croissant", "croisant"]
+  for a in words:
+    for b in words:
+      d = osa_distance(a, b)
+      assert within_distance(a, b, k) == (d[-1][-1] <= k), f"{a!r} vs {b!r} with k={k}"
+      assert within_distance(a, b, k, prefix=True) == (min(d[-1]) <= k), f"{a!r} vs prefix of {b!r} with k={k}"
+
+
+def test_within_distance_length_gap_exits_early():
+  assert not within_distance("a", "a" * 50, 2)
+  assert within_distance("a", "a" * 50, 2, prefix=True)
+  assert not within_distance("a" * 50, "a", 2, prefix=True)
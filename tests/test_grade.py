@@ -0,0 +1,100 @@
+import io
+import json
+import pytest
+from emojiguessr.grade import grade_stream, main
+from emojiguessr.quiz import check_answer
+
+
+def ndjson(*records):
+  return io.BytesIO(b"".join(json.dumps(r).encode("utf-8") + b"\n" for r in records))
+
+
+def graded(out):
+  return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_grades_with_check_answer_semantics():
+  records = [
+    {"answer": "Pizza", "guess": "piz"},
+    {"answer": "Pizza", "guess": "PIZZA "},
+    {"answer": "Pizza", "guess": "sushi"},
+    {"answer": "Jurassic Park", "guess": "jurassic", "allow_partial": False},
+    {"answer": "Pizza", "guess": "pizza", "case_sensitive": True},
+    {"answer": "Pizza", "guess": "pizaz", "allow_typos": 1},
+  ]
+  out = io.BytesIO()
+  summary = grade_stream(ndjson(*records), out, chunk_size=4)
+  results = graded(out)
+  expected = [
+    check_answer(
+      r["answer"],
+      r["guess"],
+      case_sensitive=r.get("case_sensitive", False),
+      allow_partial=r.get("allow_partial", True),
+      allow_typos=r.get("allow_typos", 0),
+    )
+    for r in records
+  ]
+  assert [r["correct"] for r in results] == expected
+  assert summary == {"graded": 6, "correct": sum(expected), "errors": {"count": 0, "lines": []}}
+
+
+def test_keeps_other_fields():
+  out = io.BytesIO()
+  grade_stream(ndjson({"id": 7, "player": "ana", "answer": "🍕 Pizza", "guess": "🍕"}), out)
+  assert graded(out) == [{"id": 7, "player": "ana", "answer": "🍕 Pizza", "guess": "🍕", "correct": True}]
+
+
+def test_command_line_flags_are_defaults():
+  out = io.BytesIO()
+  grade_stream(
+    ndjson({"answer": "Pizza", "guess": "piz"}, {"answer": "Pizza", "guess": "piz", "allow_partial": True}),
+    out,
+    allow_partial=False,
+  )
+  assert [r["correct"] for r in graded(out)] == [False, True]
+
+
+def test_skips_invalid_lines():
+  src = io.BytesIO(b'{"answer": "Pizza", "guess": "pizza"}\nnot json\n\n[1, 2]\n{"answer": "Pizza"}\n')
+  out = io.BytesIO()
+  summary = grade_stream(src, out)
+  assert summary["graded"] == 1
+  assert summary["errors"] == {"count": 3, "lines": [2, 4, 5]}
+
+
+@pytest.mark.parametrize("flags", [
+  {"allow_typos": "1"},
+  {"allow_typos": None},
+  {"allow_typos": 1.5},
+  {"allow_typos": True},
+  {"allow_typos": -1},
+  {"case_sensitive": "false"},
+  {"case_sensitive": None},
+  {"allow_partial": 0},
+  {"allow_partial": "true"},
+])
+def test_skips_records_with_badly_typed_flags(flags):
+  src = ndjson({"answer": "Pizza", "guess": "pizza"}, {"answer": "Pizza", "guess": "piz", **flags})
+  out = io.BytesIO()
+  summary = grade_stream(src, out)
+  assert summary["graded"] == 1
+  assert summary["errors"] == {"count": 1, "lines": [2]}
+  assert [r["correct"] for r in graded(out)] == [True]
+
+
+def test_main_reads_and_writes_files(tmp_path, capsys):
+  src = tmp_path / "in.ndjson"
+  dst = tmp_path / "out.ndjson"
+  src.write_bytes(ndjson(*({"answer": "Pizza", "guess": g} for g in ("pizza", "nope") * 50)).getvalue())
+  main(["--input", str(src), "--output", str(dst), "--chunk-size", "7"])
+  lines = dst.read_text(encoding="utf-8").splitlines()
+  assert [json.loads(line)["correct"] for line in lines] == [True, False] * 50
+  assert "Graded 100 records, 50 correct." in capsys.readouterr().err
+
+
+def test_main_fails_on_invalid_input(tmp_path):
+  src = tmp_path / "in.ndjson"
+  src.write_text("oops\n", encoding="utf-8")
+  with pytest.raises(SystemExit):
+    main(["--input", str(src), "--output", str(tmp_path / "out.ndjson")])
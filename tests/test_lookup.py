@@ -0,0 +1,33 @@
+import pytest
+from emojiguessr import data
+from emojiguessr.lookup import answer_index, find_answers, is_ambiguous
+from emojiguessr.quiz import check_answer
+
+
+def test_find_answers_matches_linear_scan():
+  for guess in ["c", "ca", " CA", "pizza", "lord of", "jurassic", "x", "", "new york"]:
+    expected = [item for items in data._EMOJI_BANK.values() for item in items if check_answer(item[1], guess)]
+    assert sorted(find_answers(guess)) == sorted(expected), f"Mismatch for guess {guess!r}"
+
+
+def test_find_answers_no_match():
+  assert find_answers("zzz") == []
+
+
+def test_is_ambiguous():
+  assert is_ambiguous("c"), "'c' starts cat, cake, chess, ..."
+  assert is_ambiguous("ca")
+  assert not is_ambiguous("croiss")
+  assert not is_ambiguous("zzz")
+
+
+def test_answer_index_follows_bank_changes():
+  before = answer_index()
+  assert answer_index() is before, "Expected the index to be built once per bank"
+  try:
+    data.register_theme("test_colors", [("🟥", "red"), ("🟦", "blue")])
+    assert find_answers("re") == [("🟥", "red")]
+  finally:
+    del data._EMOJI_BANK["test_colors"]
+    data.invalidate_index()
+  assert find_answers("re") == []
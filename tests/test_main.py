@@ -1,6 +1,9 @@
+import os
+import subprocess
+import sys
 import pytest
 from unittest.mock import patch
-from emojiguessr.__main__ import run_quiz, list_themes, list_commands
+from emojiguessr.__main__ import run_quiz, list_themes, list_commands, main
 from emojiguessr.data import _EMOJI_BANK
 
 @pytest.fixture
@@ -124,9 +127,57 @@ def test_list_commands_order(fake_output):
   expected_commands = ["--num-questions", "--theme", "--case-sensitive", "--no-partial", "--max-attempts", "--list-themes", "--list-commands"]
   assert commands[:len(expected_commands)] == expected_commands
 
-
-  
-  
-  
-  
-    
+def test_list_themes_fast_path_skips_heavy_imports():
+  code = (
+    "import sys; sys.argv = ['emojiguessr', '--list-themes'];"
+    "from emojiguessr.__main__ import main; main();"
+    "print(sorted(m for m in ('argparse', 'emojiguessr.quiz', 'emojiguessr.session') if m in sys.modules))"
+  )
+  env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+  out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+  lines = out.stdout.splitlines()
+  assert lines[0] == "Available themes:"
+  assert lines[-1] == "[]", f"Expected no heavy imports for --list-themes, got {lines[-1]}"
+
+def play_seeded(seed):
+  outputs = []
+  run_quiz(5, "movies", False, True, 1, input_fn=lambda _: "nope", output_fn=outputs.append, rng=seed)
+  return outputs
+
+def test_same_seed_same_quiz_across_threads():
+  from concurrent.futures import ThreadPoolExecutor
+  with ThreadPoolExecutor(max_workers=8) as pool:
+    runs = list(pool.map(play_seeded, [42] * 16 + [7] * 16))
+  assert all(run == runs[0] for run in runs[:16])
+  assert all(run == runs[16] for run in runs[16:])
+  assert runs[0] != runs[16]
+
+def test_seed_flag_reaches_run_quiz():
+  with patch("emojiguessr.__main__.run_quiz") as mock_run:
+    main(["--seed", "5", "-n", "2"])
+  assert mock_run.call_args.kwargs["rng"] == 5
+  assert mock_run.call_args.kwargs["num_questions"] == 2
+
+def test_buffered_output_is_identical(capsys):
+  from itertools import cycle
+  guesses = ["nope", "burger", "pizza", "x", "sushi", "y"]
+  answers = cycle(guesses)
+  run_quiz(4, "food", False, True, 2, input_fn=lambda _: next(answers), rng=3)
+  unbuffered = capsys.readouterr().out
+  answers = cycle(guesses)
+  run_quiz(4, "food", False, True, 2, input_fn=lambda _: next(answers), rng=3, buffered=True)
+  assert capsys.readouterr().out == unbuffered
+
+
+def test_buffered_writes_one_frame_per_step(fake_output):
+  outputs, output_fn = fake_output
+  with patch("emojiguessr.__main__.make_quiz_item") as mock_item:
+    mock_item.side_effect = [{"clue": "🍔", "answer": "burger", "theme": "food"}, {"clue": "🍣", "answer": "sushi", "theme": "food"}]
+    answers = iter(["pizza", "burger", "sushi"])
+    run_quiz(2, "food", False, True, 2, input_fn=lambda _: next(answers), output_fn=output_fn, buffered=True)
+  assert outputs == [
+    "\nQuestion 1/2\nTheme: food\nEmoji: 🍔",
+    "❌ Wrong! 1 attempts left.",
+    "✅ Correct!\n\nQuestion 2/2\nTheme: food\nEmoji: 🍣",
+    "✅ Correct!\n\nFinal score: 2/2",
+  ]
@@ -0,0 +1,72 @@
+import random
+import pytest
+from unittest.mock import patch
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.metrics import Histogram, QuizMetrics
+
+
+def test_histogram_percentiles_are_close():
+  rng = random.Random(1)
+  values = [int(rng.expovariate(1 / 5000)) for _ in range(20000)]
+  h = Histogram()
+  for v in values:
+    h.record(v)
+  ordered = sorted(values)
+  for pct in (50, 90, 99):
+    exact = ordered[int(len(ordered) * pct / 100) - 1]
+    assert abs(h.percentile(pct) - exact) <= max(2, exact * 0.02), f"p{pct} off by more than 2%"
+  assert h.count == len(values)
+  assert h.max == max(values)
+  assert h.min == min(values)
+
+
+def test_histogram_memory_is_fixed():
+  h = Histogram()
+  size = len(h.counts)
+  for v in (0, 1, 10**3, 10**9, 10**15, 10**20):
+    h.record(v)
+  assert len(h.counts) == size, "Huge values saturate the top bucket instead of growing the histogram"
+  assert h.max == 10**20
+  assert abs(h.percentile(50) - 10**3) <= 20
+
+
+def test_histogram_merge():
+  a, b = Histogram(), Histogram()
+  for v in range(100):
+    a.record(v)
+    b.record(v + 100)
+  a.merge(b)
+  assert a.count == 200
+  assert (a.min, a.max) == (0, 199)
+  assert a.percentile(50) == 99
+
+
+def test_run_quiz_records_metrics():
+  guesses = iter(["nope", "sushi", "nope", "nope"])
+  outputs = []
+  metrics = QuizMetrics()
+  with patch("emojiguessr.__main__.make_quiz_item") as mock_item:
+    mock_item.side_effect = [{"clue": "🍣", "answer": "sushi", "theme": "food"}, {"clue": "🍔", "answer": "burger", "theme": "food"}]
+    run_quiz(2, "food", False, True, 2, input_fn=lambda _: next(guesses), output_fn=outputs.append, metrics=metrics)
+
+  summary = metrics.summary()
+  assert summary["questions"] == 2
+  assert summary["correct"] == 1
+  assert summary["mean_attempts"] == 2
+  assert summary["phases"]["item"]["count"] == 2
+  assert summary["phases"]["check"]["count"] == 4
+  assert summary["phases"]["think"]["count"] == 4
+  assert summary["phases"]["render"]["count"] == 5, "Start, then one render per guess"
+  assert outputs[-1] == "\nFinal score: 1/2"
+
+
+def test_run_quiz_output_unchanged_by_metrics():
+  def play(metrics):
+    outputs = []
+    guesses = iter(["bur", "x"])
+    with patch("emojiguessr.__main__.make_quiz_item") as mock_item:
+      mock_item.side_effect = [{"clue": "🍔", "answer": "burger", "theme": "food"}, {"clue": "🍣", "answer": "sushi", "theme": "food"}]
+      run_quiz(2, "food", False, True, 1, input_fn=lambda _: next(guesses), output_fn=outputs.append, metrics=metrics)
+    return outputs
+
+  assert play(None) == play(QuizMetrics())
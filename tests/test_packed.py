@@ -0,0 +1,57 @@
+import pytest
+from emojiguessr import data
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.packed import compile_bank, MappedBank
+
+
+@pytest.fixture
+def packed_path(tmp_path):
+  path = tmp_path / "bank.egb"
+  compile_bank(path)
+  return path
+
+
+def test_round_trip_matches_bank(packed_path):
+  with MappedBank(packed_path) as bank:
+    assert bank.themes() == list(_EMOJI_BANK.keys())
+    assert len(bank) == sum(len(items) for items in _EMOJI_BANK.values())
+    for theme, items in _EMOJI_BANK.items():
+      start, stop = bank.ranges[theme]
+      assert [bank.item(i) for i in range(start, stop)] == items
+
+
+def test_get_theme_item(packed_path):
+  with MappedBank(packed_path) as bank:
+    for theme in _EMOJI_BANK:
+      assert bank.get_theme_item(theme) in _EMOJI_BANK[theme]
+    assert bank.get_theme_item("invalid") in _EMOJI_BANK["food"]
+
+
+def test_random_emojis(packed_path):
+  with MappedBank(packed_path) as bank:
+    food = [e for (e, _) in _EMOJI_BANK["food"]]
+    assert sorted(bank.random_emojis(100, theme="food")) == sorted(food)
+    assert len(bank.random_emojis(4, theme="invalid")) == 4
+    assert bank.random_emojis(0) == []
+
+
+def test_seeded_draws_match_the_bank(packed_path):
+  with MappedBank(packed_path) as bank:
+    for seed in range(20):
+      assert bank.get_theme_item("food", rng=seed) == data.get_theme_item("food", rng=seed)
+      assert bank.random_emojis(3, "dev", rng=seed) == data.random_emojis(3, "dev", rng=seed)
+
+
+def test_rejects_other_files(tmp_path):
+  path = tmp_path / "not_a_bank.egb"
+  path.write_bytes(b"hello world, definitely not a bank")
+  with pytest.raises(ValueError):
+    MappedBank(path)
+
+
+@pytest.mark.parametrize("size", [0, 5, 15, 16, 40])
+def test_rejects_short_and_truncated_files(packed_path, tmp_path, size):
+  path = tmp_path / "short.egb"
+  path.write_bytes(packed_path.read_bytes()[:size])
+  with pytest.raises(ValueError):
+    MappedBank(path)
@@ -0,0 +1,135 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from emojiguessr import data, packs
+
+
+@pytest.fixture(autouse=True)
+def restore_bank():
+  original = dict(data._EMOJI_BANK)
+  yield
+  data._EMOJI_BANK.clear()
+  data._EMOJI_BANK.update(original)
+  data._LAZY_THEMES.clear()
+  data.invalidate_index()
+
+
+ITEMS = [("🐱", "Cat"), ("🐶", "Dog"), ("🐟", "Fish, Gold")]
+
+
+def write_csv(path):
+  lines = ["emoji,answer"] + [f'{e},"{a}"' for e, a in ITEMS]
+  path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+  return path
+
+
+def test_iter_pack_formats(tmp_path):
+  csv_path = write_csv(tmp_path / "pets.csv")
+  jsonl_path = tmp_path / "pets.jsonl"
+  jsonl_path.write_text(
+    "\n".join(json.dumps({"emoji": e, "answer": a}) for e, a in ITEMS) + "\n",
+    encoding="utf-8",
+  )
+  json_path = tmp_path / "pets.json"
+  json_path.write_text(json.dumps([list(item) for item in ITEMS]), encoding="utf-8")
+
+  for path in (csv_path, jsonl_path, json_path):
+    assert list(packs.iter_pack(path)) == ITEMS
+
+
+def test_json_array_spanning_chunks(tmp_path):
+  items = [(f"e{i}", f"Answer {i}") for i in range(20000)]
+  path = tmp_path / "big.json"
+  path.write_text(json.dumps([list(item) for item in items]), encoding="utf-8")
+  assert list(packs.iter_pack(path)) == items
+
+
+def test_rejects_bad_packs(tmp_path):
+  path = tmp_path / "pets.txt"
+  path.write_text("nope", encoding="utf-8")
+  with pytest.raises(ValueError):
+    list(packs.iter_pack(path))
+
+  path = tmp_path / "pets.jsonl"
+  path.write_text('{"emoji": "🐱"}\n', encoding="utf-8")
+  with pytest.raises(ValueError):
+    list(packs.iter_pack(path))
+
+
+@pytest.mark.parametrize("name, text", [
+  ("pets.jsonl", '"ab"\n'),
+  ("pets.jsonl", '5\n'),
+  ("pets.jsonl", 'null\n'),
+  ("pets.json", '[["🐱", "cat"] ["🐶", "dog"]]'),
+  ("pets.json", '[["🐱", "cat"],, ["🐶", "dog"]]'),
+  ("pets.json", '[, ["🐱", "cat"]]'),
+  ("pets.json", '[["🐱", "cat"],]'),
+  ("pets.json", '[["🐱", "cat"]'),
+  ("pets.json", '["ab"]'),
+])
+def test_rejects_bad_records(tmp_path, name, text):
+  path = tmp_path / name
+  path.write_text(text, encoding="utf-8")
+  with pytest.raises(ValueError):
+    list(packs.iter_pack(path))
+
+
+def test_json_array_whitespace_and_empty(tmp_path):
+  path = tmp_path / "pets.json"
+  path.write_text('[ ]', encoding="utf-8")
+  assert list(packs.iter_pack(path)) == []
+  path.write_text('[\n  ["🐱", "cat"] ,\n  {"emoji": "🐶", "answer": "dog"}\n]\n', encoding="utf-8")
+  assert list(packs.iter_pack(path)) == [("🐱", "cat"), ("🐶", "dog")]
+
+
+def test_theme_parsed_on_first_use(tmp_path):
+  path = write_csv(tmp_path / "pets.csv")
+  with patch("emojiguessr.packs.iter_pack", wraps=packs.iter_pack) as parse:
+    assert packs.register_pack(path, cache_dir=tmp_path / "cache") == "pets"
+    assert "pets" in data.themes()
+    parse.assert_not_called()
+
+    assert data.get_theme_item("pets") in ITEMS
+    assert sorted(data.random_emojis(10, "pets")) == sorted(e for e, _ in ITEMS)
+    parse.assert_called_once()
+
+
+def test_malformed_pack_fails_on_every_use(tmp_path):
+  path = tmp_path / "pets.csv"
+  path.write_text("emoji,answer\n🐱,Cat\n🐶\n", encoding="utf-8")
+  packs.register_pack(path, cache_dir=tmp_path / "cache")
+  for _ in range(2):
+    with pytest.raises(ValueError):
+      data.get_theme_item("pets")
+  assert "pets" in data.themes()
+  assert "pets" not in data._EMOJI_BANK
+
+
+def test_warm_start_skips_parsing(tmp_path):
+  path = write_csv(tmp_path / "pets.csv")
+  cache_dir = tmp_path / "cache"
+  assert packs.load_pack(path, cache_dir) == ITEMS
+
+  with patch("emojiguessr.packs.iter_pack") as parse:
+    assert packs.load_pack(path, cache_dir) == ITEMS
+    parse.assert_not_called()
+
+
+def test_changed_source_is_parsed_again(tmp_path):
+  path = write_csv(tmp_path / "pets.csv")
+  cache_dir = tmp_path / "cache"
+  packs.load_pack(path, cache_dir)
+
+  path.write_text("🐭,Mouse\n", encoding="utf-8")
+  stat = path.stat()
+  os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+  assert packs.load_pack(path, cache_dir) == [("🐭", "Mouse")]
+
+
+def test_register_pack_dir(tmp_path):
+  write_csv(tmp_path / "pets.csv")
+  (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+  assert packs.register_pack_dir(tmp_path, cache_dir=tmp_path / "cache") == ["pets"]
+  assert data.get_theme_item("pets") in ITEMS
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch
-from emojiguessr.quiz import make_quiz_item, check_answer
+from emojiguessr.data import _EMOJI_BANK, _bank_index
+from emojiguessr.quiz import make_quiz_item, make_quiz_items, check_answer, check_answers, QuizItem
 
 
 def test_make_quiz_item():
@@ -141,3 +142,177 @@ def test_check_answer_edge_cases():
     
     assert check_answer("e-mail", "e-mail") == True, "Should handle hyphens"
 
+
+def test_make_quiz_items_unique():
+    """
+    A unique batch should draw every item at most once, and each lazily built
+    item should look exactly like what make_quiz_item() returns.
+    """
+    batch = make_quiz_items(len(_EMOJI_BANK["animals"]), theme="animals")
+    assert len(batch) == len(_EMOJI_BANK["animals"]), "Expected one item per requested draw"
+
+    items = list(batch)
+    assert sorted((i["clue"], i["answer"]) for i in items) == sorted(_EMOJI_BANK["animals"]), "Expected no repeats in a unique batch"
+    assert all(i.keys() == {"clue", "answer", "theme"} for i in items), "Expected the same keys as make_quiz_item()"
+    assert batch.answers() == [i["answer"] for i in items], "Expected the answer column to line up with the items"
+    assert batch.clues() == [i["clue"] for i in items], "Expected the clue column to line up with the items"
+
+
+def test_make_quiz_items_too_many_unique():
+    """
+    Asking for more unique items than the theme holds can't be satisfied.
+    """
+    with pytest.raises(ValueError):
+        make_quiz_items(len(_EMOJI_BANK["dev"]) + 1, theme="dev")
+
+
+def test_make_quiz_items_with_replacement_and_seed():
+    """
+    Without the unique flag the batch may be larger than the theme, and the same
+    seed should always give the same sheet.
+    """
+    first = make_quiz_items(50, theme="dev", seed=7, unique=False)
+    second = make_quiz_items(50, theme="dev", seed=7, unique=False)
+    assert len(first) == 50, "Expected 50 items drawn with replacement"
+    assert list(first) == list(second), "Expected the same seed to give the same batch"
+    assert all((i["clue"], i["answer"]) in _EMOJI_BANK["dev"] for i in first), "Expected only dev items"
+
+
+def test_make_quiz_items_invalid_theme():
+    """
+    An unknown theme falls back to food items, like make_quiz_item() does.
+    """
+    batch = make_quiz_items(3, theme="invalid", seed=1)
+    assert all((i["clue"], i["answer"]) in _EMOJI_BANK["food"] for i in batch), "Expected food items for an unknown theme"
+    assert all(i["theme"] == "invalid" for i in batch), "Expected the requested theme to be reported"
+
+
+def test_check_answers_matches_check_answer():
+    """
+    Bulk grading has to agree with check_answer() pair by pair, for every
+    combination of flags, including whitespace, case and prefix edge cases.
+    """
+    pairs = [
+        ("burger", "bur"), ("Burger", "bur"), ("burger", "hamburger"), ("burger", " BURGER "),
+        ("jurassic park", "Jurassic"), ("jurassic park", "park"), ("burger", ""), ("3d", "3d"),
+        ("Burger", "Bur"), ("burger", "burger king"), ("e-mail", "E-MAIL"), ("Straße", "STRASSE"),
+    ]
+    corrects = [c for c, _ in pairs]
+    guesses = [g for _, g in pairs]
+    for case_sensitive in (False, True):
+        for allow_partial in (False, True):
+            expected = [check_answer(c, g, case_sensitive=case_sensitive, allow_partial=allow_partial) for c, g in pairs]
+            actual = check_answers(corrects, guesses, case_sensitive=case_sensitive, allow_partial=allow_partial)
+            assert actual == expected, f"Mismatch for case_sensitive={case_sensitive}, allow_partial={allow_partial}"
+
+
+def test_check_answers_length_mismatch():
+    """
+    Every answer needs a guess; mismatched inputs are a caller bug.
+    """
+    with pytest.raises(ValueError):
+        check_answers(["burger", "sushi"], ["burger"])
+
+
+def test_check_answers_numpy():
+    """
+    NumPy string arrays take the vectorized path and give a boolean array.
+    """
+    np = pytest.importorskip("numpy")
+    corrects = np.array(["burger", "Burger", "jurassic park", "burger"])
+    guesses = np.array(["bur", " BURGER ", "park", ""])
+    actual = check_answers(corrects, guesses)
+    assert actual.dtype == bool, "Expected a boolean array"
+    assert actual.tolist() == [True, True, False, True]
+    assert check_answers(corrects, guesses, allow_partial=False).tolist() == [False, True, False, False]
+
+    # non-ASCII strings go through the same normalization as check_answer()
+    corrects = np.array(["Crème Brûlée", "ŞEHİR", "café"])
+    guesses = np.array([" CRÈME", "şehi̇r", "CAFÉ "])
+    expected = [check_answer(c, g) for c, g in zip(corrects.tolist(), guesses.tolist())]
+    assert check_answers(corrects, guesses).tolist() == expected
+
+
+def test_check_answers_numpy_strided():
+    """
+    Non-contiguous arrays (slices, transposes) grade like their copies.
+    """
+    np = pytest.importorskip("numpy")
+    corrects = np.array(["burger", "x", "Sushi", "x", "pizza", "x"])
+    guesses = np.array(["BUR", "y", " sushi", "y", "taco", "y"])
+    assert check_answers(corrects[::2], guesses[::2]).tolist() == [True, True, False]
+
+    grid_c = np.array([["burger", "sushi"], ["pizza", "taco"]])
+    grid_g = np.array([["Burger", "Piz"], ["SUSH", "t"]])
+    actual = check_answers(grid_c.T, grid_g)
+    assert actual.tolist() == [[True, True], [True, True]]
+    assert check_answers(grid_c.T, grid_g.T).tolist() == [[True, False], [False, True]]
+
+
+def test_check_answer_typos():
+    """
+    With allow_typos, guesses a few edits away from the answer still count,
+    and a swapped pair of letters is a single typo.
+    """
+    assert check_answer("croissant", "croisant") == False, "Typos are off by default"
+    assert check_answer("croissant", "croisant", allow_typos=1) == True, "One missing letter is one typo"
+    assert check_answer("penguin", "pengiun", allow_typos=1) == True, "A swapped pair is one typo"
+    assert check_answer("penguin", "pingiun", allow_typos=1) == False, "Two typos are more than allowed"
+    assert check_answer("penguin", "pingiun", allow_typos=2) == True, "Two typos are fine when allowed"
+    assert check_answer("Penguin", " PENGUINN ", allow_partial=False, allow_typos=1) == True, "Normalization still applies"
+    assert check_answer("Penguin", "pengiun", case_sensitive=True, allow_typos=1) == False, "Case counts as an edit when case-sensitive"
+
+
+def test_check_answer_typos_partial():
+    """
+    In partial mode a typo-tolerant guess has to be close to some prefix of the
+    answer, but a guess no longer than the typo budget can't lean on typos.
+    """
+    assert check_answer("jurassic park", "jurasic", allow_typos=1) == True, "Close to the prefix 'jurassic'"
+    assert check_answer("jurassic park", "jurasic", allow_partial=False, allow_typos=1) == False, "Too far from the full answer"
+    assert check_answer("burger", "x", allow_typos=1) == False, "One letter can't be forgiven one typo"
+    assert check_answer("burger", "xu", allow_typos=1) == True, "'xu' is one typo from the prefix 'bu'"
+
+
+def test_check_answers_typos():
+    """
+    Bulk grading accepts the same typo budget and agrees with check_answer().
+    """
+    corrects = ["croissant", "penguin", "penguin", "jurassic park", "burger", "burger"]
+    guesses = ["croisant", "pengiun", "pingiun", "jurasic", "x", "BURGRE"]
+    for allow_partial in (False, True):
+        expected = [check_answer(c, g, allow_partial=allow_partial, allow_typos=1) for c, g in zip(corrects, guesses)]
+        assert check_answers(corrects, guesses, allow_partial=allow_partial, allow_typos=1) == expected
+
+
+def test_check_answer_unicode_normalization():
+    """
+    Case-insensitive checks use Unicode case folding and NFKC, so "ß" matches
+    "SS" and full-width letters match their plain forms.
+    """
+    assert check_answer("straße", "STRASSE", allow_partial=False) == True, "Expected case folding to expand ß"
+    assert check_answer("pizza", "ｐｉｚｚａ", allow_partial=False) == True, "Expected NFKC to fold full-width letters"
+    assert check_answer("café", "cafe\u0301", allow_partial=False) == True, "Expected composed and decomposed accents to match"
+    assert check_answer("straße", "STRASSE", case_sensitive=True) == False, "Case-sensitive checks compare raw text"
+
+
+def test_quiz_item_reads_like_a_dict():
+    """
+    QuizItem stores a bank position, but code written against the old dicts
+    (item["clue"], .get(), .keys(), comparing with a dict) keeps working.
+    """
+    batch = make_quiz_items(1, theme="movies", seed=3)
+    item = batch[0]
+    assert isinstance(item, QuizItem), "Expected batches to hand out QuizItems"
+
+    clue, answer = _bank_index().items[batch.indices[0]]
+    expected = {"clue": clue, "answer": answer, "theme": "movies"}
+    assert item == expected, "Expected a QuizItem to compare equal to the equivalent dict"
+    assert expected == item, "Expected equality to work from the dict side too"
+    assert item["clue"] == clue and item["answer"] == answer and item["theme"] == "movies"
+    assert item.get("missing", "default") == "default"
+    assert dict(item) == expected == item.to_dict()
+    with pytest.raises(KeyError):
+        item["missing"]
+    with pytest.raises(AttributeError):
+        item.extra = 1
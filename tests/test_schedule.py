@@ -0,0 +1,120 @@
+import random
+from emojiguessr import data
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.quiz import make_quiz_item
+from emojiguessr.schedule import Deck, AdaptiveScheduler, ItemStats, _WeightTree
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.session import QuizSession
+
+
+def drawn_items(deck, n):
+  items = data._bank_index().items
+  return [items[deck.draw()] for _ in range(n)]
+
+
+def test_deck_has_no_repeats_until_exhausted():
+  deck = Deck("animals", rng=random.Random(1))
+  size = len(_EMOJI_BANK["animals"])
+  first = drawn_items(deck, size)
+  assert sorted(first) == sorted(_EMOJI_BANK["animals"])
+  assert len(deck) == 0
+
+  second = drawn_items(deck, size)
+  assert sorted(second) == sorted(_EMOJI_BANK["animals"])
+  assert len(deck) == 0
+
+
+def test_deck_memory_grows_with_draws_not_bank():
+  original = dict(_EMOJI_BANK)
+  try:
+    data.register_theme("huge", [(f"e{i}", f"answer {i}") for i in range(100_000)])
+    deck = Deck("huge", rng=random.Random(2))
+    picks = [deck.draw() for _ in range(50)]
+    assert len(set(picks)) == 50
+    assert len(deck._swaps) <= 50
+  finally:
+    _EMOJI_BANK.clear()
+    _EMOJI_BANK.update(original)
+    data.invalidate_index()
+
+
+def test_deck_unknown_theme_falls_back_to_food():
+  deck = Deck("invalid", rng=random.Random(3))
+  assert sorted(drawn_items(deck, len(_EMOJI_BANK["food"]))) == sorted(_EMOJI_BANK["food"])
+
+
+def test_make_quiz_item_with_strategy():
+  deck = Deck("movies", rng=random.Random(4))
+  item = make_quiz_item("movies", strategy=deck)
+  assert (item["clue"], item["answer"]) in _EMOJI_BANK["movies"]
+  assert item["theme"] == "movies"
+
+
+def test_session_uses_a_deck_by_default():
+  size = len(_EMOJI_BANK["dev"])
+  session = QuizSession(size, "dev", False, True, 1)
+  assert isinstance(session.strategy, Deck)
+  session.start()
+  seen = []
+  while not session.done:
+    seen.append(session.item["answer"])
+    session.answer("")
+  assert sorted(seen) == sorted(answer for (_, answer) in _EMOJI_BANK["dev"])
+
+
+def test_weight_tree_matches_linear_scan():
+  rng = random.Random(5)
+  weights = [rng.random() for _ in range(37)]
+  tree = _WeightTree(weights)
+  for _ in range(20):
+    tree.set(rng.randrange(37), rng.random())
+  assert abs(tree.total() - sum(tree.weights)) < 1e-9
+  for _ in range(200):
+    target = rng.random() * tree.total()
+    running = 0.0
+    for expected, w in enumerate(tree.weights):
+      running += w
+      if running > target:
+        break
+    assert tree.find(target) == expected
+
+
+def test_adaptive_never_repeats_back_to_back():
+  scheduler = AdaptiveScheduler("food", rng=random.Random(6))
+  picks = [scheduler.draw() for _ in range(200)]
+  assert all(a != b for a, b in zip(picks, picks[1:]))
+
+
+def test_adaptive_favours_missed_items():
+  scheduler = AdaptiveScheduler("animals", rng=random.Random(7))
+  start, stop = data._bank_index().theme_range("animals")
+  hard = start
+  for index in range(start, stop):
+    for _ in range(5):
+      scheduler.record(index, index != hard)
+  assert scheduler.weight(hard) == max(scheduler.weight(i) for i in range(start, stop))
+
+  counts = {}
+  for _ in range(2000):
+    index = scheduler.draw()
+    counts[index] = counts.get(index, 0) + 1
+  assert counts[hard] == max(counts.values())
+
+
+def test_adaptive_stats_are_shared():
+  stats = ItemStats()
+  first = AdaptiveScheduler("dev", stats=stats)
+  start, _ = data._bank_index().theme_range("dev")
+  first.record(start, False)
+  second = AdaptiveScheduler("dev", stats=stats)
+  answer = data._bank_index().items[start][1]
+  assert stats.seen[answer] == 1
+  assert second.weight(start) > second.weight(start + 1)
+
+
+def test_run_quiz_with_strategy():
+  stats = ItemStats()
+  scheduler = AdaptiveScheduler("movies", rng=random.Random(8), stats=stats)
+  run_quiz(4, "movies", False, True, 2, input_fn=lambda _: "nope", output_fn=lambda _: None, strategy=scheduler)
+  assert sum(stats.seen.values()) == 4
+  assert not stats.correct
@@ -1,5 +1,8 @@
 import pytest
-from emojiguessr.score import score
+import random
+import threading
+import time
+from emojiguessr.score import score, Scoreboard
 
 
 def test_score_correct_answer():
@@ -41,3 +44,163 @@ def test_score_default_behavior():
     assert score(0, points=3) == 3, "Should use default correct=True with custom points"
     assert score(10, correct=False) == 10, "Should use default points=1 but ignore it when wrong"
 
+
+def test_scoreboard_top_and_rank():
+    """
+    The scoreboard keeps totals per player, lists the leaders highest first and
+    gives tied players the same rank.
+    """
+    board = Scoreboard()
+    board.record("ana", points=5)
+    board.record("ben", points=3)
+    board.record("cy", points=5)
+    board.record("dee", correct=False)
+
+    assert board.get("ana") == 5
+    assert board.get("dee") == 0, "A wrong answer still puts the player on the board"
+    assert board.top(3) == [("ana", 5), ("cy", 5), ("ben", 3)], "Ties keep the order players reached the score"
+    assert [board.rank(p) for p in ("ana", "cy", "ben", "dee")] == [1, 1, 3, 4]
+
+    board.record("ben", points=10)
+    assert board.top(1) == [("ben", 13)]
+    assert board.rank("ana") == 2
+    assert len(board) == 4
+
+
+def test_scoreboard_matches_sorting():
+    """
+    Ranks and top-K agree with simply sorting everyone, including scores far
+    above the initial size of the index.
+    """
+    rng = random.Random(5)
+    board = Scoreboard()
+    totals = {}
+    for _ in range(3000):
+        player = rng.randrange(200)
+        points = rng.choice([1, 2, 5, 700])
+        board.record(player, points=points)
+        totals[player] = totals.get(player, 0) + points
+
+    ordered = sorted(totals.values(), reverse=True)
+    assert [value for _, value in board.top(50)] == ordered[:50]
+    for player, value in totals.items():
+        assert board.rank(player) == 1 + sum(v > value for v in totals.values())
+
+
+def test_scoreboard_concurrent_updates():
+    """
+    Sessions on different threads can record results at the same time.
+    """
+    board = Scoreboard()
+
+    def play(offset):
+        for i in range(2000):
+            board.record(f"p{(i + offset) % 50}")
+
+    threads = [threading.Thread(target=play, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(board.get(f"p{i}") for i in range(50)) == 16000
+
+
+def test_scoreboard_snapshot_round_trip(tmp_path):
+    """
+    Snapshots can be loaded back into an identical scoreboard, and closing a
+    board with a snapshot interval saves it one last time.
+    """
+    path = tmp_path / "board.json"
+    with Scoreboard(snapshot_path=path, snapshot_interval=60) as board:
+        board.record("ana", points=4)
+        board.record("ben", points=4)
+        board.record("cy", points=1)
+    assert path.exists(), "Expected close() to take a snapshot"
+
+    restored = Scoreboard.load(path)
+    assert restored.top(10) == board.top(10)
+    assert restored.rank("cy") == 3
+
+
+def test_scoreboard_snapshots_in_the_background(tmp_path):
+    """
+    Periodic snapshots are written by a background thread, so an update
+    never waits for the file to be saved.
+    """
+    path = tmp_path / "board.json"
+    board = Scoreboard(snapshot_path=path, snapshot_interval=0.01)
+    try:
+        writing = threading.Event()
+        release = threading.Event()
+        snapshot = board.snapshot
+
+        def slow_snapshot(path=None):
+            writing.set()
+            release.wait(5)
+            snapshot(path)
+
+        board.snapshot = slow_snapshot
+        board.record("ana", points=2)
+        assert writing.wait(5), "Expected a snapshot once the board changed"
+        # the snapshot is stuck writing, and updates go on regardless
+        for _ in range(100):
+            board.record("ben")
+        assert board.top(2) == [("ben", 100), ("ana", 2)]
+        release.set()
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert Scoreboard.load(path).get("ana") == 2
+    finally:
+        release.set()
+        board.close()
+    assert Scoreboard.load(path).top(2) == [("ben", 100), ("ana", 2)]
+
+
+def test_scoreboard_rejects_negative_scores():
+    board = Scoreboard()
+    board.record("ana", points=2)
+    with pytest.raises(ValueError):
+        board.record("ana", points=-5)
+    assert board.get("ana") == 2, "A rejected update leaves the score alone"
+
+
+def test_scoreboard_rejects_bad_scores_without_damage():
+    """
+    Non-integer or out-of-range scores are refused before the board changes.
+    """
+    board = Scoreboard()
+    board.record("ana", points=3)
+    board.record("ben", points=1)
+    with pytest.raises(TypeError):
+        board.record("ana", points=1.5)
+    with pytest.raises(TypeError):
+        board.set_score("ben", "7")
+    with pytest.raises(ValueError):
+        board.set_score("ben", 10**9)
+    assert board.top(10) == [("ana", 3), ("ben", 1)], "A rejected update leaves the board alone"
+    assert (board.rank("ana"), board.rank("ben")) == (1, 2)
+    board.record("ben", points=5)
+    assert board.top(1) == [("ben", 6)]
+
+
+def test_scoreboard_concurrent_snapshots(tmp_path):
+    """
+    Snapshots from many threads never publish a torn file or leave temp files.
+    """
+    path = tmp_path / "board.json"
+    board = Scoreboard(snapshot_path=path, snapshot_interval=0)
+
+    def play(n):
+        for i in range(200):
+            board.record(f"p{n}-{i % 10}")
+
+    threads = [threading.Thread(target=play, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    board.snapshot()
+    board.close()
+    assert Scoreboard.load(path).top(100) == board.top(100)
+    assert [p.name for p in tmp_path.iterdir()] == ["board.json"]
@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from emojiguessr import data
+from emojiguessr.quiz import QUIZ_DEFAULTS
+from emojiguessr.server import handle_player, start_server
+from emojiguessr.loadgen import run_local
+
+
+async def connect(**options):
+  server = await start_server("127.0.0.1", 0, **options)
+  port = server.sockets[0].getsockname()[1]
+  reader, writer = await asyncio.open_connection("127.0.0.1", port)
+  return server, reader, writer
+
+
+async def read_until_prompt(reader):
+  lines = []
+  while True:
+    line = (await reader.readline()).decode("utf-8")
+    if not line or line == "Your guess: \n":
+      return lines
+    lines.append(line.rstrip("\n"))
+
+
+def test_server_plays_a_session():
+  async def scenario():
+    server, reader, writer = await connect(num_questions=1, theme="dev", case_sensitive=False, allow_partial=True, max_attempts=2)
+    async with server:
+      lines = await read_until_prompt(reader)
+      assert lines[1] == "Question 1/1"
+      assert lines[2] == "Theme: dev"
+
+      writer.write("definitely not it\n".encode("utf-8"))
+      assert await read_until_prompt(reader) == ["❌ Wrong! 1 attempts left."]
+      writer.write("nope\n".encode("utf-8"))
+      rest = (await reader.read()).decode("utf-8")
+      writer.close()
+    assert rest.startswith("❌ Nope — it was: ")
+    assert rest.endswith("Final score: 0/1\n")
+
+  asyncio.run(scenario())
+
+
+def test_server_drops_idle_players():
+  async def scenario():
+    server, reader, writer = await connect(idle_timeout=0.05, num_questions=1, theme="food", case_sensitive=False, allow_partial=True, max_attempts=1)
+    async with server:
+      await read_until_prompt(reader)
+      rest = await asyncio.wait_for(reader.read(), 5)
+      writer.close()
+    assert rest == "Idle for too long, bye!\n".encode("utf-8")
+
+  asyncio.run(scenario())
+
+
+def test_server_closes_the_connection_when_a_pack_fails(monkeypatch):
+  def broken():
+    raise RuntimeError("pack exploded")
+  monkeypatch.setitem(data._LAZY_THEMES, "broken", broken)
+
+  class Writer:
+    closed = False
+    def close(self):
+      self.closed = True
+    async def wait_closed(self):
+      pass
+
+  async def scenario():
+    await handle_player(asyncio.StreamReader(), writer, {**QUIZ_DEFAULTS, "theme": "broken"}, 1.0)
+
+  writer = Writer()
+  with pytest.raises(RuntimeError, match="pack exploded"):
+    asyncio.run(scenario())
+  assert writer.closed
+
+
+def test_loadgen_runs_against_local_server():
+  result = asyncio.run(run_local(sessions=30, concurrency=10, seed=1, num_questions=2, theme="food", case_sensitive=False, allow_partial=True, max_attempts=1))
+  assert result["sessions"] == 30
+  assert result["answers"] == 60, "Expected one answer per question with one attempt each"
+  assert result["p99_ms"] >= result["p50_ms"] > 0
@@ -0,0 +1,64 @@
+import pytest
+from emojiguessr.session import QuizSession
+
+
+def scripted_items(*items):
+  items = iter(items)
+  def make_item(theme):
+    clue, answer = next(items)
+    return {"clue": clue, "answer": answer, "theme": theme}
+  return make_item
+
+
+def test_session_walks_through_questions():
+  session = QuizSession(2, "food", False, True, 2, make_item=scripted_items(("🍔", "burger"), ("🍣", "sushi")))
+  assert not session.waiting
+
+  assert session.start() == ["\nQuestion 1/2", "Theme: food", "Emoji: 🍔"]
+  assert session.waiting
+  assert session.answer("pizza") == ["❌ Wrong! 1 attempts left."]
+  assert session.answer("bur") == ["✅ Correct!", "\nQuestion 2/2", "Theme: food", "Emoji: 🍣"]
+  assert session.answer("x") == ["❌ Wrong! 1 attempts left."]
+  assert session.answer("y") == ["❌ Nope — it was: sushi", "\nFinal score: 1/2"]
+  assert session.done
+  assert session.score == 1
+
+
+def test_sessions_are_independent():
+  first = QuizSession(1, "food", False, True, 1, make_item=scripted_items(("🍔", "burger")))
+  second = QuizSession(1, "food", False, True, 1, make_item=scripted_items(("🍣", "sushi")))
+  first.start()
+  second.start()
+  assert second.answer("sushi")[0] == "✅ Correct!"
+  assert first.answer("sushi")[0] == "❌ Nope — it was: burger"
+  assert (first.score, second.score) == (0, 1)
+
+
+def test_session_without_attempts_skips_questions():
+  session = QuizSession(2, "food", False, True, 0, make_item=scripted_items(("🍔", "burger"), ("🍣", "sushi")))
+  lines = session.start()
+  assert session.done
+  assert lines[-1] == "\nFinal score: 0/2"
+  assert sum(line.startswith("\nQuestion") for line in lines) == 2
+
+
+def test_session_rejects_guesses_when_not_waiting():
+  session = QuizSession(1, "food", False, True, 1, make_item=scripted_items(("🍔", "burger")))
+  with pytest.raises(RuntimeError):
+    session.answer("burger")
+  session.start()
+  session.answer("burger")
+  with pytest.raises(RuntimeError):
+    session.answer("burger")
+  with pytest.raises(RuntimeError):
+    session.start()
+
+
+def test_timeout_counts_as_a_miss():
+  session = QuizSession(1, "food", False, True, 2, make_item=scripted_items(("🍔", "burger")))
+  with pytest.raises(RuntimeError):
+    session.timeout()
+  session.start()
+  session.answer("pizza")
+  assert session.timeout() == ["⏰ Time's up — it was: burger", "\nFinal score: 0/1"]
+  assert session.done
@@ -0,0 +1,75 @@
+from emojiguessr import data
+from emojiguessr.data import _EMOJI_BANK
+from emojiguessr.simulate import Bot, simulate, merge_stats
+import random
+
+
+def test_same_seed_same_report():
+  a = simulate(200, workers=1, seed=7, shards=4)
+  b = simulate(200, workers=1, seed=7, shards=4)
+  assert a["items"] == b["items"]
+  assert a["correct"] == b["correct"]
+
+
+def test_counts_add_up():
+  report = simulate(300, workers=1, seed=1, shards=3, quiz=dict(num_questions=4, theme="animals"))
+  assert report["sessions"] == 300
+  assert report["questions"] == 1200
+  assert sum(item["shown"] for item in report["items"]) == 1200
+  assert sum(item["correct"] for item in report["items"]) == report["correct"]
+  answers = {answer for (_, answer) in _EMOJI_BANK["animals"]}
+  assert {item["answer"] for item in report["items"]} <= answers
+
+
+def test_perfect_bots_always_right():
+  report = simulate(100, workers=1, bot=dict(accuracy=1.0, typo_rate=0.0, partial_rate=0.0))
+  assert report["accuracy"] == 1.0
+
+
+def test_partial_answers_need_allow_partial():
+  bot = dict(accuracy=1.0, typo_rate=0.0, partial_rate=1.0)
+  lenient = simulate(100, workers=1, bot=bot, quiz=dict(allow_partial=True))
+  strict = simulate(100, workers=1, bot=bot, quiz=dict(allow_partial=False))
+  assert lenient["accuracy"] == 1.0
+  assert strict["accuracy"] < 1.0
+
+
+def test_bot_typos_change_the_answer():
+  bot = Bot(random.Random(3), accuracy=1.0, typo_rate=1.0, partial_rate=0.0)
+  guesses = [bot.guess("Pizza", ["Sushi"]) for _ in range(50)]
+  assert all(guess != "Pizza" for guess in guesses)
+
+
+def test_process_pool_matches_in_process():
+  pooled = simulate(200, workers=2, seed=3, shards=4)
+  inline = simulate(200, workers=1, seed=3, shards=4)
+  assert pooled["items"] == inline["items"]
+
+
+def test_merge_stats_sums_shards():
+  merged, sessions, correct = merge_stats([
+    ({"Pizza": ["🍕", 2, 1, 3]}, 2, 1),
+    ({"Pizza": ["🍕", 1, 1, 1], "Sushi": ["🍣", 1, 0, 1]}, 1, 1),
+  ])
+  assert merged == {"Pizza": ["🍕", 3, 2, 4], "Sushi": ["🍣", 1, 0, 1]}
+  assert (sessions, correct) == (3, 2)
+
+
+def test_lazy_theme_decoys_come_from_the_theme(monkeypatch):
+  items = [("🐱", "cat"), ("🐶", "dog"), ("🐟", "fish")]
+  original = dict(_EMOJI_BANK)
+  data.register_lazy_theme("pets", lambda: items)
+  seen = set()
+  def guess(self, answer, decoys):
+    seen.update(decoys)
+    return decoys[0]
+  monkeypatch.setattr(Bot, "guess", guess)
+  try:
+    report = simulate(20, workers=1, seed=3, shards=2, quiz=dict(theme="pets"))
+  finally:
+    _EMOJI_BANK.clear()
+    _EMOJI_BANK.update(original)
+    data._LAZY_THEMES.pop("pets", None)
+    data.invalidate_index()
+  assert seen == {"cat", "dog", "fish"}
+  assert {item["answer"] for item in report["items"]} <= seen
@@ -0,0 +1,142 @@
+import json
+import pytest
+from emojiguessr import data, packs, stats
+from emojiguessr.__main__ import run_quiz
+from emojiguessr.eventlog import EventLog
+
+
+def write_log(path, records):
+  with EventLog(path) as log:
+    for record in records:
+      log.append(*record)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+  hard, easy = 0, 1
+  path = tmp_path / "answers.egl"
+  write_log(path, [
+    # hard: asked twice, one partial correct on the 2nd attempt, one miss
+    (1, "movies", hard, "x", False, 1, 1000),
+    (1, "movies", hard, "lor", True, 2, 3000, True),
+    (2, "movies", hard, "y", False, 1, 2000),
+    # easy: asked twice, right first time both times
+    (1, "movies", easy, "full answer", True, 1, 500),
+    (2, "movies", easy, "full answer", True, 1, 1500),
+    # unknown item, theme, or position: counted but not reported
+    (3, None, None, "", False, 1, 10, False, True),
+    (3, "no such theme", 0, "", False, 1, 10),
+    (3, "movies", 100_000, "", False, 1, 10),
+  ])
+  return path, hard, easy
+
+
+def check_report(result, hard, easy):
+  items = {item["index"]: item for item in result["items"]}
+  assert result["items"][0]["index"] == hard
+  assert items[hard]["questions"] == 2
+  assert items[hard]["accuracy"] == 0.5
+  assert items[hard]["mean_attempts"] == 1.5
+  assert items[hard]["partial_rate"] == 1.0
+  assert items[hard]["mean_latency_ms"] == 2.0
+  assert items[easy]["accuracy"] == 1.0
+  assert items[easy]["mean_attempts"] == 1.0
+  movies = next(t for t in result["themes"] if t["theme"] == "movies")
+  assert (movies["questions"], movies["correct"], movies["answers"]) == (4, 3, 5)
+  assert (result["answers"], result["unknown"]) == (8, 3)
+
+
+def test_report_without_numpy(log_path):
+  path, hard, easy = log_path
+  check_report(stats.report(stats.load_columns(path, use_numpy=False)), hard, easy)
+
+
+def test_report_with_numpy(log_path):
+  pytest.importorskip("numpy")
+  path, hard, easy = log_path
+  check_report(stats.report(stats.load_columns(path, use_numpy=True)), hard, easy)
+
+
+def test_cache_only_parses_new_records(log_path):
+  path, hard, _ = log_path
+  assert stats.update_cache(path)[1] == 8
+  write_log(path, [(4, "movies", hard, "z", False, 1, 100)])
+
+  parsed = []
+  original = stats.EventLogReader._records
+  def counting(self, *args):
+    for record in original(self, *args):
+      parsed.append(record)
+      yield record
+  stats.EventLogReader._records = counting
+  try:
+    assert stats.update_cache(path)[1] == 9
+  finally:
+    stats.EventLogReader._records = original
+  assert len(parsed) == 1
+
+  columns = stats.load_columns(path, use_numpy=False)
+  assert len(columns) == 9
+  assert columns.index[-1] == hard
+
+
+def test_cache_rebuilt_for_replaced_log(tmp_path):
+  path = tmp_path / "answers.egl"
+  write_log(path, [(1, "food", 0, "pizza", True, 1, 1)] * 5)
+  assert stats.update_cache(path)[1] == 5
+  path.unlink()
+  write_log(path, [(1, "food", 0, "pizza", True, 1, 1)])
+  assert stats.update_cache(path)[1] == 1
+
+
+def test_main_json(log_path, capsys):
+  path, hard, _ = log_path
+  stats.main([str(path), "--json", "--theme", "movies", "--no-numpy"])
+  result = json.loads(capsys.readouterr().out)
+  assert result["items"][0]["index"] == hard
+  assert all(item["theme"] == "movies" for item in result["items"])
+
+
+def test_main_text(log_path, capsys):
+  path, _, _ = log_path
+  stats.main([str(path)])
+  out = capsys.readouterr().out
+  assert "8 answers" in out
+  assert "3 of them for themes or items not registered here" in out
+  assert "movies" in out
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_pack_themes_are_loaded_and_matched_by_name(tmp_path, use_numpy):
+  if use_numpy:
+    pytest.importorskip("numpy")
+  original = dict(data._EMOJI_BANK)
+  def reset():
+    data._EMOJI_BANK.clear()
+    data._EMOJI_BANK.update(original)
+    data._LAZY_THEMES.clear()
+    data.invalidate_index()
+
+  pets = tmp_path / "pets.csv"
+  pets.write_text("emoji,answer\n🐱,Cat\n🐶,Dog\n🐟,Fish\n", encoding="utf-8")
+  birds = tmp_path / "birds.csv"
+  birds.write_text("emoji,answer\n🦜,Parrot\n🦉,Owl\n", encoding="utf-8")
+  path = tmp_path / "answers.egl"
+  try:
+    # the game process only ever loads pets
+    packs.register_pack(pets, cache_dir=tmp_path / "cache")
+    with EventLog(path) as log:
+      run_quiz(3, "pets", False, True, 1, input_fn=lambda _: "zzz", output_fn=lambda _: None, rng=1, log=log)
+
+    # the stats process loads birds first, so pets lands elsewhere in its bank
+    reset()
+    packs.register_pack(birds, cache_dir=tmp_path / "cache")
+    data.get_theme_item("birds")
+    packs.register_pack(pets, cache_dir=tmp_path / "cache")
+    result = stats.report(stats.load_columns(path, use_numpy=use_numpy))
+  finally:
+    reset()
+
+  assert result["unknown"] == 0
+  assert [(t["theme"], t["questions"], t["accuracy"]) for t in result["themes"]] == [("pets", 3, 0.0)]
+  assert sorted((item["index"], item["answer"]) for item in result["items"]) == [(0, "Cat"), (1, "Dog"), (2, "Fish")]
@@ -0,0 +1,28 @@
+import pytest
+from emojiguessr.text import normalize, normalize_cache_info, clear_normalize_cache
+from emojiguessr.data import _bank_index
+
+
+def test_normalize():
+  assert normalize("  Pizza ") == "pizza"
+  assert normalize("STRASSE") == normalize("Straße")
+  assert normalize("ｆｒｏｚｅｎ") == "frozen"
+
+
+def test_normalize_cache_stats():
+  clear_normalize_cache()
+  normalize("Crème")
+  normalize("Crème")
+  normalize("crème")
+  normalize("pizza")
+  info = normalize_cache_info()
+  assert info.hits == 1, "Expected the repeated guess to be served from the cache"
+  assert info.misses == 2, "Expected ASCII text to skip the cache entirely"
+  assert info.currsize == 2
+  assert info.maxsize is not None, "Expected the cache to be bounded"
+
+
+def test_bank_answers_are_prenormalized():
+  bank = _bank_index()
+  assert len(bank.answers_n) == len(bank.items)
+  assert all(answer_n == normalize(answer) for (_, answer), answer_n in zip(bank.items, bank.answers_n))
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+from emojiguessr.timed import play_in_terminal, run_quiz_async
+
+
+class FakeClock:
+  # virtual time: scripted inputs "take" their think time instantly
+  def __init__(self):
+    self.time = 0.0
+    self.pending = 0.0
+
+  def now(self):
+    return self.time
+
+  async def sleep(self, seconds):
+    self.pending = seconds
+
+  async def wait_for(self, awaitable, timeout):
+    guess = await awaitable
+    if self.pending > timeout:
+      self.time += timeout
+      raise asyncio.TimeoutError
+    self.time += self.pending
+    return guess
+
+
+def scripted_input(clock, *script):
+  script = iter(script)
+  async def input_fn(prompt):
+    seconds, guess = next(script)
+    await clock.sleep(seconds)
+    return guess
+  return input_fn
+
+
+def scripted_items(*items):
+  items = iter(items)
+  def make_item(theme):
+    clue, answer = next(items)
+    return {"clue": clue, "answer": answer, "theme": theme}
+  return make_item
+
+
+def play(*script, max_attempts=1, time_limit=10):
+  clock = FakeClock()
+  outputs = []
+  final = asyncio.run(run_quiz_async(
+    2, "food", False, True, max_attempts,
+    input_fn=scripted_input(clock, *script),
+    output_fn=outputs.append,
+    time_limit=time_limit,
+    clock=clock,
+    make_item=scripted_items(("🍔", "burger"), ("🍣", "sushi")),
+  ))
+  return final, outputs, clock
+
+
+def test_answers_within_the_deadline():
+  final, outputs, clock = play((3, "burger"), (9.5, "sushi"))
+  assert final == 2
+  assert outputs.count("✅ Correct!") == 2
+  assert clock.time == 12.5
+
+
+def test_timeout_scores_a_miss():
+  final, outputs, clock = play((11, "burger"), (1, "sushi"))
+  assert final == 1
+  assert "⏰ Time's up — it was: burger" in outputs
+  assert outputs[-1] == "\nFinal score: 1/2"
+  assert clock.time == 11
+
+
+def test_deadline_covers_all_attempts():
+  final, outputs, _ = play((4, "pizza"), (4, "taco"), (4, "burger"), (1, "sushi"), max_attempts=3)
+  assert "❌ Wrong! 2 attempts left." in outputs
+  assert "❌ Wrong! 1 attempts left." in outputs
+  assert "⏰ Time's up — it was: burger" in outputs
+  assert final == 1
+
+
+def test_no_time_limit():
+  final, outputs, _ = play((1000, "burger"), (1000, "sushi"), time_limit=None)
+  assert final == 2
+
+
+def test_real_loop_timeouts():
+  outputs = []
+
+  async def never_answers(prompt):
+    await asyncio.sleep(3600)
+
+  async def many():
+    return await asyncio.gather(*(
+      run_quiz_async(2, "food", False, True, 1, input_fn=never_answers, output_fn=outputs.append, time_limit=0.01)
+      for _ in range(200)
+    ))
+
+  assert asyncio.run(many()) == [0] * 200
+  assert sum(line.startswith("⏰") for line in outputs) == 400
+
+
+def test_play_in_terminal_reads_stdin_from_a_file(tmp_path, monkeypatch, capsys):
+  answers = tmp_path / "answers.txt"
+  answers.write_text("burger\nsushi\n", encoding="utf-8")
+  with open(answers, encoding="utf-8") as stdin:
+    monkeypatch.setattr(sys, "stdin", stdin)
+    final = asyncio.run(play_in_terminal(
+      5,
+      num_questions=2, theme="food", case_sensitive=False, allow_partial=True, max_attempts=1,
+      output_fn=print,
+      make_item=scripted_items(("🍔", "burger"), ("🍣", "sushi")),
+    ))
+  assert final == 2
+  assert "Final score: 2/2" in capsys.readouterr().out
+
+
+def test_play_in_terminal_leaves_a_pipe_blocking(monkeypatch, capsys):
+  read, write = os.pipe()
+  os.write(write, "burger\nsushi\n".encode("utf-8"))
+  os.close(write)
+  with open(read, encoding="utf-8") as stdin:
+    monkeypatch.setattr(sys, "stdin", stdin)
+    final = asyncio.run(play_in_terminal(
+      5,
+      num_questions=2, theme="food", case_sensitive=False, allow_partial=True, max_attempts=1,
+      output_fn=print,
+      make_item=scripted_items(("🍔", "burger"), ("🍣", "sushi")),
+    ))
+    assert os.get_blocking(read)
+    assert not stdin.closed
+  assert final == 2